@@ -0,0 +1,4 @@
+"""Micro-benchmarks for ScreenPy's hot paths.
+
+Run any of these modules directly, e.g. ``python -m benchmarks.bench_beat``.
+"""
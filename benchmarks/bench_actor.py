@@ -0,0 +1,45 @@
+"""Measure how long an Actor takes to find their Abilities."""
+
+from __future__ import annotations
+
+import timeit
+from functools import partial
+
+from screenpy import Actor
+
+NUMBER = 100_000
+REPEAT = 5
+ABILITY_COUNTS = (1, 12, 50)
+
+
+def make_ability_class(number: int) -> type:
+    """Make a distinct Ability class."""
+
+    def forget(_: object) -> None:
+        """Forget nothing."""
+
+    return type(f"Ability{number}", (), {"forget": forget})
+
+
+def main() -> None:
+    """Time looking up the last Ability and a missing Ability."""
+    for count in ABILITY_COUNTS:
+        ability_classes = [make_ability_class(i) for i in range(count)]
+        missing_ability = make_ability_class(count)
+        actor = Actor("Benchmarker").who_can(*(cls() for cls in ability_classes))
+        last_ability = ability_classes[-1]
+
+        for name, stmt in (
+            ("uses_ability_to", partial(actor.uses_ability_to, last_ability)),
+            (
+                "has_ability_to (missing)",
+                partial(actor.has_ability_to, missing_ability),
+            ),
+        ):
+            seconds = min(timeit.repeat(stmt, number=NUMBER, repeat=REPEAT))
+            label = f"{name} ({count} abilities)"
+            print(f"{label:>40}: {seconds / NUMBER * 1e6:.3f} µs/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Measure the overhead ``beat`` adds to each call of a decorated method."""
+
+from __future__ import annotations
+
+import timeit
+
+from screenpy import Actor, beat, the_narrator
+
+NUMBER = 100_000
+REPEAT = 5
+
+
+class Prop:
+    """A Performable with a couple of markers in its beat line."""
+
+    def __init__(self) -> None:
+        self.weapon = "candlestick"
+        self.room = "hall"
+
+    @beat("{} uses the {weapon} in the {room}.")
+    def perform_as(self, _: Actor) -> None:
+        """Do nothing, so only the beat's overhead is measured."""
+
+    @beat("Nothing to format here.")
+    def plain(self, _: Actor) -> None:
+        """Do nothing, with a line that has no markers."""
+
+
+def main() -> None:
+    """Time the beats with the narrator on and off the air."""
+    prop = Prop()
+    actor = Actor("Benchmarker")
+    old_adapters = the_narrator.adapters
+    the_narrator.adapters = []
+    try:
+        for name, stmt in (
+            ("beat with markers", lambda: prop.perform_as(actor)),
+            ("beat without markers", lambda: prop.plain(actor)),
+        ):
+            seconds = min(timeit.repeat(stmt, number=NUMBER, repeat=REPEAT))
+            print(f"{name:>30}: {seconds / NUMBER * 1e6:.2f} µs/call")
+            with the_narrator.off_the_air():
+                seconds = min(timeit.repeat(stmt, number=NUMBER, repeat=REPEAT))
+            print(f"{name + ' (off air)':>30}: {seconds / NUMBER * 1e6:.2f} µs/call")
+    finally:
+        the_narrator.adapters = old_adapters
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Measure how long ``get_additive_description`` takes for each kind of thing."""
+
+from __future__ import annotations
+
+import timeit
+from functools import partial
+from typing import TYPE_CHECKING
+
+from screenpy import IsEqualTo, See
+from screenpy.speech_tools import get_additive_description
+
+if TYPE_CHECKING:
+    from screenpy import Actor
+
+NUMBER = 100_000
+REPEAT = 5
+
+
+class BakeTheCake:
+    """A Performable which describes itself."""
+
+    def perform_as(self, _: Actor) -> None:
+        """Do nothing, only the description is measured."""
+
+    def describe(self) -> str:
+        """Describe the Action in present tense."""
+        return "Bake the cake."
+
+
+class NumberOfCandles:
+    """A Question which does not describe itself."""
+
+    def answered_by(self, _: Actor) -> int:
+        """Count nothing, only the description is measured."""
+        return 0
+
+
+def main() -> None:
+    """Time the descriptions of a Describable, an -able, a value, and a See."""
+    see = See.the(NumberOfCandles(), IsEqualTo(8))
+    for name, describable in (
+        ("describable", BakeTheCake()),
+        ("question without describe", NumberOfCandles()),
+        ("value", [1, 2, 3]),
+        ("see", see),
+    ):
+        stmt = partial(get_additive_description, describable)
+        seconds = min(timeit.repeat(stmt, number=NUMBER, repeat=REPEAT))
+        print(f"{name:>30}: {seconds / NUMBER * 1e6:.2f} µs/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Measure how long the Narrator takes to flush a kinked cable."""
+
+from __future__ import annotations
+
+import logging
+import timeit
+from typing import TYPE_CHECKING
+
+from screenpy import Narrator, StdOutAdapter, StdOutManager
+
+if TYPE_CHECKING:
+    from screenpy import Adapter
+
+NARRATIONS = 10_000
+ADAPTER_COUNT = 3
+NESTING = 5
+REPEAT = 5
+
+
+def dummy() -> None:
+    """Stand in for a narrated function."""
+
+
+def fill_and_flush(narrator: Narrator) -> None:
+    """Back up NARRATIONS narrations, nested NESTING deep, then flush them."""
+    with narrator.mic_cable_kinked():
+        for _ in range(NARRATIONS // NESTING):
+            with narrator.stating_a_beat(dummy, "beat 1"):  # noqa: SIM117
+                with narrator.stating_a_beat(dummy, "beat 2"):
+                    with narrator.stating_a_beat(dummy, "beat 3"):
+                        with narrator.stating_a_beat(dummy, "beat 4"):
+                            narrator.whispering_an_aside("aside")
+
+
+def main() -> None:
+    """Time backing up and flushing the narrations."""
+    logger = logging.getLogger("screenpy.benchmark")
+    logger.disabled = True
+    adapters: list[Adapter] = [
+        StdOutAdapter(StdOutManager(logger)) for _ in range(ADAPTER_COUNT)
+    ]
+    narrator = Narrator(adapters=adapters)
+
+    seconds = min(
+        timeit.repeat(lambda: fill_and_flush(narrator), number=1, repeat=REPEAT)
+    )
+    print(
+        f"{NARRATIONS} narrations, {ADAPTER_COUNT} adapters:"
+        f" {seconds * 1e3:.1f} ms per flush"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Measure the protocol checks done while seeing, and a tight ``See`` loop."""
+
+from __future__ import annotations
+
+import timeit
+from functools import partial
+
+from screenpy import Actor, Answerable, ErrorKeeper, IsEqualTo, See, the_narrator
+from screenpy.protocols import conforms_to
+
+NUMBER = 100_000
+REPEAT = 5
+
+
+class NumberOfCandles:
+    """A Question which does not describe itself."""
+
+    def answered_by(self, _: Actor) -> int:
+        """Count the candles, which there are always 8 of."""
+        return 8
+
+
+def main() -> None:
+    """Time ``isinstance`` against ``conforms_to``, then many Sees."""
+    candles = NumberOfCandles()
+    for name, stmt in (
+        ("isinstance Answerable", partial(isinstance, candles, Answerable)),
+        ("conforms_to Answerable", partial(conforms_to, candles, Answerable)),
+        ("isinstance ErrorKeeper", partial(isinstance, candles, ErrorKeeper)),
+        ("conforms_to ErrorKeeper", partial(conforms_to, candles, ErrorKeeper)),
+    ):
+        seconds = min(timeit.repeat(stmt, number=NUMBER, repeat=REPEAT))
+        print(f"{name:>30}: {seconds / NUMBER * 1e6:.2f} µs/call")
+
+    actor = Actor("Benchmarker")
+    see = See(candles, IsEqualTo(8))
+    old_adapters = the_narrator.adapters
+    the_narrator.adapters = []
+    try:
+        with the_narrator.off_the_air():
+            seconds = min(
+                timeit.repeat(partial(actor.should, see), number=NUMBER, repeat=REPEAT)
+            )
+        print(f"{'see (off air)':>30}: {seconds / NUMBER * 1e6:.2f} µs/call")
+    finally:
+        the_narrator.adapters = old_adapters
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,7 @@ SerenityBDD library for Java.
 from . import actions, narration, resolutions
 from .actions import *  # noqa: F403
 from .actor import Actor
+from .answer_cache import AnswerCache
 from .configuration import settings
 from .directions import noted, noted_under, the_noted
 from .director import Director
@@ -34,6 +35,7 @@ from .exceptions import (
     NotResolvable,
     QuestionError,
     ScreenPyError,
+    SoftAssertionError,
     UnableToAct,
     UnableToAnswer,
     UnableToDirect,
@@ -43,14 +45,20 @@ from .exceptions import (
 from .given_when_then import and_, given, given_that, then, when
 from .narration import *  # noqa: F403
 from .pacing import act, aside, beat, scene, the_narrator
+from .polling import Capped, Constant, DecorrelatedJitter, Exponential, Fibonacci
 from .protocols import (
     Adapter,
     Answerable,
+    AsyncAnswerable,
+    AsyncPerformable,
+    BatchAnswerable,
     Describable,
     ErrorKeeper,
     Forgettable,
     Performable,
+    PollingSchedule,
     Resolvable,
+    RetryCollector,
 )
 from .resolutions import *  # noqa: F403
 
@@ -66,13 +74,22 @@ __all__ = [
     "Adapter",
     "AnActor",
     "and_",
+    "AnswerCache",
     "Answerable",
     "aside",
+    "AsyncAnswerable",
+    "AsyncPerformable",
+    "BatchAnswerable",
     "beat",
+    "Capped",
+    "Constant",
+    "DecorrelatedJitter",
     "DeliveryError",
     "Describable",
     "Director",
     "ErrorKeeper",
+    "Exponential",
+    "Fibonacci",
     "Forgettable",
     "given",
     "given_that",
@@ -82,11 +99,14 @@ __all__ = [
     "NotPerformable",
     "NotResolvable",
     "Performable",
+    "PollingSchedule",
     "QuestionError",
     "Resolvable",
+    "RetryCollector",
     "scene",
     "ScreenPyError",
     "settings",
+    "SoftAssertionError",
     "the_narrator",
     "the_noted",
     "then",
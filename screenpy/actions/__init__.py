@@ -11,6 +11,7 @@ from .see import See
 from .see_all_of import SeeAllOf
 from .see_any_of import SeeAnyOf
 from .silently import Silently
+from .softly import Softly
 
 # Natural-language-enabling syntactic sugar
 AttachFile = AttachAFile = AttachTheFile
@@ -79,6 +80,7 @@ __all__ = [
     "Silently",
     "Sleep",
     "Sleeps",
+    "Softly",
     "TakeNote",
     "TakesNote",
     "Tries",
@@ -11,6 +11,8 @@ from screenpy.configuration import settings
 from screenpy.pacing import the_narrator
 from screenpy.speech_tools import get_additive_description
 
+from .softly import firmly
+
 if TYPE_CHECKING:
     from typing_extensions import Self
 
@@ -52,7 +54,7 @@ class Either:
         # avoids explaning what the actor tries to do.
         # logs the first attempt only if it succeeds
         # or if UNABRIDGED_NARRATION is enabled
-        with the_narrator.mic_cable_kinked():
+        with the_narrator.mic_cable_kinked(), firmly():
             try:
                 the_actor.will(*self.try_performables)
             except self.ignore_exceptions:
@@ -64,6 +66,19 @@ class Either:
         the_actor.will(*self.except_performables)
         return
 
+    async def perform_as_async(self, the_actor: Actor) -> None:
+        """Direct the Actor to perform one of two performances, awaiting them."""
+        with the_narrator.mic_cable_kinked(), firmly():
+            try:
+                await the_actor.attempts_to_async(*self.try_performables)
+            except self.ignore_exceptions:
+                if not settings.UNABRIDGED_NARRATION:
+                    the_narrator.clear_backup()
+            else:
+                return
+
+        await the_actor.attempts_to_async(*self.except_performables)
+
     def or_(self, *except_performables: Performable) -> Self:
         """Provide the alternative routine to perform.
 
@@ -2,18 +2,58 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 import time
-from traceback import format_tb
-from typing import TYPE_CHECKING
+from contextlib import suppress
+from time import perf_counter
+from typing import TYPE_CHECKING, NamedTuple, Tuple, Union
 
+from screenpy.answer_cache import forget_answers
 from screenpy.configuration import settings
+from screenpy.deadline import called_off, within
 from screenpy.exceptions import DeliveryError, UnableToAct
 from screenpy.pacing import beat, the_narrator
+from screenpy.polling import schedule_named
 from screenpy.speech_tools import get_additive_description
+from screenpy.telemetry import RetryRecord, the_telemetry
+
+from .softly import firmly
 
 if TYPE_CHECKING:
     from screenpy.actor import Actor
-    from screenpy.protocols import Performable
+    from screenpy.protocols import Performable, PollingSchedule
+
+WakeUpSignal = Union[threading.Event, asyncio.Event]
+Fingerprint = Tuple[type, int, Tuple[Tuple[str, int, str], ...]]
+
+# how many of the failed attempts an Eventually keeps in its timeline.
+TIMELINE_LIMIT = 20
+# how much of each failed attempt's error message is kept.
+MESSAGE_LENGTH = 100
+# how often, in seconds, an asynchronous wait looks at a threading.Event.
+SIGNAL_CHECK_PERIOD = 0.01
+
+
+class FailedAttempt(NamedTuple):
+    """A failed attempt, for the timeline of an Eventually.
+
+    Only the name and the start of the error's message are kept, so a long
+    poll doesn't hold on to every exception (and its frames).
+    """
+
+    started: float
+    error: str
+    message: str
+    waited: float
+
+    @classmethod
+    def of(cls, started: float, exc: BaseException, waited: float) -> FailedAttempt:
+        """Note down the attempt which failed with the exception."""
+        message = str(exc).strip().split("\n", 1)[0]
+        if len(message) > MESSAGE_LENGTH:
+            message = message[: MESSAGE_LENGTH - 3] + "..."
+        return cls(started, exc.__class__.__name__, message, waited)
 
 
 class Eventually:
@@ -23,6 +63,15 @@ class Eventually:
     Actor is not able to complete the given Action or Task within the timeout
     period, a ``DeliveryError`` is raised (from the last caught exception).
 
+    Every performance is reported to the collectors listening to
+    :data:`~screenpy.telemetry.the_telemetry`, succeeded or not.
+
+    The timeout is a budget for everything inside, measured on a monotonic
+    clock. An ``Eventually`` nested inside another one (e.g. in a Task) only
+    gets whatever is left of the outer budget. It also stops trying once it
+    is called off, like when it loses a race in
+    :meth:`~screenpy.actions.SeeAnyOf.racing`. See :mod:`screenpy.deadline`.
+
     Examples::
 
         the_actor.should(
@@ -42,11 +91,28 @@ class Eventually:
             .polling_every(500)
             .milliseconds(),
         )
+
+        the_actor.attempts_to(
+            Eventually(SubmitTheOrder()).polling_with(Capped(Exponential(), at=5))
+        )
+
+        the_actor.should(
+            Eventually(See.the(Number.of(MESSAGES), IsEqualTo(3)))
+            .trying_for(30)
+            .seconds()
+            .waking_on(the_actor.ability_to(ListenToTheQueue).message_arrived),
+        )
     """
 
     performable: Performable
     caught_error: Exception | None
     timeout: float
+    wake_up_signal: WakeUpSignal | None
+    schedule: PollingSchedule
+    timeline: list[FailedAttempt]
+    unrecorded_attempts: int
+    error_kinds: dict[str, None]
+    latencies: list[float]
 
     class _TimeframeBuilder:
         """Build a timeframe, combining numbers and units."""
@@ -117,6 +183,42 @@ class Eventually:
         """Alias for :meth:`~screenpy.actions.Eventually.polling`."""
         return self.polling(amount)
 
+    def polling_with(self, schedule: PollingSchedule) -> Eventually:
+        """Stretch the polling period between attempts using a schedule.
+
+        See :mod:`screenpy.polling` for the available schedules.
+
+        Aliases:
+            * :meth:`~screenpy.actions.Eventually.backing_off_with`
+        """
+        self.schedule = schedule
+        return self
+
+    def backing_off_with(self, schedule: PollingSchedule) -> Eventually:
+        """Alias for :meth:`~screenpy.actions.Eventually.polling_with`."""
+        return self.polling_with(schedule)
+
+    def waking_on(self, signal: WakeUpSignal) -> Eventually:
+        """Retry as soon as the signal is set, instead of waiting out the poll.
+
+        The signal is anything an Ability or Question can set when the state
+        being waited on may have changed. Without a signal, the Actor simply
+        waits for the polling period between attempts. The signal's ``set``
+        method can be handed out as a callback.
+
+        A ``threading.Event`` works for both paths; an ``asyncio.Event`` can
+        only wake up an ``Eventually`` performed asynchronously.
+
+        Aliases:
+            * :meth:`~screenpy.actions.Eventually.woken_by`
+        """
+        self.wake_up_signal = signal
+        return self
+
+    def woken_by(self, signal: WakeUpSignal) -> Eventually:
+        """Alias for :meth:`~screenpy.actions.Eventually.waking_on`."""
+        return self.waking_on(signal)
+
     @property
     def performable_to_log(self) -> str:
         """Represent the Performable in a log-friendly way."""
@@ -129,51 +231,235 @@ class Eventually:
     @beat("{} tries to {performable_to_log}, eventually.")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the actor to just keep trying."""
-        if self.poll > self.timeout:
-            msg = "Poll period must be less than or equal to timeout."
+        self._check_timeframe()
+        if isinstance(self.wake_up_signal, asyncio.Event):
+            msg = "An asyncio.Event can only wake up an asynchronous Eventually."
             raise UnableToAct(msg)
 
-        end_time = time.time() + self.timeout
-
-        count = 0
-        with the_narrator.mic_cable_kinked():
+        with within(self.timeout) as budget, the_narrator.mic_cable_kinked(), firmly():
+            performance = _Performance(self, budget)
             while True:
-                the_narrator.clear_backup()
+                performance.start_attempt()
                 try:
                     the_actor.attempts_to(self.performable)
                 except Exception as exc:  # noqa: BLE001
-                    self.caught_error = exc
-                    if not any(same_exception(exc, c) for c in self.unique_errors):
-                        self.unique_errors.append(exc)
+                    delay = performance.attempt_failed(exc)
+                else:
+                    performance.attempt_succeeded()
+                    return
+
+                self._wait(delay)
+                if performance.is_over():
+                    break
+
+        raise performance.give_up(the_actor) from self.caught_error
+
+    @beat("{} tries to {performable_to_log}, eventually.")
+    async def perform_as_async(self, the_actor: Actor) -> None:
+        """Direct the actor to just keep trying, without blocking the loop."""
+        self._check_timeframe()
+
+        with within(self.timeout) as budget, the_narrator.mic_cable_kinked(), firmly():
+            performance = _Performance(self, budget)
+            while True:
+                performance.start_attempt()
+                try:
+                    await the_actor.attempts_to_async(self.performable)
+                except Exception as exc:  # noqa: BLE001
+                    delay = performance.attempt_failed(exc)
                 else:
+                    performance.attempt_succeeded()
                     return
 
-                count += 1
-                time.sleep(self.poll)
-                if time.time() > end_time:
+                await self._wait_async(delay)
+                if performance.is_over():
                     break
 
+        raise performance.give_up(the_actor) from self.caught_error
+
+    def _check_timeframe(self) -> None:
+        """Make sure the timeframe makes sense before trying."""
+        if self.poll > self.timeout:
+            msg = "Poll period must be less than or equal to timeout."
+            raise UnableToAct(msg)
+
+    def _wait(self, delay: float) -> None:
+        """Wait for the delay, or until the signal wakes us."""
+        signal = self.wake_up_signal
+        if isinstance(signal, threading.Event):
+            if signal.wait(delay):
+                signal.clear()
+        else:
+            time.sleep(delay)
+
+    async def _wait_async(self, delay: float) -> None:
+        """Wait for the delay, or until the signal wakes us."""
+        signal = self.wake_up_signal
+        if isinstance(signal, asyncio.Event):
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(signal.wait(), delay)
+            signal.clear()
+        elif isinstance(signal, threading.Event):
+            # a threading.Event can't wake the loop, so look at it now and then.
+            loop = asyncio.get_running_loop()
+            wake_up_at = loop.time() + delay
+            while not signal.is_set():
+                left = wake_up_at - loop.time()
+                if left <= 0:
+                    return
+                await asyncio.sleep(min(SIGNAL_CHECK_PERIOD, left))
+            signal.clear()
+        else:
+            await asyncio.sleep(delay)
+
+    def _remember(self, exc: Exception) -> None:
+        """Remember the error, and whether we have seen it before."""
+        self.caught_error = exc
+        self.unique_errors.setdefault(fingerprint(exc), exc)
+        self.error_kinds.setdefault(exc.__class__.__name__, None)
+
+    def _record(self, attempt: FailedAttempt) -> None:
+        """Add the failed attempt to the timeline, unless it is full."""
+        if len(self.timeline) < TIMELINE_LIMIT:
+            self.timeline.append(attempt)
+        else:
+            self.unrecorded_attempts += 1
+
+    def _start_timeline(self) -> None:
+        """Forget the attempts of any earlier performance."""
+        self.timeline = []
+        self.unrecorded_attempts = 0
+        self.error_kinds = {}
+        self.latencies = []
+
+    def _collect(self, performance_started: float, *, succeeded: bool) -> None:
+        """Tell the telemetry collectors how this performance went."""
+        if not the_telemetry.collectors:
+            return
+
+        the_telemetry.collect(
+            RetryRecord(
+                description=self.performable_to_log,
+                succeeded=succeeded,
+                attempts=len(self.latencies),
+                elapsed=perf_counter() - performance_started,
+                latencies=tuple(self.latencies),
+                error_kinds=tuple(self.error_kinds),
+            )
+        )
+
+    def _give_up(self, the_actor: Actor, count: int, budget: float) -> DeliveryError:
+        """Explain all the different ways the Actor failed."""
         unique_errors_message = "\n    ".join(
-            f"{e.__class__.__name__}: {e}" for e in self.unique_errors
+            f"{e.__class__.__name__}: {e}" for e in self.unique_errors.values()
+        )
+        timeline_message = "\n    ".join(
+            f"#{number} at {attempt.started:.2f}s:"
+            f" {attempt.error}, then waited {attempt.waited:.2f}s"
+            for number, attempt in enumerate(self.timeline, start=1)
         )
+        if self.unrecorded_attempts:
+            plural = "s" if self.unrecorded_attempts != 1 else ""
+            timeline_message += (
+                f"\n    ... and {self.unrecorded_attempts} more attempt{plural}"
+            )
         msg = (
             f"{the_actor} tried to Eventually {self.performable_to_log} {count} times"
-            f" over {self.timeout} seconds, but got:\n    {unique_errors_message}"
+            f" over {round(budget, 2)} seconds, but got:\n    {unique_errors_message}"
+            f"\nAttempt timeline:\n    {timeline_message}"
         )
-        raise DeliveryError(msg) from self.caught_error
+        return DeliveryError(msg)
 
     def __init__(self, performable: Performable) -> None:
         self.performable = performable
         self.caught_error = None
-        self.unique_errors: list[BaseException] = []
+        self.unique_errors: dict[Fingerprint, BaseException] = {}
         self.timeout = settings.TIMEOUT
         self.poll = settings.POLLING
+        self.wake_up_signal = None
+        self.schedule = schedule_named(settings.POLLING_SCHEDULE, settings.POLLING_CAP)
+        self._start_timeline()
+
+
+class _Performance:
+    """Keep track of one performance of an Eventually, attempt by attempt.
+
+    This is everything both ways of performing share; they only differ in
+    how they attempt the performable and how they wait between attempts.
+    """
+
+    eventually: Eventually
+    budget: float
+    count: int
+    started: float
+    start_time: float
+
+    def start_attempt(self) -> None:
+        """Get ready for the next attempt."""
+        the_narrator.clear_backup()
+        forget_answers()
+        self.attempt_started = perf_counter()
+
+    def attempt_failed(self, exc: Exception) -> float:
+        """Note down the failed attempt.
+
+        Returns:
+            How long to wait before the next attempt.
+        """
+        eventually = self.eventually
+        eventually.latencies.append(perf_counter() - self.attempt_started)
+        eventually._remember(exc)
+        # whatever the attempt took has come out of the budget.
+        remaining = self.budget - (time.monotonic() - self.start_time)
+        waited = min(next(self.delays), max(0.0, remaining))
+        eventually._record(FailedAttempt.of(self.started, exc, waited))
+        self.count += 1
+        return waited
+
+    def attempt_succeeded(self) -> None:
+        """Note down the attempt which finally succeeded."""
+        eventually = self.eventually
+        eventually.latencies.append(perf_counter() - self.attempt_started)
+        eventually._collect(self.performance_started, succeeded=True)
+
+    def is_over(self) -> bool:
+        """Check, after waiting, if there is no time for another attempt."""
+        self.started = time.monotonic() - self.start_time
+        return self.started >= self.budget or called_off()
+
+    def give_up(self, the_actor: Actor) -> DeliveryError:
+        """Give up on the performance, explaining why."""
+        eventually = self.eventually
+        eventually._collect(self.performance_started, succeeded=False)
+        return eventually._give_up(the_actor, self.count, self.budget)
+
+    def __init__(self, eventually: Eventually, budget: float) -> None:
+        self.eventually = eventually
+        self.budget = budget
+        self.delays = eventually.schedule.delays(eventually.poll)
+        eventually._start_timeline()
+        self.count = 0
+        self.started = 0.0
+        self.attempt_started = 0.0
+        self.start_time = time.monotonic()
+        self.performance_started = perf_counter()
+
+
+def fingerprint(exc: BaseException) -> Fingerprint:
+    """Identify an exception by its type, message, and where it was raised.
+
+    This is much cheaper than formatting the traceback, and can be hashed, so
+    many exceptions can be compared quickly.
+    """
+    locations = []
+    traceback = exc.__traceback__
+    while traceback is not None:
+        code = traceback.tb_frame.f_code
+        locations.append((code.co_filename, traceback.tb_lineno, code.co_name))
+        traceback = traceback.tb_next
+    return (type(exc), hash(str(exc)), tuple(locations))
 
 
 def same_exception(exc1: BaseException, exc2: BaseException) -> bool:
     """Compare two exceptions to see if they match."""
-    return (
-        isinstance(exc1, type(exc2))
-        and (str(exc1) == str(exc2))
-        and (format_tb(exc1.__traceback__) == format_tb(exc2.__traceback__))
-    )
+    return fingerprint(exc1) == fingerprint(exc2)
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from screenpy.answer_cache import answer_to
 from screenpy.pacing import aside, beat
-from screenpy.protocols import Answerable
+from screenpy.protocols import Answerable, conforms_to
 from screenpy.speech_tools import get_additive_description, represent_prop
 
 if TYPE_CHECKING:
@@ -28,6 +29,8 @@ class Log:
         the_actor.attempts_to(Log.the(Number.of(SNAKES_ON_THE_PLANE)))
     """
 
+    changes_answers = False
+
     @classmethod
     def the(cls, question: T_Q) -> Self:
         """Supply the Question to answer."""
@@ -41,8 +44,8 @@ class Log:
     @beat("{} examines {question_to_log}.")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the Actor to announce the answer to the Question."""
-        if isinstance(self.question, Answerable):
-            self.question.answered_by(the_actor)
+        if conforms_to(self.question, Answerable):  # type: ignore[type-abstract]
+            answer_to(self.question, the_actor)
         else:
             # must be a value instead of a Question!
             aside(f"the value is: {represent_prop(self.question)}")
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from screenpy.answer_cache import answer_to, answer_to_async
 from screenpy.director import Director
 from screenpy.exceptions import UnableToAct
 from screenpy.pacing import aside, beat
-from screenpy.protocols import Answerable, ErrorKeeper
+from screenpy.protocols import Answerable, AsyncAnswerable, ErrorKeeper, conforms_to
 from screenpy.speech_tools import represent_prop
 
 if TYPE_CHECKING:
@@ -39,6 +40,8 @@ class MakeNote:
     key: str | None
     question: T_Q
 
+    changes_answers = False
+
     @classmethod
     def of(cls, question: T_Q) -> Self:
         """Supply the Question to answer and its arguments.
@@ -70,21 +73,45 @@ class MakeNote:
     @beat("{} jots something down under {key_to_log}.")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the Actor to take a note."""
-        if self.key is None:
-            msg = "No key was provided to name this note."
-            raise UnableToAct(msg)
+        key = self._check_key()
 
-        if isinstance(self.question, Answerable):
-            value: object = self.question.answered_by(the_actor)
+        if conforms_to(self.question, Answerable):  # type: ignore[type-abstract]
+            value: object = answer_to(self.question, the_actor)
         else:
             # must be a value instead of a question!
             value = self.question
 
-        if isinstance(self.question, ErrorKeeper):
+        self._note(key, value)
+
+    @beat("{} jots something down under {key_to_log}.")
+    async def perform_as_async(self, the_actor: Actor) -> None:
+        """Direct the Actor to take a note, awaiting the answer."""
+        key = self._check_key()
+
+        if conforms_to(self.question, AsyncAnswerable):  # type: ignore[type-abstract]
+            value: object = await answer_to_async(self.question, the_actor)
+        elif conforms_to(self.question, Answerable):  # type: ignore[type-abstract]
+            value = answer_to(self.question, the_actor)
+        else:
+            # must be a value instead of a question!
+            value = self.question
+
+        self._note(key, value)
+
+    def _check_key(self) -> str:
+        """Make sure there is a key to note the value under."""
+        if self.key is None:
+            msg = "No key was provided to name this note."
+            raise UnableToAct(msg)
+        return self.key
+
+    def _note(self, key: str, value: object) -> None:
+        """Have the Director note down the value."""
+        if conforms_to(self.question, ErrorKeeper):  # type: ignore[type-abstract]
             aside(f"Making note of {self.question}...")
             aside(f"Caught Exception: {self.question.caught_exception}")
 
-        Director().notes(self.key, value)
+        Director().notes(key, value)
 
     def __init__(
         self,
@@ -6,6 +6,7 @@ import re
 from time import sleep
 from typing import TYPE_CHECKING
 
+from screenpy.deadline import cap
 from screenpy.exceptions import UnableToAct
 from screenpy.pacing import beat
 
@@ -25,6 +26,10 @@ class Pause:
     to pass a reason for pausing. An :class:`~screenpy.exceptions.UnableToAct`
     exception will be raised if no reason was given.
 
+    When paused inside something with a time budget, like
+    :class:`~screenpy.actions.Eventually`, the pause is cut short rather than
+    outlast that budget.
+
     Examples::
 
         the_actor.attempts_to(
@@ -81,7 +86,7 @@ class Pause:
             )
             raise UnableToAct(msg)
 
-        sleep(self.time)
+        sleep(cap(self.time))
 
     def _massage_reason(self, reason: str) -> str:
         """Apply some gentle massaging to the reason string."""
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from contextvars import copy_context
+from typing import TYPE_CHECKING, NamedTuple
 
 from hamcrest import assert_that
 
-from screenpy.pacing import aside, beat
-from screenpy.protocols import Answerable, ErrorKeeper
+from screenpy.answer_cache import answer_all_to, answer_to, answer_to_async
+from screenpy.narration.narrator import NarrationBackup
+from screenpy.pacing import aside, beat, the_narrator
+from screenpy.protocols import (
+    Answerable,
+    AsyncAnswerable,
+    BatchAnswerable,
+    ErrorKeeper,
+    conforms_to,
+)
 from screenpy.speech_tools import get_additive_description, represent_prop
 
+from .softly import noted_softly
+
 if TYPE_CHECKING:
-    from typing import Union
+    from typing import Hashable, Sequence, Union
 
     from typing_extensions import Self
 
@@ -22,6 +34,14 @@ if TYPE_CHECKING:
     T_R = Resolvable
 
 
+class Answer(NamedTuple):
+    """An answer worked out ahead of time, along with its narration."""
+
+    value: object
+    error: Exception | None
+    narration: NarrationBackup
+
+
 class See:
     """See if a value or the answer to a Question matches the Resolution.
 
@@ -43,6 +63,8 @@ class See:
     question: T_Q
     resolution: T_R
 
+    changes_answers = False
+
     @classmethod
     def the(cls, question: T_Q, resolution: T_R) -> Self:
         """Supply the Question (or value) and Resolution to test."""
@@ -62,18 +84,85 @@ class See:
         """Describe the Action in present tense."""
         return f"See if {self.question_to_log} is {self.resolution_to_log}."
 
+    @noted_softly
     @beat("{} sees if {question_to_log} is {resolution_to_log}.")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the Actor to make an observation."""
-        if isinstance(self.question, Answerable):
-            value: object = self.question.answered_by(the_actor)
-        else:
-            # must be a value instead of a question!
-            value = self.question
-            aside(f"the actual value is: {represent_prop(value)}")
+        self._assert_that(self._answer(the_actor))
 
+    @noted_softly
+    @beat("{} sees if {question_to_log} is {resolution_to_log}.")
+    async def perform_as_async(self, the_actor: Actor) -> None:
+        """Direct the Actor to make an observation, awaiting the answer."""
+        if conforms_to(self.question, AsyncAnswerable):  # type: ignore[type-abstract]
+            value = await answer_to_async(self.question, the_actor)
+        else:
+            value = self._answer(the_actor)
+        self._assert_that(value)
+
+    def answer_ahead(self, the_actor: Actor) -> Answer:
+        """Work out the answer now, recording its narration for later.
+
+        This can be done in another thread; the answer is checked (and its
+        narration replayed) by :meth:`~screenpy.actions.See.check_answer`.
+        """
+        with the_narrator.recording() as narration:
+            try:
+                value = self._answer(the_actor)
+            except Exception as exc:  # noqa: BLE001
+                return Answer(None, exc, narration)
+        return Answer(value, None, narration)
+
+    async def answer_ahead_async(self, the_actor: Actor) -> Answer:
+        """Work out the answer now, without blocking the event loop.
+
+        Synchronous Questions are answered in the loop's default executor.
+        """
+        question = self.question
+        if not conforms_to(question, AsyncAnswerable):  # type: ignore[type-abstract]
+            if not conforms_to(question, Answerable):  # type: ignore[type-abstract]
+                return self.answer_ahead(the_actor)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, copy_context().run, self.answer_ahead, the_actor
+            )
+
+        with the_narrator.recording() as narration:
+            try:
+                value = await answer_to_async(question, the_actor)
+            except Exception as exc:  # noqa: BLE001
+                return Answer(None, exc, narration)
+        return Answer(value, None, narration)
+
+    def accepts(self, answer: Answer) -> bool:
+        """Quietly find out if an earlier answer matches the Resolution."""
+        if answer.error is not None:
+            return False
+        with the_narrator.recording():
+            return self.resolution.resolve().matches(answer.value)
+
+    @noted_softly
+    @beat("{} sees if {question_to_log} is {resolution_to_log}.")
+    def check_answer(self, the_actor: Actor, answer: Answer) -> None:  # noqa: ARG002
+        """Direct the Actor to make an observation with an earlier answer."""
+        the_narrator.replay(answer.narration)
+        if answer.error is not None:
+            raise answer.error
+        self._assert_that(answer.value)
+
+    def _answer(self, the_actor: Actor) -> object:
+        """Get the actual value, answering the Question if there is one."""
+        if conforms_to(self.question, Answerable):  # type: ignore[type-abstract]
+            return answer_to(self.question, the_actor)
+
+        # must be a value instead of a question!
+        aside(f"the actual value is: {represent_prop(self.question)}")
+        return self.question
+
+    def _assert_that(self, value: object) -> None:
+        """Assert the actual value matches the Resolution."""
         reason = ""
-        if isinstance(self.question, ErrorKeeper):
+        if conforms_to(self.question, ErrorKeeper):  # type: ignore[type-abstract]
             reason = f"{self.question.caught_exception}"
 
         assert_that(value, self.resolution.resolve(), reason)
@@ -81,3 +170,41 @@ class See:
     def __init__(self, question: T_Q, resolution: T_R) -> None:
         self.question = question
         self.resolution = resolution
+
+
+def answer_in_batches(
+    questions: Sequence[T_Q], the_actor: Actor
+) -> list[Answer | None]:
+    """Answer the Questions which can be batched together, a batch at a time.
+
+    Only :class:`~screenpy.protocols.BatchAnswerable` Questions which share a
+    class and a batch key with at least one other Question are answered. The narration
+    of each batch goes with the first of its answers.
+
+    Returns:
+        The answer to each Question, or None if it was not batched.
+    """
+    batches: dict[Hashable, dict[int, BatchAnswerable]] = {}
+    for index, question in enumerate(questions):
+        if conforms_to(question, BatchAnswerable):  # type: ignore[type-abstract]
+            batch_key = (type(question), question.batch_key())
+            batches.setdefault(batch_key, {})[index] = question
+
+    answers: list[Answer | None] = [None] * len(questions)
+    for batch in batches.values():
+        if len(batch) < 2:  # noqa: PLR2004
+            continue
+
+        indexes = list(batch)
+        with the_narrator.recording() as narration:
+            try:
+                values = answer_all_to(list(batch.values()), the_actor)
+            except Exception as exc:  # noqa: BLE001
+                error: Exception | None = exc
+                values = [None] * len(indexes)
+            else:
+                error = None
+        for position, (index, value) in enumerate(zip(indexes, values)):
+            recorded = narration if position == 0 else NarrationBackup()
+            answers[index] = Answer(value, error, recorded)
+    return answers
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from typing import TYPE_CHECKING, Tuple
 
 from screenpy.exceptions import UnableToAct
 from screenpy.pacing import beat
 
-from .see import See
+from .see import See, answer_in_batches
+from .softly import noted_softly
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -25,6 +29,10 @@ class SeeAllOf:
     Uses :class:`~screenpy.actions.See` to assert all values or the answers to
     the :ref:`Questions` match their paired :ref:`Resolutions`:.
 
+    Questions which are :class:`~screenpy.protocols.BatchAnswerable`, of the
+    same class and with the same batch key, are answered together with a
+    single call.
+
     Examples::
 
         the_actor.should(
@@ -39,9 +47,20 @@ class SeeAllOf:
                 (Number.of(BALLOONS), IsEqualTo(3)),
             )
         )
+
+        the_actor.should(
+            SeeAllOf(
+                (StatusCode.of(ORDERS_ENDPOINT), IsEqualTo(200)),
+                (StatusCode.of(USERS_ENDPOINT), IsEqualTo(200)),
+            ).concurrently()
+        )
     """
 
     tests: tuple[T_T, ...]
+    concurrent: bool
+    max_workers: int | None
+
+    changes_answers = False
 
     @classmethod
     def the(cls, *tests: T_T) -> Self:
@@ -52,11 +71,70 @@ class SeeAllOf:
         """Describe the Action in present tense."""
         return f"See if {self.log_message}."
 
+    def concurrently(self, max_workers: int | None = None) -> Self:
+        """Answer all the Questions at the same time.
+
+        Questions are answered on a pool of threads, or gathered together if
+        this Action is performed asynchronously. The answers are still
+        checked, and narrated, in the order the tests were given.
+
+        Args:
+            max_workers: the most threads to answer Questions with. Defaults
+                to the default for ``ThreadPoolExecutor``.
+
+        Aliases:
+            * :meth:`~screenpy.actions.SeeAllOf.in_parallel`
+        """
+        self.concurrent = True
+        self.max_workers = max_workers
+        return self
+
+    def in_parallel(self, max_workers: int | None = None) -> Self:
+        """Alias for :meth:`~screenpy.actions.SeeAllOf.concurrently`."""
+        return self.concurrently(max_workers)
+
+    @noted_softly
     @beat("{} sees if {log_message}:")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the Actor to make a series of observations."""
-        for question, resolution in self.tests:
-            the_actor.should(See.the(question, resolution))
+        sees = [See.the(question, resolution) for question, resolution in self.tests]
+        answers = answer_in_batches([q for q, _ in self.tests], the_actor)
+        if self.concurrent:
+            with ThreadPoolExecutor(self.max_workers) as pool:
+                # each thread needs its own copy of the context to run in.
+                futures = {
+                    index: pool.submit(copy_context().run, see.answer_ahead, the_actor)
+                    for index, (see, answer) in enumerate(zip(sees, answers))
+                    if answer is None
+                }
+            for index, future in futures.items():
+                answers[index] = future.result()
+
+        for see, answer in zip(sees, answers):
+            if answer is None:
+                the_actor.should(see)
+            else:
+                see.check_answer(the_actor, answer)
+
+    @noted_softly
+    @beat("{} sees if {log_message}:")
+    async def perform_as_async(self, the_actor: Actor) -> None:
+        """Direct the Actor to make a series of observations, awaiting each."""
+        sees = [See.the(question, resolution) for question, resolution in self.tests]
+        answers = answer_in_batches([q for q, _ in self.tests], the_actor)
+        if self.concurrent:
+            unanswered = [i for i, answer in enumerate(answers) if answer is None]
+            gathered = await asyncio.gather(
+                *(sees[index].answer_ahead_async(the_actor) for index in unanswered)
+            )
+            for index, gathered_answer in zip(unanswered, gathered):
+                answers[index] = gathered_answer
+
+        for see, answer in zip(sees, answers):
+            if answer is None:
+                await the_actor.attempts_to_async(see)
+            else:
+                see.check_answer(the_actor, answer)
 
     def __init__(self, *tests: T_T) -> None:
         for tup in tests:
@@ -69,6 +147,8 @@ class SeeAllOf:
                 raise UnableToAct(msg)
 
         self.tests = tests
+        self.concurrent = False
+        self.max_workers = None
         if len(self.tests) == 0:
             self.log_message = "no tests pass 🤔"
         elif len(self.tests) == 1:
@@ -2,21 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
 from typing import TYPE_CHECKING
 
+from screenpy.deadline import called_off_by
 from screenpy.exceptions import UnableToAct
 from screenpy.pacing import beat
 
-from .see import See
+from .see import See, answer_in_batches
+from .softly import firmly, noted_softly
 
 if TYPE_CHECKING:
-    from typing import Tuple
+    from typing import NoReturn, Tuple
 
     from typing_extensions import Self
 
     from screenpy.actor import Actor
 
-    from .see import T_Q, T_R
+    from .see import T_Q, T_R, Answer
 
     T_T = Tuple[T_Q, T_R]
 
@@ -28,6 +34,10 @@ class SeeAnyOf:
     values or the answers to the :ref:`Questions` match their paired
     :ref:`Resolutions`:.
 
+    Questions which are :class:`~screenpy.protocols.BatchAnswerable`, of the
+    same class and with the same batch key, are answered together with a
+    single call.
+
     Examples::
 
         the_actor.should(
@@ -42,9 +52,20 @@ class SeeAnyOf:
                 (Number.of(BALLOONS), IsEqualTo(4)),
             )
         )
+
+        the_actor.should(
+            SeeAnyOf(
+                (Text.of_the(PRIMARY_REGION_STATUS), ReadsExactly("online")),
+                (Text.of_the(BACKUP_REGION_STATUS), ReadsExactly("online")),
+            ).racing()
+        )
     """
 
     tests: tuple[T_T, ...]
+    race: bool
+    max_workers: int | None
+
+    changes_answers = False
 
     @classmethod
     def the(cls, *tests: T_T) -> Self:
@@ -55,6 +76,35 @@ class SeeAnyOf:
         """Describe the Action in present tense."""
         return f"See if {self.log_message}."
 
+    def racing(self, max_workers: int | None = None) -> Self:
+        """Try all the tests at the same time, stopping at the first to pass.
+
+        Tests are tried on a pool of threads, or as concurrent tasks if this
+        Action is performed asynchronously. Only the winning test is narrated.
+        Once a test passes, the others are cancelled if they have not started
+        yet. The ones already running are called off: any waits inside them
+        (like an :class:`~screenpy.actions.Eventually`) give up, and Questions
+        can check :func:`~screenpy.deadline.called_off` to stop early. Python
+        cannot stop a thread, so a Question which never checks will finish on
+        its own, and its answer is ignored. If no test passes, every test is
+        narrated in order, as usual.
+
+        Args:
+            max_workers: the most threads to try tests with. Defaults to the
+                default for ``ThreadPoolExecutor``.
+
+        Aliases:
+            * :meth:`~screenpy.actions.SeeAnyOf.first_to_pass`
+        """
+        self.race = True
+        self.max_workers = max_workers
+        return self
+
+    def first_to_pass(self, max_workers: int | None = None) -> Self:
+        """Alias for :meth:`~screenpy.actions.SeeAnyOf.racing`."""
+        return self.racing(max_workers)
+
+    @noted_softly
     @beat("{} sees if {log_message}:")
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the Actor to make a series of observations."""
@@ -62,16 +112,137 @@ class SeeAnyOf:
             # No tests is OK!
             return
 
-        for question, resolution in self.tests:
+        sees = [See.the(question, resolution) for question, resolution in self.tests]
+        answers = answer_in_batches([q for q, _ in self.tests], the_actor)
+        if not self.race:
+            for see, answer in zip(sees, answers):
+                try:
+                    with firmly():
+                        if answer is None:
+                            the_actor.should(see)
+                        else:
+                            see.check_answer(the_actor, answer)
+                except AssertionError:
+                    pass  # well, not *pass*, but... you get it.
+                else:
+                    return
+            self._none_passed(the_actor)
+
+        if self._batched_winner(the_actor, sees, answers):
+            return
+
+        pool = ThreadPoolExecutor(self.max_workers)
+        race_is_over = threading.Event()
+        # each thread needs its own copy of the context to run in.
+        futures = {
+            index: pool.submit(
+                copy_context().run, _try_the, see, the_actor, race_is_over
+            )
+            for index, (see, answer) in enumerate(zip(sees, answers))
+            if answer is None
+        }
+        try:
+            for future in as_completed(futures.values()):
+                see, answer, passed = future.result()
+                if passed:
+                    see.check_answer(the_actor, answer)
+                    return
+        finally:
+            race_is_over.set()
+            for future in futures.values():
+                future.cancel()
+            pool.shutdown(wait=False)
+
+        self._check_all(
+            the_actor,
+            sees,
+            [
+                answer if answer is not None else futures[index].result()[1]
+                for index, answer in enumerate(answers)
+            ],
+        )
+
+    @noted_softly
+    @beat("{} sees if {log_message}:")
+    async def perform_as_async(self, the_actor: Actor) -> None:
+        """Direct the Actor to make a series of observations, awaiting each."""
+        if not self.tests:
+            # No tests is OK!
+            return
+
+        sees = [See.the(question, resolution) for question, resolution in self.tests]
+        answers = answer_in_batches([q for q, _ in self.tests], the_actor)
+        if not self.race:
+            for see, answer in zip(sees, answers):
+                try:
+                    with firmly():
+                        if answer is None:
+                            await the_actor.attempts_to_async(see)
+                        else:
+                            see.check_answer(the_actor, answer)
+                except AssertionError:
+                    pass
+                else:
+                    return
+            self._none_passed(the_actor)
+
+        if self._batched_winner(the_actor, sees, answers):
+            return
+
+        race_is_over = threading.Event()
+        tasks = {
+            index: asyncio.ensure_future(_try_the_async(see, the_actor, race_is_over))
+            for index, (see, answer) in enumerate(zip(sees, answers))
+            if answer is None
+        }
+        try:
+            for next_to_finish in asyncio.as_completed(tasks.values()):
+                see, answer, passed = await next_to_finish
+                if passed:
+                    see.check_answer(the_actor, answer)
+                    return
+        finally:
+            race_is_over.set()
+            for task in tasks.values():
+                task.cancel()
+
+        self._check_all(
+            the_actor,
+            sees,
+            [
+                answer if answer is not None else tasks[index].result()[1]
+                for index, answer in enumerate(answers)
+            ],
+        )
+
+    def _batched_winner(
+        self, the_actor: Actor, sees: list[See], answers: list[Answer | None]
+    ) -> bool:
+        """Check the first batched answer to pass, if any did, before racing."""
+        for see, answer in zip(sees, answers):
+            if answer is not None and see.accepts(answer):
+                see.check_answer(the_actor, answer)
+                return True
+        return False
+
+    def _check_all(
+        self, the_actor: Actor, sees: list[See], answers: list[Answer]
+    ) -> None:
+        """Check (and narrate) every answer in order, after none passed."""
+        for see, answer in zip(sees, answers):
             try:
-                the_actor.should(See.the(question, resolution))
-                break
+                with firmly():
+                    see.check_answer(the_actor, answer)
             except AssertionError:
-                pass  # well, not *pass*, but... you get it.
-        else:
-            # none passed!
-            msg = f"{the_actor} did not find any expected answers!"
-            raise AssertionError(msg)
+                pass
+            else:
+                return
+        self._none_passed(the_actor)
+
+    def _none_passed(self, the_actor: Actor) -> NoReturn:
+        """Complain that none of the tests passed."""
+        msg = f"{the_actor} did not find any expected answers!"
+        raise AssertionError(msg)
 
     def __init__(self, *tests: T_T) -> None:
         for tup in tests:
@@ -84,9 +255,29 @@ class SeeAnyOf:
                 raise UnableToAct(msg)
 
         self.tests = tests
+        self.race = False
+        self.max_workers = None
         if len(self.tests) == 0:
             self.log_message = "no tests pass 🤔"
         elif len(self.tests) == 1:
             self.log_message = "1 test passes"
         else:
             self.log_message = f"any of {len(self.tests)} tests pass"
+
+
+def _try_the(
+    see: See, the_actor: Actor, race_is_over: threading.Event
+) -> tuple[See, Answer, bool]:
+    """Answer the See's Question and quietly check if it passes."""
+    with called_off_by(race_is_over):
+        answer = see.answer_ahead(the_actor)
+    return see, answer, see.accepts(answer)
+
+
+async def _try_the_async(
+    see: See, the_actor: Actor, race_is_over: threading.Event
+) -> tuple[See, Answer, bool]:
+    """Answer the See's Question, awaiting it, and quietly check if it passes."""
+    with called_off_by(race_is_over):
+        answer = await see.answer_ahead_async(the_actor)
+    return see, answer, see.accepts(answer)
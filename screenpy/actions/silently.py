@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 
 from screenpy.configuration import settings
 from screenpy.pacing import the_narrator
-from screenpy.protocols import Answerable, Performable, Resolvable
+from screenpy.protocols import Answerable, Performable, Resolvable, conforms_to
 
 if TYPE_CHECKING:
     from typing import Any, TypeVar
@@ -54,7 +54,7 @@ def Silently(duck: T) -> T:
     # mypy really doesn't like monkeypatching
     # See https://github.com/python/mypy/issues/2427
 
-    if isinstance(duck, Performable):
+    if conforms_to(duck, Performable):  # type: ignore[type-abstract]
         original_perform_as = duck.perform_as
 
         def perform_as(self: Performable, actor: Actor) -> None:  # noqa: ARG001
@@ -67,7 +67,7 @@ def Silently(duck: T) -> T:
 
         duck.perform_as = MethodType(perform_as, duck)  # type: ignore[method-assign]
 
-    if isinstance(duck, Answerable):
+    if conforms_to(duck, Answerable):  # type: ignore[type-abstract]
         original_answered_by = duck.answered_by
 
         # ANN401 ignored here to follow the Answerable protocol.
@@ -81,7 +81,7 @@ def Silently(duck: T) -> T:
 
         duck.answered_by = MethodType(answered_by, duck)  # type: ignore[method-assign]
 
-    if isinstance(duck, Resolvable):
+    if conforms_to(duck, Resolvable):  # type: ignore[type-abstract]
         original_resolve = duck.resolve
 
         def resolve(self: Resolvable) -> Matcher:  # noqa: ARG001
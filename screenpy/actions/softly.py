@@ -0,0 +1,167 @@
+"""Note failed assertions, raising them all together at the end."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import TYPE_CHECKING, Callable, TypeVar, cast
+
+from screenpy.exceptions import SoftAssertionError
+from screenpy.pacing import beat
+from screenpy.speech_tools import get_additive_description
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Any, Generator
+
+    from typing_extensions import ParamSpec, Self
+
+    from screenpy.actor import Actor
+    from screenpy.protocols import Performable
+
+    P = ParamSpec("P")
+    T = TypeVar("T")
+
+_failures: ContextVar[list[AssertionError] | None] = ContextVar(
+    "soft_failures", default=None
+)
+
+
+def noted_softly(func: Callable[P, T]) -> Callable[P, T]:
+    """Note a failed assertion instead of raising it, when checking softly.
+
+    Outside of :class:`~screenpy.actions.Softly`, this does nothing. Use it
+    to decorate the ``perform_as`` of an Action which makes an assertion.
+    """
+    if iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(
+            *args: P.args, **kwargs: P.kwargs
+        ) -> Any:  # noqa: ANN401
+            failures = _failures.get()
+            try:
+                return await func(*args, **kwargs)
+            except AssertionError as exc:
+                if failures is None:
+                    raise
+                failures.append(exc)
+                return None
+
+        # func is a coroutine function, so T is already its Coroutine.
+        return cast("Callable[P, T]", async_wrapper)
+
+    @wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        failures = _failures.get()
+        try:
+            return func(*args, **kwargs)
+        except AssertionError as exc:
+            if failures is None:
+                raise
+            failures.append(exc)
+            return cast("T", None)
+
+    return wrapper
+
+
+@contextmanager
+def firmly() -> Generator:
+    """Raise failed assertions in this context, even when checking softly.
+
+    Actions which need to see failures to work, like
+    :class:`~screenpy.actions.Eventually` and :class:`~screenpy.actions.Either`,
+    perform their Actions firmly.
+    """
+    token = _failures.set(None)
+    try:
+        yield
+    finally:
+        _failures.reset(token)
+
+
+class Softly:
+    """Note failed assertions, raising them all together at the end.
+
+    Any assertions made by :class:`~screenpy.actions.See`,
+    :class:`~screenpy.actions.SeeAllOf`, or :class:`~screenpy.actions.SeeAnyOf`
+    while checking softly do not stop the test when they fail. Instead, once
+    everything has been checked, a
+    :class:`~screenpy.exceptions.SoftAssertionError` is raised describing every
+    failure. ``Softly`` can be performed, or used as a context manager.
+
+    Examples::
+
+        the_actor.should(
+            Softly(
+                See.the(Text.of_the(WELCOME_BANNER), ContainsTheText("Welcome!")),
+                See.the(Number.of(BALLOONS), IsEqualTo(3)),
+            )
+        )
+
+        with Softly():
+            the_actor.should(See.the(Text.of_the(TITLE), ReadsExactly("Home")))
+            the_actor.should(See.the(Number.of(BALLOONS), IsEqualTo(3)))
+    """
+
+    performables: tuple[Performable, ...]
+    failures: list[AssertionError]
+
+    # its Actions forget any remembered answers themselves, if they need to.
+    changes_answers = False
+
+    @property
+    def performables_to_log(self) -> str:
+        """Represent the Performables in a log-friendly way."""
+        return ", ".join(get_additive_description(p) for p in self.performables)
+
+    def describe(self) -> str:
+        """Describe the Action in present tense."""
+        return f"Softly {self.performables_to_log}."
+
+    @beat("{} checks softly:")
+    def perform_as(self, the_actor: Actor) -> None:
+        """Direct the Actor to perform, noting any failed assertions."""
+        with self:
+            the_actor.attempts_to(*self.performables)
+
+    @beat("{} checks softly:")
+    async def perform_as_async(self, the_actor: Actor) -> None:
+        """Direct the Actor to perform, awaiting and noting failed assertions."""
+        with self:
+            await the_actor.attempts_to_async(*self.performables)
+
+    def __enter__(self) -> Self:
+        """Start noting failed assertions."""
+        self.failures = []
+        self._tokens.append(_failures.set(self.failures))
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop noting failed assertions, and raise any that were noted.
+
+        If this is inside another ``Softly``, the failures are passed along
+        to be raised at the end of that one instead.
+        """
+        _failures.reset(self._tokens.pop())
+        if exc_type is not None or not self.failures:
+            return
+
+        outer_failures = _failures.get()
+        if outer_failures is not None:
+            outer_failures.extend(self.failures)
+            return
+
+        raise SoftAssertionError(self.failures)
+
+    def __init__(self, *performables: Performable) -> None:
+        self.performables = performables
+        self.failures = []
+        self._tokens: list[Any] = []
@@ -8,11 +8,12 @@ service of perfoming their roles.
 from __future__ import annotations
 
 from random import choice
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, TypeVar, cast
 
+from .answer_cache import forget_answers_after
 from .exceptions import UnableToPerform
 from .pacing import aside
-from .protocols import Forgettable
+from .protocols import AsyncPerformable, Forgettable, conforms_to
 from .speech_tools import get_additive_description
 
 if TYPE_CHECKING:
@@ -54,7 +55,6 @@ class Actor:
         Perry = Actor.named("Perry")
     """
 
-    abilities: list[Forgettable]
     ordered_cleanup_tasks: list[Performable]
     independent_cleanup_tasks: list[Performable]
 
@@ -64,6 +64,16 @@ class Actor:
         aside(choice(ENTRANCE_DIRECTIONS).format(actor=name))
         return cls(name)
 
+    @property
+    def abilities(self) -> list[Forgettable]:
+        """The Abilities this Actor possesses."""
+        return self._abilities
+
+    @abilities.setter
+    def abilities(self, abilities: list[Forgettable]) -> None:
+        self._abilities = abilities
+        self._ability_registry: dict[type, tuple[int, Forgettable]] = {}
+
     def who_can(self, *abilities: T_Ability) -> Self:
         """Add one or more Abilities to this Actor.
 
@@ -120,12 +130,11 @@ class Actor:
         Aliases:
             * :meth:`~screenpy.actor.Actor.ability_to`
         """
-        for a in self.abilities:
-            if isinstance(a, ability):
-                return a
-
-        msg = f"{self} does not have the Ability to {ability}"
-        raise UnableToPerform(msg)
+        found = self._find_ability(ability)
+        if found is None:
+            msg = f"{self} does not have the Ability to {ability}"
+            raise UnableToPerform(msg)
+        return found
 
     def ability_to(self, ability: type[T_Ability]) -> T_Ability:
         """Alias for :meth:`~screenpy.actor.Actor.uses_ability_to`."""
@@ -133,12 +142,29 @@ class Actor:
 
     def has_ability_to(self, ability: type[T_Ability]) -> bool:
         """Ask whether the Actor has the Ability to do something."""
-        try:
-            self.ability_to(ability)
-        except UnableToPerform:
-            return False
-        else:
-            return True
+        return self._find_ability(ability) is not None
+
+    def _find_ability(self, ability: type[T_Ability]) -> T_Ability | None:
+        """Find the first of the Actor's Abilities which is the given type.
+
+        Where the Ability was found is remembered, so asking for the same
+        type again only needs to check that it is still there. The Abilities
+        can be changed directly (e.g. ``actor.abilities.append(...)``), so an
+        Ability which was not found is looked for again every time.
+        """
+        abilities = self._abilities
+        remembered = self._ability_registry.get(ability)
+        if remembered is not None:
+            index, found = remembered
+            if index < len(abilities) and abilities[index] is found:
+                return cast("T_Ability", found)
+
+        for index, candidate in enumerate(abilities):
+            if isinstance(candidate, ability):
+                self._ability_registry[ability] = (index, candidate)
+                return candidate
+        self._ability_registry.pop(ability, None)
+        return None
 
     def attempts_to(self, *actions: Performable) -> None:
         """Perform a list of Actions, one after the other.
@@ -201,6 +227,25 @@ class Actor:
     def perform(self, action: Performable) -> None:
         """Perform an Action."""
         action.perform_as(self)
+        forget_answers_after(action)
+
+    async def attempts_to_async(self, *actions: Performable | AsyncPerformable) -> None:
+        """Perform a list of Actions, one after the other, awaiting each one.
+
+        Actions which are :class:`~screenpy.protocols.AsyncPerformable` are
+        awaited, so many Actors can share one event loop. Any other Actions
+        are performed as usual.
+        """
+        for action in actions:
+            await self.perform_async(action)
+
+    async def perform_async(self, action: Performable | AsyncPerformable) -> None:
+        """Perform an Action, awaiting it if it can be performed asynchronously."""
+        if conforms_to(action, AsyncPerformable):  # type: ignore[type-abstract]
+            await action.perform_as_async(self)
+            forget_answers_after(action)
+        else:
+            self.perform(action)
 
     def cleans_up_ordered_tasks(self) -> None:
         """Perform ordered clean-up tasks."""
@@ -0,0 +1,274 @@
+"""Remember the answers to Questions, so each is only asked once.
+
+Tasks often ask the same Question several times, like seeing a banner's
+text, then making a note of it. Inside an :class:`AnswerCache`, the first
+answer is remembered and given back the next time that Actor asks that
+Question, without asking the application again::
+
+    with AnswerCache() as cache:
+        the_actor.should(See.the(Text.of_the(BANNER), ContainsTheText("Hi")))
+        the_actor.attempts_to(MakeNote.of_the(Text.of_the(BANNER)).as_("banner"))
+
+    cache.hits, cache.misses  # 1, 1 (if the Question compares equal)
+
+Questions are matched by equality if they can be hashed, or by identity if
+they cannot. Answers are forgotten whenever the Actor performs an Action
+that might change them. Actions which only look at the application, like
+:class:`~screenpy.actions.See`, are marked with ``changes_answers = False``
+so the answers are kept (see :class:`~screenpy.protocols.Performable`). :class:`~screenpy.actions.Eventually` forgets the
+answers before every attempt, so it always sees fresh ones. Answers which
+are iterators, like generators, are never remembered, since they can only
+be looked through once.
+
+Answers to :class:`~screenpy.protocols.BatchAnswerable` Questions which were
+asked in one batch (e.g. by :class:`~screenpy.actions.SeeAllOf`) are
+remembered too, so a :class:`~screenpy.actions.MakeNote` of one of them
+afterwards does not ask again.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import ContextDecorator
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Hashable, Iterator, Tuple
+
+from screenpy.exceptions import UnableToAnswer
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Any, Sequence
+
+    from typing_extensions import Self
+
+    from screenpy.actor import Actor
+    from screenpy.protocols import Answerable, AsyncAnswerable, BatchAnswerable
+
+Key = Tuple[Hashable, int]
+
+_cache: ContextVar[AnswerCache | None] = ContextVar("answer_cache", default=None)
+
+
+class AnswerCache(ContextDecorator):
+    """Remember the answers to Questions until an Action might change them.
+
+    Can be used as a context manager or as a decorator for a step function.
+    Counts its hits, misses, and how many times it forgot its answers, to
+    help tune where it is used.
+
+    Examples::
+
+        with AnswerCache():
+            ...
+
+        @AnswerCache()
+        def test_cached_step(the_actor):
+            ...
+    """
+
+    answers: dict[Key, tuple[object, object]]
+    hits: int
+    misses: int
+    forgotten: int
+    _outer: AnswerCache | None
+
+    def answer(self, question: Answerable, the_actor: Actor) -> object:
+        """Give the remembered answer, or ask the Question and remember it."""
+        key = _key_for(question, the_actor)
+        found, value = self._recall(key)
+        if found:
+            return value
+        value = question.answered_by(the_actor)
+        self._remember(key, question, value)
+        return value
+
+    async def answer_async(self, question: AsyncAnswerable, the_actor: Actor) -> object:
+        """Give the remembered answer, or await the Question and remember it."""
+        key = _key_for(question, the_actor)
+        found, value = self._recall(key)
+        if found:
+            return value
+        value = await question.answered_by_async(the_actor)
+        self._remember(key, question, value)
+        return value
+
+    def answer_all(
+        self, questions: Sequence[BatchAnswerable], the_actor: Actor
+    ) -> list[object]:
+        """Give the remembered answers, asking the rest in one batch."""
+        keys = [_key_for(question, the_actor) for question in questions]
+        answers: dict[int, object] = {}
+        unanswered = []
+        for index, key in enumerate(keys):
+            found, value = self._recall(key)
+            if found:
+                answers[index] = value
+            else:
+                unanswered.append(index)
+
+        if unanswered:
+            values = _ask_all([questions[index] for index in unanswered], the_actor)
+            for index, value in zip(unanswered, values):
+                self._remember(keys[index], questions[index], value)
+                answers[index] = value
+        return [answers[index] for index in range(len(questions))]
+
+    def forget(self) -> None:
+        """Forget every remembered answer, here and in any outer cache."""
+        forgotten: set[int] = set()
+        cache: AnswerCache | None = self
+        # a cache entered inside itself can be reached again; forget it once.
+        while cache is not None and id(cache) not in forgotten:
+            forgotten.add(id(cache))
+            with cache._lock:
+                cache.answers.clear()
+                cache.forgotten += 1
+            cache = cache._outer
+
+    def _recall(self, key: Key) -> tuple[bool, object]:
+        """Find the remembered answer for the key, counting the hit or miss."""
+        with self._lock:
+            if key in self.answers:
+                self.hits += 1
+                return True, self.answers[key][1]
+            self.misses += 1
+            return False, None
+
+    def _remember(self, key: Key, question: object, value: object) -> None:
+        """Remember the answer, holding onto the Question so its id is not reused."""
+        if isinstance(value, Iterator):
+            # it will have been used up by whoever asked for it.
+            return
+        with self._lock:
+            self.answers[key] = (question, value)
+
+    def __enter__(self) -> Self:
+        """Start remembering answers."""
+        outer = _cache.get()
+        self._entries.append((_cache.set(self), self._outer))
+        if outer is not self:
+            self._outer = outer
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop remembering answers, and forget the ones remembered."""
+        token, self._outer = self._entries.pop()
+        _cache.reset(token)
+        if self._entries:
+            # still inside an earlier entry of this same cache.
+            return
+        with self._lock:
+            self.answers.clear()
+
+    def __repr__(self) -> str:
+        """Show how well the cache is doing."""
+        return (
+            f"AnswerCache(hits={self.hits}, misses={self.misses},"
+            f" forgotten={self.forgotten})"
+        )
+
+    def __init__(self) -> None:
+        self.answers = {}
+        self.hits = 0
+        self.misses = 0
+        self.forgotten = 0
+        self._lock = threading.Lock()
+        self._outer = None
+        # each entry's token, and the outer cache to go back to on exit.
+        self._entries: list[tuple[Any, AnswerCache | None]] = []
+
+
+def _key_for(question: object, the_actor: Actor) -> Key:
+    """Match Questions by equality if they can be hashed, else by identity."""
+    try:
+        hash(question)
+    except TypeError:
+        return (id(question), id(the_actor))
+    return (question, id(the_actor))
+
+
+def answer_to(question: Answerable, the_actor: Actor) -> object:
+    """Answer the Question, using the current cache if there is one.
+
+    Args:
+        question: the Question to answer.
+        the_actor: the Actor answering it.
+
+    Returns:
+        The answer, which may have been remembered from earlier.
+    """
+    cache = _cache.get()
+    if cache is None:
+        return question.answered_by(the_actor)
+    return cache.answer(question, the_actor)
+
+
+async def answer_to_async(question: AsyncAnswerable, the_actor: Actor) -> object:
+    """Await the answer to the Question, using the current cache if there is one.
+
+    Args:
+        question: the Question to answer.
+        the_actor: the Actor answering it.
+
+    Returns:
+        The answer, which may have been remembered from earlier.
+    """
+    cache = _cache.get()
+    if cache is None:
+        return await question.answered_by_async(the_actor)
+    return await cache.answer_async(question, the_actor)
+
+
+def answer_all_to(
+    questions: Sequence[BatchAnswerable], the_actor: Actor
+) -> list[object]:
+    """Answer a batch of Questions with one call, using the current cache.
+
+    Args:
+        questions: Questions of one class, which all have the same batch key.
+        the_actor: the Actor answering them.
+
+    Returns:
+        The answers, in the same order as the Questions.
+    """
+    cache = _cache.get()
+    if cache is None:
+        return _ask_all(questions, the_actor)
+    return cache.answer_all(questions, the_actor)
+
+
+def _ask_all(questions: Sequence[BatchAnswerable], the_actor: Actor) -> list[object]:
+    """Ask the first Question to answer the whole batch."""
+    answers = list(questions[0].answered_by_all(the_actor, questions))
+    if len(answers) != len(questions):
+        msg = (
+            f"{questions[0].__class__.__name__} gave {len(answers)} answers"
+            f" for a batch of {len(questions)} Questions."
+        )
+        raise UnableToAnswer(msg)
+    return answers
+
+
+def forget_answers() -> None:
+    """Forget the answers in the current cache, if there is one."""
+    cache = _cache.get()
+    if cache is not None:
+        cache.forget()
+
+
+def forget_answers_after(action: object) -> None:
+    """Forget the answers, unless the Action says it changes nothing.
+
+    Actions say so with ``changes_answers = False``, as described on
+    :class:`~screenpy.protocols.Performable`.
+
+    Args:
+        action: the Action which was just performed.
+    """
+    if getattr(action, "changes_answers", True):
+        forget_answers()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from pydantic_settings import (
     BaseSettings,
@@ -135,12 +135,56 @@ class ScreenPySettings(BaseSettings):
     (e.g. :class:`~screenpy.actions.Eventually`).
     """
 
+    POLLING_SCHEDULE: str = "constant"
+    """
+    Default polling schedule to use for things that poll, which stretches
+    the polling interval between attempts. One of "constant", "exponential",
+    "fibonacci", or "decorrelated jitter". See :mod:`screenpy.polling`.
+    """
+
+    # Optional is used here because Pydantic must evaluate this on Python 3.8.
+    POLLING_CAP: Optional[float] = None  # noqa: UP007
+    """
+    The longest (in seconds) the polling schedule may wait between attempts.
+    None (the default) means there is no cap.
+    """
+
     UNABRIDGED_NARRATION: bool = False
     """
     If True, :class:`~screenpy.actions.Silently` is turned off, allowing
     all Narration. False by default.
     """
 
+    # Optional is used here because Pydantic must evaluate this on Python 3.8.
+    KINKED_NARRATION_LIMIT: Optional[int] = None  # noqa: UP007
+    """
+    The most narrations the Narrator will hold on to while its microphone
+    cable is kinked (e.g. during :class:`~screenpy.actions.Eventually` or
+    :class:`~screenpy.actions.Silently`). Only the most recent narrations are
+    kept; the Narrator mentions how many were dropped. None (the default)
+    means there is no limit.
+    """
+
+    REPRESENTATION_LENGTH_LIMIT: int = 1000
+    """
+    About the most characters of a value (like the answer to a Question) to
+    show in the narration. Longer strings and bytes are cut down in the
+    middle, and collections stop showing their items. Values which are cut
+    down are followed by their full size and a digest of the whole value.
+    """
+
+    REPRESENTATION_ITEM_LIMIT: int = 100
+    """
+    The most items of a collection (like a list or dictionary) to show in
+    the narration. The rest are left out, like ``[1, 2, ...]``.
+    """
+
+    REPRESENTATION_DEPTH_LIMIT: int = 6
+    """
+    How many collections deep to show a value in the narration. Deeper ones
+    are left out, like ``[[...]]``.
+    """
+
     @classmethod
     def settings_customise_sources(  # noqa: PLR0913
         cls,
@@ -0,0 +1,116 @@
+"""Keep nested waits within the time budget of the waits around them.
+
+Things that wait, like :class:`~screenpy.actions.Eventually`, declare a
+budget using :func:`within`. Any waits nested inside them (e.g. a Task with
+its own ``Eventually``) are cut down to whatever is left of that budget, so
+nested waits can never add up to more than the outermost timeout::
+
+    with within(30) as budget:
+        ...  # budget is 30, or less if an outer wait has less time left
+
+Deadlines are measured with :func:`time.monotonic`, so changes to the wall
+clock do not affect them. Each thread and asyncio task keeps its own
+deadlines; asyncio tasks inherit the deadlines of the code that created them.
+
+Work can also be called off before its deadline, like the tests which lose
+a race in :class:`~screenpy.actions.SeeAnyOf`. Once it is called off, there
+is no time remaining, so any waits inside it give up::
+
+    with called_off_by(stop_signal):
+        ...  # time_remaining() is 0 as soon as stop_signal is set
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import threading
+    from typing import Generator
+
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+_stop_signals: ContextVar[tuple[threading.Event, ...]] = ContextVar(
+    "stop_signals", default=()
+)
+
+
+def time_remaining() -> float | None:
+    """Find how many seconds are left before the current deadline.
+
+    Returns:
+        The seconds left (never less than 0), or None if there is no
+        deadline in effect. If the work was called off, there are 0 left.
+    """
+    if called_off():
+        return 0.0
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def cap(seconds: float) -> float:
+    """Cut the seconds down to the time remaining, if there is a deadline.
+
+    Args:
+        seconds: how long something would like to wait.
+
+    Returns:
+        How long it may wait.
+    """
+    remaining = time_remaining()
+    if remaining is None:
+        return seconds
+    return min(seconds, remaining)
+
+
+@contextmanager
+def within(seconds: float) -> Generator[float, None, None]:
+    """Set a deadline for everything inside this context.
+
+    If there is already a deadline that comes sooner, that deadline stays in
+    effect instead.
+
+    Args:
+        seconds: the budget for everything inside this context.
+
+    Yields:
+        The budget in effect, which may be less than the given seconds.
+    """
+    budget = cap(seconds)
+    token = _deadline.set(time.monotonic() + budget)
+    try:
+        yield budget
+    finally:
+        _deadline.reset(token)
+
+
+def called_off() -> bool:
+    """Find out if the work being done here is no longer wanted.
+
+    Questions which take a long time, like ones that poll a resource, can
+    check this to give up early.
+
+    Returns:
+        True if any of the stop signals in effect has been set.
+    """
+    return any(signal.is_set() for signal in _stop_signals.get())
+
+
+@contextmanager
+def called_off_by(signal: threading.Event) -> Generator[None, None, None]:
+    """Call off everything inside this context once the signal is set.
+
+    Any stop signals from outer contexts stay in effect, too.
+
+    Args:
+        signal: the signal which calls the work off, once it is set.
+    """
+    token = _stop_signals.set((*_stop_signals.get(), signal))
+    try:
+        yield
+    finally:
+        _stop_signals.reset(token)
@@ -1,5 +1,7 @@
 """Common exceptions for ScreenPy."""
 
+from __future__ import annotations
+
 
 class ScreenPyError(Exception):
     """The base exception for all of ScreenPy."""
@@ -33,6 +35,19 @@ class UnableToAct(ActionError):
     """The Action is missing key information or is misconfigured."""
 
 
+class SoftAssertionError(ActionError, AssertionError):
+    """One or more assertions failed while checking softly."""
+
+    def __init__(self, failures: list[AssertionError]) -> None:
+        self.failures = failures
+        described = "\n".join(
+            f"    {number}. {str(failure).strip()}".replace("\n", "\n       ")
+            for number, failure in enumerate(failures, start=1)
+        )
+        s = "s" if len(failures) != 1 else ""
+        super().__init__(f"{len(failures)} soft assertion{s} failed:\n{described}")
+
+
 class QuestionError(ScreenPyError):
     """Raised by a Question."""
 
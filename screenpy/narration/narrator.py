@@ -7,10 +7,12 @@ applied. Adapters must follow the Adapter protocol outlined in screenpy.protocol
 
 from __future__ import annotations
 
+from collections import deque
 from contextlib import contextmanager
-from copy import deepcopy
+from contextvars import ContextVar
 from typing import TYPE_CHECKING
 
+from screenpy.configuration import settings
 from screenpy.exceptions import UnableToNarrate
 
 # pylint: disable=stop-iteration-return
@@ -24,6 +26,7 @@ if TYPE_CHECKING:
         ContextManager,
         Dict,
         Generator,
+        Iterator,
         List,
         Tuple,
         Union,
@@ -31,12 +34,94 @@ if TYPE_CHECKING:
 
     from screenpy.protocols import Adapter
 
-    Kwargs = Union[Callable, str]
+    Kwargs = Union[Callable, str, "LazyLine"]
     BackedUpNarration = Tuple[str, Dict[str, Kwargs], int]
     ChainedNarrations = List[Tuple[str, Dict[str, Kwargs], List]]
     Entangled = Tuple[Callable, List[Generator]]
 
 
+class LazyLine:
+    """A line which is only composed once someone is listening.
+
+    Describing a step can be costly (e.g. representing large values), so
+    ``beat`` hands the Narrator one of these instead of a finished string. The
+    line is composed the first time it is converted to a string, which the
+    Narrator only does when it passes the line to its adapters or backs it up
+    behind a kinked cable (so the line tells of things as they were when it
+    was spoken). Lines that are never narrated (off the air, no adapters) are
+    never composed at all.
+    """
+
+    def __init__(self, compose: Callable[[], str]) -> None:
+        self.compose: Callable[[], str] | None = compose
+        self.composed: str | None = None
+
+    def __str__(self) -> str:
+        """Compose the line, if it has not been composed already."""
+        if self.compose is not None:
+            self.composed = self.compose()
+            # let go of whatever the composer was holding on to.
+            self.compose = None
+        return str(self.composed)
+
+    def __repr__(self) -> str:
+        """Represent the line by composing it."""
+        return repr(str(self))
+
+
+class NarrationBackup:
+    """The narrations backed up behind a kink in the microphone cable.
+
+    If given a limit, only the most recent narrations are kept, like a ring
+    buffer. Older narrations are dropped and counted, so a performance which
+    is retried for a long time cannot hoard memory.
+    """
+
+    def __init__(self, limit: int | None = None) -> None:
+        self.narrations: deque[BackedUpNarration] = deque(maxlen=limit)
+        self.dropped = 0
+
+    def append(self, narration: BackedUpNarration) -> None:
+        """Back up a narration, dropping the oldest one if we are full."""
+        if len(self.narrations) == self.narrations.maxlen:
+            self.dropped += 1
+        self.narrations.append(narration)
+
+    def extend(self, backup: NarrationBackup) -> None:
+        """Back up all the narrations from another backup."""
+        self.dropped += backup.dropped
+        for narration in backup:
+            self.append(narration)
+
+    def clear(self) -> None:
+        """Drop all the backed-up narrations."""
+        self.narrations.clear()
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        """How many narrations are backed up."""
+        return len(self.narrations)
+
+    def __iter__(self) -> Iterator[BackedUpNarration]:
+        """Iterate over the backed-up narrations, oldest first."""
+        return iter(self.narrations)
+
+    def __getitem__(self, index: int) -> BackedUpNarration:
+        """Get a specific backed-up narration."""
+        return self.narrations[index]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the backed-up narrations to another backup or a list."""
+        if isinstance(other, NarrationBackup):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    # backups change as narrations are added, so they can't be hashed.
+    __hash__ = None  # type: ignore[assignment]
+
+
 def _chainify(narrations: list[BackedUpNarration]) -> ChainedNarrations:
     """Organize backed-up narrations into an encapsulation chain.
 
@@ -46,38 +131,75 @@ def _chainify(narrations: list[BackedUpNarration]) -> ChainedNarrations:
     =>
     [(kwargs1, [(kwargs2, []), (kwargs3, [(kwargs4, [])])])]
 
+    Each narration is enclosed by the closest narration before it with a
+    lower exit level. Narrations without such an encloser (e.g. because it
+    was dropped from a full backup) are placed at the top of the chain.
+
     This encapsulation structure can be used by _entangle_chain to correctly
     entangle the backed-up narrations, so each adapter handles them properly.
 
     This approach was created with help from @Doctor#7942 on Discord. Thanks!
     """
     result: ChainedNarrations = []
-    stack = [result]
+    # each level of the stack holds an exit level and the list of narrations
+    # enclosed by a narration at that exit level.
+    stack: list[tuple[int, ChainedNarrations]] = [(0, result)]
     for channel, channel_kwargs, exit_level in narrations:
-        if exit_level == len(stack):
-            # this function is a sibling of the previous one
-            stack[-1].append((channel, channel_kwargs, []))
-        elif exit_level > len(stack):
-            # surface the latest function's child list and append to that
-            child_list = stack[-1][-1][-1]
-            stack.append(child_list)
-            stack[-1].append((channel, channel_kwargs, []))
-        else:
+        while len(stack) > 1 and stack[-1][0] >= exit_level:
             # we've dropped down one or more levels, go back
-            stack = stack[: -(len(stack) - exit_level)]
-            stack[-1].append((channel, channel_kwargs, []))
+            stack.pop()
+        enclosed: ChainedNarrations = []
+        stack[-1][1].append((channel, channel_kwargs, enclosed))
+        stack.append((exit_level, enclosed))
     return result
 
 
 class Narrator:
-    """The narrator conveys the story to the audience."""
+    """The narrator conveys the story to the audience.
+
+    The Narrator keeps track of whether they are on the air, how deeply the
+    current narration is nested, and any backed-up narrations separately for
+    each thread and asyncio task. This allows Actors to perform concurrently
+    without mixing up each other's narration.
+    """
 
     def __init__(self, adapters: list[Adapter] | None = None) -> None:
         self.adapters: list[Adapter] = adapters or []
-        self.on_air = True
-        self.backed_up_narrations: list[list[BackedUpNarration]] = []
-        self.exit_level = 1
         self.handled_exception = None
+        self._on_air: ContextVar[bool] = ContextVar(f"on_air_{id(self)}", default=True)
+        self._backups: ContextVar[tuple[NarrationBackup, ...]] = ContextVar(
+            f"backed_up_narrations_{id(self)}", default=()
+        )
+        self._exit_level: ContextVar[int] = ContextVar(
+            f"exit_level_{id(self)}", default=1
+        )
+
+    @property
+    def on_air(self) -> bool:
+        """Whether or not the Narrator is narrating."""
+        return self._on_air.get()
+
+    @on_air.setter
+    def on_air(self, on_air: bool) -> None:
+        self._on_air.set(on_air)
+
+    @property
+    def backed_up_narrations(self) -> list[NarrationBackup]:
+        """The backups for each kink in the microphone cable, innermost last."""
+        return list(self._backups.get())
+
+    @backed_up_narrations.setter
+    def backed_up_narrations(self, backups: list[NarrationBackup]) -> None:
+        self._backups.set(tuple(backups))
+
+    @property
+    def exit_level(self) -> int:
+        """How deeply the current narration is nested."""
+        return self._exit_level.get()
+
+    @exit_level.setter
+    def exit_level(self, exit_level: int) -> None:
+        self._exit_level.set(exit_level)
 
     def attach_adapter(self, adapter: Adapter) -> None:
         """Attach a new adapter to the Narrator's microphone."""
@@ -86,7 +208,7 @@ class Narrator:
     @property
     def cable_kinked(self) -> bool:
         """Whether or not the Narrator's microphone cable is kinked."""
-        return len(self.backed_up_narrations) != 0
+        return len(self._backups.get()) != 0
 
     @contextmanager
     def off_the_air(self) -> Generator:
@@ -105,17 +227,49 @@ class Narrator:
         can call clear_backup to drop all stored narrations, or flush_backup
         to log them all (and clear them afterward).
         """
-        self.backed_up_narrations.append([])
+        backup = NarrationBackup(settings.KINKED_NARRATION_LIMIT)
+        self._backups.set((*self._backups.get(), backup))
         try:
             yield
         finally:
             self.flush_backup()
-            self.backed_up_narrations.pop()
+            self._backups.set(self._backups.get()[:-1])
+
+    @contextmanager
+    def recording(self) -> Generator[NarrationBackup, None, None]:
+        """Record all narration in this context, to be replayed later.
+
+        Unlike a kinked cable, the recording is never flushed on its own. Use
+        :meth:`replay` to narrate it, e.g. to narrate work done in other
+        threads in a predictable order.
+        """
+        recording = NarrationBackup(settings.KINKED_NARRATION_LIMIT)
+        backups_token = self._backups.set((recording,))
+        exit_level_token = self._exit_level.set(1)
+        try:
+            yield recording
+        finally:
+            self._backups.reset(backups_token)
+            self._exit_level.reset(exit_level_token)
+
+    def replay(self, recording: NarrationBackup) -> None:
+        """Narrate a recording as though it were narrated right here."""
+        if not self.cable_kinked:
+            narrations = _chainify(self._mention_dropped(recording))
+            for adapter in self.adapters:
+                self._entangle_chain(adapter, narrations)()
+            return
+
+        backup = self._backups.get()[-1]
+        shift = self.exit_level - 1
+        backup.dropped += recording.dropped
+        for channel, channel_kwargs, exit_level in recording:
+            backup.append((channel, channel_kwargs, exit_level + shift))
 
     def clear_backup(self) -> None:
         """Clear the backed-up narrations from a kinked cable."""
         if self.cable_kinked:
-            self.backed_up_narrations[-1].clear()
+            self._backups.get()[-1].clear()
 
     @contextmanager
     def _increase_exit_level(self) -> Generator:
@@ -131,16 +285,29 @@ class Narrator:
         if not self.cable_kinked:
             return
 
-        kinked_narrations = self.backed_up_narrations[-1]
-        if len(self.backed_up_narrations) > 1:
-            self.backed_up_narrations[-2].extend(kinked_narrations)
+        backups = self._backups.get()
+        kinked_narrations = backups[-1]
+        if len(backups) > 1:
+            backups[-2].extend(kinked_narrations)
         else:
-            narrations = _chainify(kinked_narrations)
+            narrations = _chainify(self._mention_dropped(kinked_narrations))
             for adapter in self.adapters:
-                narration_func = self._entangle_chain(adapter, deepcopy(narrations))
+                narration_func = self._entangle_chain(adapter, narrations)
                 narration_func()
         self.clear_backup()
 
+    @staticmethod
+    def _mention_dropped(backup: NarrationBackup) -> list[BackedUpNarration]:
+        """Add an aside to the backup, if any narrations had to be dropped."""
+        narrations = list(backup)
+        if backup.dropped:
+            exit_level = narrations[0][-1] if narrations else 1
+            plural = "s" if backup.dropped != 1 else ""
+            line = f"... {backup.dropped} earlier narration{plural} dropped ..."
+            aside_kwargs: dict[str, Kwargs] = {"func": lambda: "ssh", "line": line}
+            narrations.insert(0, ("aside", aside_kwargs, exit_level))
+        return narrations
+
     @contextmanager
     def _dummy_entangle(self, func: Callable) -> Generator:
         """Give back something that looks like an entangled func.
@@ -152,15 +319,26 @@ class Narrator:
         with self._increase_exit_level():
             yield func
 
-    def _entangle_chain(self, adapter: Adapter, chain: ChainedNarrations) -> Callable:
-        """Mimic narration entanglement from a backed-up narration chain."""
+    def _entangle_chain(
+        self,
+        adapter: Adapter,
+        chain: ChainedNarrations,
+        enclosing_func: Callable | None = None,
+    ) -> Callable:
+        """Mimic narration entanglement from a backed-up narration chain.
+
+        The chain is not modified, so it can be shared between adapters.
+        Enclosed narrations are entangled with their encloser's function
+        instead of the one they were backed up with.
+        """
         roots: list[Callable] = []
         for channel, channel_kwargs, enclosed in chain:
-            with self._entangle_func(channel, [adapter], **channel_kwargs) as root:
+            kwargs = channel_kwargs
+            if enclosing_func is not None:
+                kwargs = {**channel_kwargs, "func": enclosing_func}
+            with self._entangle_func(channel, [adapter], **kwargs) as root:
                 if enclosed:
-                    for _, enclosed_kwargs, _ in enclosed:
-                        enclosed_kwargs["func"] = root
-                    self._entangle_chain(adapter, enclosed)
+                    self._entangle_chain(adapter, enclosed, root)
                 roots.append(root)
 
         return lambda: [root() for root in roots]
@@ -181,6 +359,9 @@ class Narrator:
         """
         if adapters is None:
             adapters = self.adapters
+        if adapters and "line" in channel_kwargs:
+            # compose any LazyLines now that we know someone will hear them.
+            channel_kwargs["line"] = str(channel_kwargs["line"])
         exits = []
         enclosed_func = channel_kwargs["func"]
         for adapter in adapters:
@@ -206,11 +387,13 @@ class Narrator:
             raise UnableToNarrate(msg)
 
         if self.cable_kinked:
+            if self.adapters and "line" in channel_kws:
+                # compose the line now, so it tells of things as they were
+                # when it was spoken, not as they are when it is flushed.
+                channel_kws["line"] = str(channel_kws["line"])
             enclosed_func = self._dummy_entangle(channel_kws["func"])
             channel_kws["func"] = lambda: "overflow"
-            self.backed_up_narrations[-1].append(
-                (channel, channel_kws, self.exit_level)
-            )
+            self._backups.get()[-1].append((channel, channel_kws, self.exit_level))
         else:
             enclosed_func = self._entangle_func(channel, None, **channel_kws)
 
@@ -233,7 +416,7 @@ class Narrator:
         return self.narrate("scene", func=func, line=line, gravitas=gravitas)
 
     def stating_a_beat(
-        self, func: Callable, line: str, gravitas: str | None = None
+        self, func: Callable, line: str | LazyLine, gravitas: str | None = None
     ) -> ContextManager:
         """Narrate an emotional beat."""
         if not self.on_air:
@@ -241,7 +424,7 @@ class Narrator:
         return self.narrate("beat", func=func, line=line, gravitas=gravitas)
 
     def whispering_an_aside(
-        self, line: str, gravitas: str | None = None
+        self, line: str | LazyLine, gravitas: str | None = None
     ) -> ContextManager:
         """Narrate a conspiratorial aside (as a stage-whisper)."""
         if not self.on_air:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import wraps
 from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Callable, Generator, TypeVar
@@ -22,11 +23,26 @@ if TYPE_CHECKING:
 
 
 class StdOutManager:
-    """Handle the indentation, formatting, and log action for CLI logging."""
+    """Handle the indentation, formatting, and log action for CLI logging.
+
+    The indentation depth is tracked separately for each thread and asyncio
+    task, so concurrent performances are each indented correctly.
+    """
 
     def __init__(self, logger: logging.Logger | None = None) -> None:
         self.logger = logger or logging.getLogger("screenpy")
-        self.depth: list[str] = []
+        self._depth: ContextVar[tuple[str, ...]] = ContextVar(
+            f"depth_{id(self)}", default=()
+        )
+
+    @property
+    def depth(self) -> list[str]:
+        """The depth markers for the current indentation level."""
+        return list(self._depth.get())
+
+    @depth.setter
+    def depth(self, depth: list[str]) -> None:
+        self._depth.set(tuple(depth))
 
     @contextmanager
     def _indent(self) -> Generator:
@@ -35,18 +51,19 @@ class StdOutManager:
         # Keeping something created in this context alive in our depth gauge
         # will persist the context until we pop it off and discard it later!
         marker = "depth marker"
-        self.depth.append(marker)
+        self._depth.set((*self._depth.get(), marker))
         yield marker
 
     def _outdent(self) -> None:
         """Decrease the indentation level."""
-        if self.depth:
-            self.depth.pop()
+        depth = self._depth.get()
+        if depth:
+            self._depth.set(depth[:-1])
 
     def log(self, line: str, level: int = logging.INFO) -> None:
         """Log a line!"""
         whitespace = settings.INDENT_SIZE * settings.INDENT_CHAR
-        indent = len(self.depth) * whitespace if settings.INDENT_LOGS else ""
+        indent = len(self._depth.get()) * whitespace if settings.INDENT_LOGS else ""
         self.logger.log(level, f"{indent}{line}")
 
     @contextmanager
@@ -66,9 +83,10 @@ class StdOutAdapter:
     Examples::
 
         the_narrator.attach_adapter(StdOutAdapter())
-    """
 
-    handled_exception: Exception | None
+    The last error logged is kept separately for each thread and asyncio
+    task, so concurrent performances each log their own errors once.
+    """
 
     GRAVITAS = MappingProxyType(  # makes it immutable
         {
@@ -84,7 +102,18 @@ class StdOutAdapter:
         if stdout_manager is None:
             stdout_manager = StdOutManager()
         self.manager = stdout_manager
-        self.handled_exception = None
+        self._handled_exception: ContextVar[Exception | None] = ContextVar(
+            f"handled_exception_{id(self)}", default=None
+        )
+
+    @property
+    def handled_exception(self) -> Exception | None:
+        """The last error logged, so it is only logged once."""
+        return self._handled_exception.get()
+
+    @handled_exception.setter
+    def handled_exception(self, exc: Exception | None) -> None:
+        self._handled_exception.set(exc)
 
     def act(self, func: Callable, line: str, gravitas: str | None = None) -> Generator:
         """Wrap the act, to log the stylized title."""
@@ -9,9 +9,11 @@ from __future__ import annotations
 
 import re
 from functools import wraps
+from inspect import iscoroutinefunction
 from typing import TYPE_CHECKING, Callable, TypeVar
 
 from screenpy.narration import Narrator, StdOutAdapter
+from screenpy.narration.narrator import LazyLine
 from screenpy.speech_tools import represent_prop
 
 if TYPE_CHECKING:
@@ -22,6 +24,8 @@ if TYPE_CHECKING:
 
 the_narrator: Narrator = Narrator(adapters=[StdOutAdapter()])
 
+MARKER_PATTERN = re.compile(r"\{([^\}]+)}")
+
 
 def function_should_log_none(func: Callable[P, T]) -> bool:
     """Helper function to decide when to log return values.
@@ -95,6 +99,9 @@ def beat(
     will be replaced by the Actor's name, and "{target}" will be replaced
     using the Click action's ``target`` property (e.g. ``Click.target``).
 
+    Coroutine functions (like ``perform_as_async``) can be decorated too; the
+    beat lasts until the coroutine is finished.
+
     Args:
         line: the line spoken during this "beat" (the step description).
         gravitas: the severity for the narration of the line.
@@ -102,20 +109,54 @@ def beat(
     Returns:
         The decorated function, which will be narrated when called.
     """
+    # The line's markers only depend on the decorator's arguments, so we find
+    # them once here instead of every time the decorated function is called.
+    markers = tuple(MARKER_PATTERN.findall(line))
+    needs_formatting = "{" in line
 
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
-        @wraps(func)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        should_log_none = function_should_log_none(func)
+
+        def complete_the_line(args: tuple) -> str | LazyLine:
+            """Prepare the line, to be completed once someone will hear it."""
+            if not needs_formatting:
+                return line
+
             action = args[0] if len(args) > 0 else None
             actor = args[1] if len(args) > 1 else ""
-            markers = re.findall(r"\{([^\}]+)}", line)
-            cues = {mark: getattr(action, mark) for mark in markers}
 
-            completed_line = f"{line.format(actor, **cues)}"
+            def compose() -> str:
+                cues = {mark: getattr(action, mark) for mark in markers}
+                return line.format(actor, **cues)
+
+            return LazyLine(compose)
+
+        def mention(retval: object) -> None:
+            """Mention the return value, if there is one worth mentioning."""
+            if retval is not None or should_log_none:
+                aside(LazyLine(lambda: f"=> {represent_prop(retval)}"))
+
+        if iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+                completed_line = complete_the_line(args)
+                with the_narrator.stating_a_beat(
+                    func, completed_line, gravitas
+                ) as n_func:
+                    retval = await n_func(*args, **kwargs)
+                    mention(retval)
+                return retval
+
+            # func is a coroutine function, so T is already its Coroutine.
+            return async_wrapper  # type: ignore[return-value]
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            completed_line = complete_the_line(args)
             with the_narrator.stating_a_beat(func, completed_line, gravitas) as n_func:
                 retval = n_func(*args, **kwargs)
-                if retval is not None or function_should_log_none(func):
-                    aside(f"=> {represent_prop(retval)}")
+                mention(retval)
             return retval
 
         return wrapper
@@ -123,7 +164,7 @@ def beat(
     return decorator
 
 
-def aside(line: str, gravitas: str | None = None) -> None:
+def aside(line: str | LazyLine, gravitas: str | None = None) -> None:
     """A line spoken in a stage whisper to the audience (log a message).
 
     Args:
@@ -0,0 +1,179 @@
+"""Polling schedules, which decide how long to wait between attempts.
+
+These are used by :class:`~screenpy.actions.Eventually` to space out its
+attempts. Each schedule stretches the base polling period differently::
+
+    Eventually(See.the(Number.of(ORDERS), IsEqualTo(3))).polling_with(
+        Capped(DecorrelatedJitter(), at=5)
+    )
+
+The default schedule is chosen with the ``POLLING_SCHEDULE`` and
+``POLLING_CAP`` settings.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from typing import TYPE_CHECKING
+
+from screenpy.exceptions import UnableToAct
+
+if TYPE_CHECKING:
+    from typing import Callable, Iterator
+
+    from screenpy.protocols import PollingSchedule
+
+# how far schedules can grow, so long polls never overflow.
+LONGEST_DELAY = sys.float_info.max
+
+
+class Constant:
+    """Wait the same polling period between every attempt.
+
+    Examples::
+
+        Constant().delays(0.5)  # 0.5, 0.5, 0.5, 0.5, ...
+    """
+
+    def delays(self, base: float) -> Iterator[float]:
+        """Wait for the base polling period, forever."""
+        while True:
+            yield base
+
+    def __repr__(self) -> str:
+        """Represent the schedule the way it was built."""
+        return "Constant()"
+
+
+class Exponential:
+    """Multiply the wait by a factor after every attempt.
+
+    Examples::
+
+        Exponential().delays(0.5)  # 0.5, 1, 2, 4, 8, ...
+
+        Exponential(factor=1.5).delays(1)  # 1, 1.5, 2.25, 3.375, ...
+    """
+
+    def delays(self, base: float) -> Iterator[float]:
+        """Grow the wait exponentially from the base polling period."""
+        delay = float(base)
+        while True:
+            yield delay
+            # floats grow to infinity instead of overflowing, e.g. when Capped.
+            delay *= self.factor
+
+    def __repr__(self) -> str:
+        """Represent the schedule the way it was built."""
+        return f"Exponential(factor={self.factor})"
+
+    def __init__(self, factor: float = 2) -> None:
+        if factor < 1:
+            msg = f"Exponential backoff needs a factor of at least 1, not {factor}."
+            raise UnableToAct(msg)
+        self.factor = factor
+
+
+class Fibonacci:
+    """Grow the wait along the Fibonacci sequence.
+
+    Examples::
+
+        Fibonacci().delays(0.5)  # 0.5, 0.5, 1, 1.5, 2.5, 4, ...
+    """
+
+    def delays(self, base: float) -> Iterator[float]:
+        """Grow the wait from the base polling period, more gently."""
+        current, following = 1.0, 1.0
+        while True:
+            yield base * current
+            # stop growing, instead of overflowing on a long (Capped) poll.
+            current, following = following, min(current + following, LONGEST_DELAY)
+
+    def __repr__(self) -> str:
+        """Represent the schedule the way it was built."""
+        return "Fibonacci()"
+
+
+class DecorrelatedJitter:
+    """Pick a random wait, up to a factor longer than the previous wait.
+
+    Spreading the waits out randomly keeps many Actors polling the same
+    backend from all asking at once.
+
+    Examples::
+
+        DecorrelatedJitter().delays(0.5)  # 0.5, ~0.9, ~1.8, ~1.1, ...
+    """
+
+    def delays(self, base: float) -> Iterator[float]:
+        """Wait a random time between the base and the last wait, stretched."""
+        delay = base
+        while True:
+            yield delay
+            delay = self.rng.uniform(base, min(delay * self.factor, LONGEST_DELAY))
+
+    def __repr__(self) -> str:
+        """Represent the schedule the way it was built."""
+        return f"DecorrelatedJitter(factor={self.factor})"
+
+    def __init__(self, factor: float = 3, rng: random.Random | None = None) -> None:
+        if factor < 1:
+            msg = f"Decorrelated jitter needs a factor of at least 1, not {factor}."
+            raise UnableToAct(msg)
+        self.factor = factor
+        self.rng = rng or random.Random()
+
+
+class Capped:
+    """Never wait longer than the cap, whatever the schedule says.
+
+    Examples::
+
+        Capped(Exponential(), at=3).delays(0.5)  # 0.5, 1, 2, 3, 3, ...
+    """
+
+    def delays(self, base: float) -> Iterator[float]:
+        """Cut each of the wrapped schedule's waits down to the cap."""
+        for delay in self.schedule.delays(base):
+            yield min(delay, self.cap)
+
+    def __repr__(self) -> str:
+        """Represent the schedule the way it was built."""
+        return f"Capped({self.schedule!r}, at={self.cap})"
+
+    def __init__(self, schedule: PollingSchedule, at: float) -> None:
+        self.schedule = schedule
+        self.cap = at
+
+
+SCHEDULES: dict[str, Callable[[], PollingSchedule]] = {
+    "constant": Constant,
+    "exponential": Exponential,
+    "fibonacci": Fibonacci,
+    "decorrelated jitter": DecorrelatedJitter,
+}
+
+
+def schedule_named(name: str, cap: float | None = None) -> PollingSchedule:
+    """Build one of the named polling schedules, optionally capped.
+
+    Args:
+        name: one of "constant", "exponential", "fibonacci", or
+            "decorrelated jitter".
+        cap: the longest any wait may be, in seconds.
+
+    Returns:
+        The requested polling schedule.
+    """
+    try:
+        schedule = SCHEDULES[name.lower()]()
+    except KeyError:
+        known = ", ".join(f'"{known}"' for known in SCHEDULES)
+        msg = f'There is no polling schedule named "{name}". Try one of {known}.'
+        raise UnableToAct(msg) from None
+
+    if cap is not None:
+        return Capped(schedule, at=cap)
+    return schedule
@@ -7,22 +7,34 @@ For example, any class that implements ``perform_as`` is a Performable and
 can be an Action, any class that implements ``answered_by`` is an Answerable
 and can be a Question, etc. For more information on structural subtyping, see
 https://mypy.readthedocs.io/en/stable/protocols.html
+
+Checking ``isinstance`` against a Protocol looks up every one of its members
+on the object, every time. ScreenPy checks its -ables very often, so it uses
+:func:`conforms_to` instead, which works out once for each class which
+members the class itself provides.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+import inspect
+from types import WrapperDescriptorType
+from typing import TYPE_CHECKING, Generic, Protocol, TypeVar, runtime_checkable
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
-    from typing import Any, Callable, Generator
+    from typing import Any, Callable, Generator, Hashable, Iterator, Sequence
 
     from hamcrest.core.base_matcher import Matcher
+    from typing_extensions import Self, TypeIs
 
     from .actor import Actor
+    from .telemetry import RetryRecord
 
 
 # pylint: disable=unused-argument
 
+P = TypeVar("P")
+
 
 @runtime_checkable
 class Answerable(Protocol):
@@ -40,6 +52,77 @@ class Answerable(Protocol):
         """
 
 
+@runtime_checkable
+class AsyncAnswerable(Protocol):
+    """Questions which can be answered asynchronously are AsyncAnswerable."""
+
+    # ANN401 ignored here so any Question can fulfill this protocol.
+    async def answered_by_async(self, the_actor: Actor) -> Any:  # noqa: ANN401
+        """Pose the Question to the Actor, who will await the answer.
+
+        Args:
+            the_actor: the Actor who will answer this Question.
+
+        Returns:
+            The answer, based on the sleuthing the Actor has done.
+        """
+
+
+@runtime_checkable
+class BatchAnswerable(Protocol):
+    """Questions which can be answered together with similar Questions.
+
+    Questions of the same class with the same batch key are answered with a
+    single call to ``answered_by_all``, e.g. one request for a REST resource
+    instead of one request per Question about it.
+    """
+
+    # ANN401 ignored here so any Question can fulfill this protocol.
+    def answered_by(self, the_actor: Actor) -> Any:  # noqa: ANN401
+        """Pose the Question to the Actor, who will attempt to answer.
+
+        Args:
+            the_actor: the Actor who will answer this Question.
+
+        Returns:
+            The answer, based on the sleuthing the Actor has done.
+        """
+
+    def batch_key(self) -> Hashable:
+        """Name the batch this Question can be answered with.
+
+        Returns:
+            A key which is equal for all Questions that can be answered
+            together, e.g. the URL of the resource they ask about.
+        """
+
+    def answered_by_all(
+        self, the_actor: Actor, questions: Sequence[Self]
+    ) -> Sequence[Any]:
+        """Pose all the Questions to the Actor at once.
+
+        Args:
+            the_actor: the Actor who will answer these Questions.
+            questions: every Question in the batch, including this one. They
+                are all of this Question's class, with its batch key.
+
+        Returns:
+            The answers, in the same order as the Questions.
+        """
+
+
+@runtime_checkable
+class AsyncPerformable(Protocol):
+    """Actions and Tasks which can be performed asynchronously."""
+
+    async def perform_as_async(self, the_actor: Actor) -> None:
+        """Direct the Actor to perform this Action, awaiting its completion.
+
+        Args:
+            the_actor: the Actor who will perform this Action.
+        """
+
+
 @runtime_checkable
 class Describable(Protocol):
     """Classes that describe themselves are Describable."""
@@ -69,7 +152,15 @@ class Forgettable(Protocol):
 
 @runtime_checkable
 class Performable(Protocol):
-    """Actions and Tasks are Performable."""
+    """Actions and Tasks are Performable.
+
+    Performing one makes any answers remembered in an
+    :class:`~screenpy.answer_cache.AnswerCache` be forgotten, since it may
+    have changed them. Actions which only look at the application, like
+    :class:`~screenpy.actions.See`, can set ``changes_answers = False`` on
+    their class to keep the answers. It is optional; without it, the answers
+    are forgotten.
+    """
 
     def perform_as(self, the_actor: Actor) -> None:
         """Direct the Actor to perform this Action.
@@ -79,6 +170,21 @@ class Performable(Protocol):
         """
 
 
+@runtime_checkable
+class PollingSchedule(Protocol):
+    """Polling schedules space out the attempts of things that poll."""
+
+    def delays(self, base: float) -> Iterator[float]:
+        """Yield how long to wait before each subsequent attempt.
+
+        Args:
+            base: the polling period (in seconds) to build the schedule from.
+
+        Yields:
+            The number of seconds to wait before the next attempt.
+        """
+
+
 @runtime_checkable
 class Resolvable(Protocol):
     """Resolutions are Resolvable."""
@@ -91,6 +197,18 @@ class Resolvable(Protocol):
         """
 
 
+@runtime_checkable
+class RetryCollector(Protocol):
+    """Telemetry collectors are RetryCollector(s)."""
+
+    def collect(self, record: RetryRecord) -> None:
+        """Take note of how a performance of something that retries went.
+
+        Args:
+            record: the attempts, timings, and errors of the performance.
+        """
+
+
 @runtime_checkable
 class Adapter(Protocol):
     """Required functions for an adapter to the Narrator's microphone.
@@ -134,3 +252,110 @@ class Adapter(Protocol):
 
         Pass keyword arguments for specific adapters' needs.
         """
+
+
+# set on classes which can't be changed, like the built-in types (3.10+).
+IMMUTABLE_TYPE = 1 << 8
+
+# for each class, the members of each Protocol its instances have to have
+# themselves (or None if they never can), or None if its instances could get
+# their members some other way.
+_unprovided: WeakKeyDictionary[type, dict[type, tuple[str, ...] | None] | None] = (
+    WeakKeyDictionary()
+)
+
+
+def conforms_to(item: object, protocol: type[P]) -> TypeIs[P]:
+    """Check if the item follows the Protocol, like ``isinstance`` would.
+
+    The members of the Protocol which the item's class provides are only
+    looked up the first time an instance of that class is checked. Any other
+    members, like attributes set in ``__init__``, are looked for on the item
+    itself each time (unless the item couldn't have them, like a ``str``).
+    Items whose classes could provide members some other
+    way, like mocks and proxies with a ``__getattr__``, are always checked
+    with ``isinstance``.
+
+    Args:
+        item: the object to check.
+        protocol: the runtime-checkable Protocol it might follow.
+
+    Returns:
+        bool: whether the item follows the Protocol.
+    """
+    cls = type(item)
+    try:
+        known = _unprovided[cls]
+    except KeyError:
+        known = _unprovided[cls] = {} if _is_trustworthy(cls) else None
+    if known is None or item.__class__ is not cls:
+        return isinstance(item, protocol)
+
+    try:
+        unprovided = known[protocol]
+    except KeyError:
+        if not getattr(protocol, "_is_runtime_protocol", False):
+            return isinstance(item, protocol)
+        unprovided = known[protocol] = _unprovided_members(cls, protocol)
+    if unprovided is None:
+        return False
+    return all(hasattr(item, name) for name in unprovided)
+
+
+def forget_conformance() -> None:
+    """Forget which Protocol members each class provides.
+
+    Only needed if a member a class provided was deleted from it afterward.
+    """
+    _unprovided.clear()
+
+
+def _is_trustworthy(cls: type) -> bool:
+    """Check that the class's instances only get attributes the usual way."""
+    # built-in types have their own (ordinary) __getattribute__ slot wrappers.
+    return not hasattr(cls, "__getattr__") and isinstance(
+        cls.__getattribute__, WrapperDescriptorType
+    )
+
+
+def _members_of(protocol: type) -> tuple[str, ...]:
+    """Find the names of the methods and attributes the Protocol asks for."""
+    members = getattr(protocol, "__protocol_attrs__", None)
+    if members is None:  # before Python 3.12
+        members = {
+            name
+            for base in protocol.__mro__[:-1]
+            if base not in (Protocol, Generic)
+            for name in (*vars(base), *vars(base).get("__annotations__", {}))
+            if not name.startswith("_")
+        }
+    return tuple(sorted(members))
+
+
+def _unprovided_members(cls: type, protocol: type) -> tuple[str, ...] | None:
+    """Find the members of the Protocol the class doesn't provide for sure.
+
+    Data descriptors, like properties and slots, might still be missing on
+    an instance, so those are looked for on each instance too.
+
+    Returns:
+        The names to look for on each instance, or None if its instances
+        can't have them, because they have no ``__dict__`` and their class
+        can't be changed.
+    """
+    sealed = getattr(cls, "__dictoffset__", -1) == 0 and bool(
+        getattr(cls, "__flags__", 0) & IMMUTABLE_TYPE
+    )
+    unprovided = []
+    for name in _members_of(protocol):
+        try:
+            attribute = inspect.getattr_static(cls, name)
+        except AttributeError:
+            if sealed:
+                return None
+            unprovided.append(name)
+            continue
+        kind = type(attribute)
+        if hasattr(kind, "__set__") or hasattr(kind, "__delete__"):
+            unprovided.append(name)
+    return tuple(unprovided)
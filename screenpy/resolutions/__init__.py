@@ -4,6 +4,7 @@ When combined with a Question, the Question + Resolution pair make up the test
 assertions in Screenplay Pattern.
 """
 
+from .across_pages import AcrossPages
 from .base_resolution import BaseResolution
 from .contains_item_matching import ContainsItemMatching
 from .contains_the_entry import ContainsTheEntry
@@ -12,6 +13,7 @@ from .contains_the_key import ContainsTheKey
 from .contains_the_text import ContainsTheText
 from .contains_the_value import ContainsTheValue
 from .ends_with import EndsWith
+from .every_number import EveryNumber
 from .has_length import HasLength
 from .is_close_to import IsCloseTo
 from .is_empty import IsEmpty
@@ -27,16 +29,20 @@ from .reads_exactly import ReadsExactly
 from .starts_with import StartsWith
 
 # Natural-language-enabling syntactic sugar
+AcrossThePages = AcrossPages
 CloseTo = IsCloseTo
-ContainItemMatching = ContainsItemMatching
+ContainItemMatching = ContainItemsMatching = ContainsItemsMatching = (
+    ContainsItemMatching
+)
 ContainTheEntry = ContainTheEntries = ContainsTheEntries = ContainsTheEntry
-ContainTheItem = ContainsTheItem
+ContainTheItem = ContainTheItems = ContainsTheItems = ContainsTheItem
 ContainTheKey = ContainsTheKey
 ContainTheText = ContainsTheText
-ContainTheValue = ContainsTheValue
+ContainTheValue = ContainTheValues = ContainsTheValues = ContainsTheValue
 DoesNot = DoNot = IsNot
 Empty = IsEmpty
 EndWith = EndsWith
+AllNumbers = EachNumber = EveryNumber
 HaveLength = HasLength
 IsEqual = Equals = Equal = EqualTo = IsEqualTo
 GreaterThan = IsGreaterThan
@@ -50,29 +56,40 @@ StartWith = StartsWith
 
 
 __all__ = [
+    "AcrossPages",
+    "AcrossThePages",
+    "AllNumbers",
     "BaseResolution",
     "ContainItemMatching",
+    "ContainItemsMatching",
     "ContainsItemMatching",
+    "ContainsItemsMatching",
     "ContainsTheEntries",
     "ContainsTheEntry",
     "ContainsTheItem",
+    "ContainsTheItems",
     "ContainsTheKey",
     "ContainsTheText",
     "ContainsTheValue",
+    "ContainsTheValues",
     "ContainTheEntries",
     "ContainTheEntry",
     "ContainTheItem",
+    "ContainTheItems",
     "ContainTheKey",
     "ContainTheText",
     "ContainTheValue",
+    "ContainTheValues",
     "DoesNot",
     "DoNot",
     "Empty",
     "EndsWith",
     "EndWith",
+    "EachNumber",
     "Equal",
     "Equals",
     "EqualTo",
+    "EveryNumber",
     "GreaterThan",
     "GreaterThanOrEqualTo",
     "HasLength",
@@ -0,0 +1,62 @@
+"""Matches the items in pages, like those from a paginated API."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from screenpy.pacing import beat
+from screenpy.speech_tools import get_additive_description
+
+from .custom_matchers.across_pages import across_pages
+from .matcher_cache import cache_matcher
+
+if TYPE_CHECKING:
+    from typing import Any, Iterable
+
+    from hamcrest.core.matcher import Matcher
+
+    from screenpy.protocols import Resolvable
+
+
+class AcrossPages:
+    """Match the items in all the pages against another Resolution.
+
+    For Questions which answer with pages of items, like a generator which
+    fetches each page of a paginated API as it is needed. The items are
+    given to the other Resolution one at a time, so they are never all held
+    in memory. This works best with Resolutions which stop looking once
+    they know the answer: :class:`~screenpy.resolutions.ContainsItemMatching`,
+    :class:`~screenpy.resolutions.ContainsTheItem`,
+    :class:`~screenpy.resolutions.HasLength`, and
+    :class:`~screenpy.resolutions.IsEmpty`.
+
+    Examples::
+
+        the_actor.should(
+            See.the(PagesOf.the(ORDERS_ENDPOINT), AcrossPages(HasLength(250)))
+        )
+
+        the_actor.should(
+            See.the(
+                PagesOf.the(SEARCH_RESULTS), AcrossThePages(ContainsTheItem("Droids"))
+            )
+        )
+    """
+
+    @property
+    def resolution_to_log(self) -> str:
+        """Represent the Resolution in a log-friendly way."""
+        return get_additive_description(self.resolution)
+
+    def describe(self) -> str:
+        """Describe the Resolution's expectation."""
+        return f"Across the pages, {self.resolution_to_log}."
+
+    @beat("... hoping that across the pages, it's {resolution_to_log}.")
+    @cache_matcher
+    def resolve(self) -> Matcher[Iterable[Iterable[Any]]]:
+        """Produce the Matcher to make the assertion."""
+        return across_pages(self.resolution.resolve())
+
+    def __init__(self, resolution: Resolvable) -> None:
+        self.resolution = resolution
@@ -1,33 +1,72 @@
-"""Matches a sequence which contains an item matching a given regex pattern."""
+"""Matches a sequence which contains items matching the given regex pattern(s)."""
 
-from typing import Sequence
+from __future__ import annotations
 
-from hamcrest.core.matcher import Matcher
+from typing import TYPE_CHECKING, Iterable, Pattern
 
+from screenpy.exceptions import UnableToFormResolution
 from screenpy.pacing import beat
 
-from .custom_matchers.sequence_containing_pattern import has_item_matching
+from .custom_matchers.sequence_containing_pattern import (
+    has_item_matching,
+    has_items_matching,
+)
+from .matcher_cache import cache_matcher
+
+if TYPE_CHECKING:
+    from hamcrest.core.matcher import Matcher
 
 
 class ContainsItemMatching:
     """Match a sequence containing an item matching a regular expression.
 
+    Given several patterns, match a sequence containing an item matching
+    each of them. The sequence is only looked through once, so it may be a
+    generator. If the assertion fails, the patterns which were matched are
+    listed with the index of the item that matched them.
+
     Examples::
 
         the_actor.should(
             # matches "Spam...", "Spam spam...", "Spam spam spam..."
             See.the(Text.of_all(MENU_ITEMS), ContainsItemMatching(r"^([Ss]pam ?)+"))
         )
+
+        the_actor.should(
+            See.the(
+                Text.of_all(MENU_ITEMS),
+                ContainsItemsMatching(r"^Spam", r"[Ee]ggs", re.compile(r"^Lobster")),
+            )
+        )
     """
 
+    @property
+    def patterns_to_log(self) -> str:
+        """Represent the pattern(s) in a log-friendly way."""
+        sources = [
+            pattern.pattern if isinstance(pattern, Pattern) else pattern
+            for pattern in self.patterns
+        ]
+        if len(sources) == 1:
+            return f'the pattern r"{sources[0]}"'
+        patterns = ", ".join(f'r"{source}"' for source in sources)
+        return f"each of the patterns {patterns}"
+
     def describe(self) -> str:
         """Describe the Resolution's expectation."""
-        return f'A sequence with an item matching the pattern r"{self.pattern}".'
+        return f"A sequence with an item matching {self.patterns_to_log}."
 
-    @beat('... hoping it contains an item matching the pattern r"{pattern}".')
-    def resolve(self) -> Matcher[Sequence[str]]:
+    @beat("... hoping it contains an item matching {patterns_to_log}.")
+    @cache_matcher
+    def resolve(self) -> Matcher[Iterable[str]]:
         """Produce the Matcher to make the assertion."""
-        return has_item_matching(self.pattern)
+        if len(self.patterns) == 1:
+            return has_item_matching(self.patterns[0])
+        return has_items_matching(*self.patterns)
 
-    def __init__(self, pattern: str) -> None:
-        self.pattern = pattern
+    def __init__(self, *patterns: str | Pattern[str]) -> None:
+        if not patterns:
+            msg = f"{self.__class__.__name__} needs at least one pattern to match."
+            raise UnableToFormResolution(msg)
+        self.patterns = patterns
+        self.pattern = patterns[0]
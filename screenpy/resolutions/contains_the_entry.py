@@ -10,6 +10,8 @@ from screenpy.exceptions import UnableToFormResolution
 from screenpy.pacing import beat
 from screenpy.speech_tools import represent_prop
 
+from .matcher_cache import cache_matcher
+
 if TYPE_CHECKING:
     from hamcrest.core.matcher import Matcher
 
@@ -54,6 +56,7 @@ class ContainsTheEntry:
         return f"A mapping with the {self.entry_plural} {self.entries_to_log}."
 
     @beat("... hoping it's a mapping with the {entry_plural} {entries_to_log}")
+    @cache_matcher
     def resolve(self) -> Matcher[Mapping]:
         """Produce the Matcher to make the assertion."""
         return has_entries(**self.entries)
@@ -1,14 +1,16 @@
-"""Matches a list that contains the desired item."""
+"""Matches a list that contains the desired item(s)."""
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Generic, Sequence, TypeVar
-
-from hamcrest import has_item
+from typing import TYPE_CHECKING, Generic, Iterable, TypeVar
 
+from screenpy.exceptions import UnableToFormResolution
 from screenpy.pacing import beat
 from screenpy.speech_tools import represent_prop
 
+from .custom_matchers.has_all_items import has_all_items
+from .matcher_cache import cache_matcher, forget_matcher
+
 if TYPE_CHECKING:
     from hamcrest.core.matcher import Matcher
 
@@ -16,28 +18,56 @@ T = TypeVar("T")
 
 
 class ContainsTheItem(Generic[T]):
-    """Match an iterable containing a specific item.
+    """Match an iterable containing a specific item, or several items.
+
+    Each element of the iterable is looked at once, however many items are
+    expected, and only until they have all been found, so the iterable may
+    be a generator. If the assertion fails, only the missing items are
+    listed.
+
+    The expected items are kept in ``items``. ``item`` still gives the item,
+    if only one was given (or all of the items, if several were).
 
     Examples::
 
         the_actor.should(
             See.the(Text.of_all(SEARCH_RESULTS), ContainsTheItem("The Droids"))
         )
+
+        the_actor.should(
+            See.the(OrderIds.in_the(REPORT), ContainsTheItems(1138, 2187, 8086))
+        )
     """
 
+    items: tuple[T, ...]
+
+    @property
+    def item(self) -> T | tuple[T, ...]:
+        """The expected item, or all of them if there are several."""
+        return self.items[0] if len(self.items) == 1 else self.items
+
+    @item.setter
+    def item(self, item: T) -> None:
+        self.items = (item,)
+        forget_matcher(self)
+
     @property
-    def item_to_log(self) -> str | T:
-        """Represent the item in a log-friendly way."""
-        return represent_prop(self.item)
+    def item_to_log(self) -> str:
+        """Represent the item(s) in a log-friendly way."""
+        return ", ".join(represent_prop(item) for item in self.items)
 
     def describe(self) -> str:
         """Describe the Resolution's expectation."""
         return f"A sequence containing {self.item_to_log}."
 
     @beat("... hoping it contains {item_to_log}.")
-    def resolve(self) -> Matcher[Sequence[T]]:
+    @cache_matcher
+    def resolve(self) -> Matcher[Iterable[T]]:
         """Produce the Matcher to make the assertion."""
-        return has_item(self.item)
+        return has_all_items(*self.items)
 
-    def __init__(self, item: T) -> None:
-        self.item = item
+    def __init__(self, *items: T) -> None:
+        if not items:
+            msg = f"{self.__class__.__name__} needs at least one item to look for."
+            raise UnableToFormResolution(msg)
+        self.items = items
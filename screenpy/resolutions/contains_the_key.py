@@ -9,6 +9,8 @@ from hamcrest import has_key
 from screenpy.pacing import beat
 from screenpy.speech_tools import represent_prop
 
+from .matcher_cache import cache_matcher
+
 if TYPE_CHECKING:
     from hamcrest.core.matcher import Matcher
 
@@ -33,6 +35,7 @@ class ContainsTheKey(Generic[K]):
         return f"Containing the key {self.key_to_log}."
 
     @beat("... hoping it's a dict containing the key {key_to_log}.")
+    @cache_matcher
     def resolve(self) -> Matcher[Mapping[K, Any]]:
         """Produce the Matcher to make the assertion."""
         return has_key(self.key)
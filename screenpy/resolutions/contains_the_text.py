@@ -6,6 +6,8 @@ from hamcrest.core.matcher import Matcher
 from screenpy.pacing import beat
 from screenpy.speech_tools import represent_prop
 
+from .matcher_cache import cache_matcher
+
 
 class ContainsTheText:
     """Match a specific substring of a string.
@@ -27,6 +29,7 @@ class ContainsTheText:
         return f"Containing the text {self.text_to_log}."
 
     @beat("... hoping it contains {text_to_log}.")
+    @cache_matcher
     def resolve(self) -> Matcher[str]:
         """Produce the Matcher to make the assertion."""
         return contains_string(self.text)
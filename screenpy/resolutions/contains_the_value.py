@@ -1,14 +1,16 @@
-"""Matches a dictionary that contains a specific value."""
+"""Matches a dictionary that contains the specified value(s)."""
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Generic, Mapping, TypeVar
 
-from hamcrest import has_value
-
+from screenpy.exceptions import UnableToFormResolution
 from screenpy.pacing import beat
 from screenpy.speech_tools import represent_prop
 
+from .custom_matchers.has_all_items import has_all_values
+from .matcher_cache import cache_matcher, forget_matcher
+
 if TYPE_CHECKING:
     from hamcrest.core.matcher import Matcher
 
@@ -16,28 +18,59 @@ V = TypeVar("V")
 
 
 class ContainsTheValue(Generic[V]):
-    """Match a dictionary containing a specific value.
+    """Match a dictionary containing a specific value, or several values.
+
+    Each value of the dictionary is looked at once, however many values are
+    expected. If the assertion fails, only the missing values are listed.
+
+    The expected values are kept in ``values``. ``value`` still gives the
+    value, if only one was given (or all of the values, if several were).
 
     Examples::
 
         the_actor.should(
             See.the(Cookies(), ContainTheValue("pumpernickle"))
         )
+
+        the_actor.should(
+            See.the(Cookies(), ContainsTheValues("rye", "sourdough"))
+        )
     """
 
+    values: tuple[V, ...]
+
+    @property
+    def value(self) -> V | tuple[V, ...]:
+        """The expected value, or all of them if there are several."""
+        return self.values[0] if len(self.values) == 1 else self.values
+
+    @value.setter
+    def value(self, value: V) -> None:
+        self.values = (value,)
+        forget_matcher(self)
+
+    @property
+    def value_plural(self) -> str:
+        """Decide if we need "value" or "values" in the beat message."""
+        return "values" if len(self.values) != 1 else "value"
+
     @property
-    def value_to_log(self) -> str | V:
-        """Represent the value in a log-friendly way."""
-        return represent_prop(self.value)
+    def value_to_log(self) -> str:
+        """Represent the value(s) in a log-friendly way."""
+        return ", ".join(represent_prop(value) for value in self.values)
 
     def describe(self) -> str:
         """Describe the Resolution's expectation."""
-        return f"Containing the value {self.value_to_log}."
+        return f"Containing the {self.value_plural} {self.value_to_log}."
 
-    @beat("... hoping it contains the value {value_to_log}.")
+    @beat("... hoping it contains the {value_plural} {value_to_log}.")
+    @cache_matcher
     def resolve(self) -> Matcher[Mapping[Any, V]]:
         """Produce the Matcher to form the assertion."""
-        return has_value(self.value)
+        return has_all_values(*self.values)
 
-    def __init__(self, value: V) -> None:
-        self.value = value
+    def __init__(self, *values: V) -> None:
+        if not values:
+            msg = f"{self.__class__.__name__} needs at least one value to look for."
+            raise UnableToFormResolution(msg)
+        self.values = values
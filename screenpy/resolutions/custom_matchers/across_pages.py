@@ -0,0 +1,80 @@
+"""Matcher which matches pages of items as one iterable of items.
+
+For example:
+
+    assert_that(iter([[1, 2], [3]]), across_pages(has_length_of(3)))
+
+The pages are only fetched as the other Matcher gets to them, so a Matcher
+which stops early (like :func:`~.has_all_items.has_all_items`) may never
+ask for the last pages.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+from hamcrest.core.string_description import StringDescription
+
+from .stream_matcher import IsStreamMatching
+
+if TYPE_CHECKING:
+    from hamcrest.core.description import Description
+    from hamcrest.core.matcher import Matcher
+
+
+def _items_in(pages: Iterable[Iterable[Any]]) -> Iterator[Any]:
+    """Give the items of each page in turn, fetching pages as they're needed.
+
+    A generator, unlike ``itertools.chain``, can be referred to weakly, so
+    the Matcher looking through it does not keep it (or the pages) alive.
+    """
+    for page in pages:
+        yield from page
+
+
+class IsAcrossPages(IsStreamMatching):
+    """Matches the items in all of the pages with another Matcher.
+
+    One-shot pages, like a generator of pages, are only looked through once.
+    If they don't match, the mismatch is described right away, while the
+    items are still at hand. Nothing refers to the pages after that, so they
+    can be let go of.
+    """
+
+    def __init__(self, matcher: Matcher[Any]) -> None:
+        self.matcher = matcher
+
+    def _mismatch_for(self, item: Iterable[Any]) -> str | None:
+        """Match the items of all the pages, describing them if they don't."""
+        try:
+            items = _items_in(item)
+            if self.matcher.matches(items):
+                return None
+        except TypeError:  # not pages
+            return "was not pages of items"
+        if not isinstance(item, Iterator):
+            # the pages can be looked through again, for a fresh description.
+            items = _items_in(item)
+        description = StringDescription()
+        self.matcher.describe_mismatch(items, description)
+        return str(description)
+
+    def describe_to(self, description: Description) -> None:
+        """Describe the passing case."""
+        description.append_text("pages of items which are, together, ")
+        self.matcher.describe_to(description)
+
+    def describe_match(
+        self, item: Iterable[Any], match_description: Description
+    ) -> None:
+        """Describe the match, for use with IsNot."""
+        if isinstance(item, Iterator):
+            # the pages were used up matching them.
+            super().describe_match(item, match_description)
+            return
+        self.matcher.describe_match(_items_in(item), match_description)
+
+
+def across_pages(matcher: Matcher[Any]) -> IsAcrossPages:
+    """Matches pages of items whose items, together, match the Matcher."""
+    return IsAcrossPages(matcher)
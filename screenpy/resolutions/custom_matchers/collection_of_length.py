@@ -0,0 +1,61 @@
+"""Matcher for the length of a collection, which may be an iterator.
+
+For example:
+
+    assert_that([1, 2, 3], has_length_of(3))
+    assert_that(fetch_every_page(ORDERS), has_length_of(250))
+
+Collections which know their length are asked for it. Other iterables are
+counted, but only until there are more elements than expected.
+"""
+
+from __future__ import annotations
+
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Iterable, Sized
+
+from hamcrest import has_length
+from hamcrest.core.string_description import StringDescription
+
+from .stream_matcher import IsStreamMatching, Seen
+
+if TYPE_CHECKING:
+    from hamcrest.core.description import Description
+
+
+class IsCollectionOfLength(IsStreamMatching):
+    """Matches a collection, or iterable, with the expected length."""
+
+    def __init__(self, length: int) -> None:
+        self.length = length
+        self.sized = has_length(length)
+
+    def _mismatch_for(self, item: Iterable[Any]) -> str | None:
+        if isinstance(item, Sized):
+            if self.sized.matches(item):
+                return None
+            description = StringDescription()
+            self.sized.describe_mismatch(item, description)
+            return str(description)
+
+        try:
+            seen = Seen(item)
+        except TypeError:
+            return "was not a collection"
+        for _ in islice(seen, self.length + 1):
+            pass
+        if seen.count == self.length:
+            return None
+        if seen.count > self.length:
+            return f"had more than {self.length} items: {seen.shown()}"
+        item_plural = "item" if seen.count == 1 else "items"
+        return f"had only {seen.count} {item_plural}: {seen.shown()}"
+
+    def describe_to(self, description: Description) -> None:
+        """Describe the passing case."""
+        self.sized.describe_to(description)
+
+
+def has_length_of(length: int) -> IsCollectionOfLength:
+    """Matches a collection, or iterable, of the given length."""
+    return IsCollectionOfLength(length)
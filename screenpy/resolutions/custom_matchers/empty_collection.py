@@ -0,0 +1,56 @@
+"""Matcher for an empty collection, which may be an iterator.
+
+For example:
+
+    assert_that([], is_empty_collection())
+    assert_that(fetch_every_page(ERRORS), is_empty_collection())
+
+Collections which know their length are asked for it. Other iterables are
+only asked for their first element.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterable, Sized
+
+from hamcrest import empty
+from hamcrest.core.string_description import StringDescription
+
+from .stream_matcher import IsStreamMatching
+
+if TYPE_CHECKING:
+    from hamcrest.core.description import Description
+
+NOTHING = object()
+
+
+class IsEmptyCollection(IsStreamMatching):
+    """Matches a collection, or iterable, with nothing in it."""
+
+    def __init__(self) -> None:
+        self.sized = empty()
+
+    def _mismatch_for(self, item: Iterable[Any]) -> str | None:
+        if isinstance(item, Sized):
+            if self.sized.matches(item):
+                return None
+            description = StringDescription()
+            self.sized.describe_mismatch(item, description)
+            return str(description)
+
+        try:
+            first = next(iter(item), NOTHING)
+        except TypeError:
+            return "was not a collection"
+        if first is NOTHING:
+            return None
+        return f"was not empty, starting with {first!r}"
+
+    def describe_to(self, description: Description) -> None:
+        """Describe the passing case."""
+        self.sized.describe_to(description)
+
+
+def is_empty_collection() -> IsEmptyCollection:
+    """Matches a collection, or iterable, with nothing in it."""
+    return IsEmptyCollection()
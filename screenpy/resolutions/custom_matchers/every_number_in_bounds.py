@@ -0,0 +1,177 @@
+"""A matcher that matches a large collection of numbers all within bounds.
+
+For example:
+
+    assert_that(array("d", [1.5, 2.5]), every_number_in_bounds(1, 5))
+    assert_that(numpy.arange(10**6), every_number_in_bounds("[0, 1000000)"))
+
+NumPy arrays (or anything else with ``ndim`` and ``__array__``) are checked
+with NumPy's own vectorized comparisons, without ScreenPy importing NumPy.
+Buffers like :class:`array.array` and other sequences are checked with the
+built-in ``min`` and ``max``, which loop in C. Only when the check fails are
+the numbers looked at one by one, to say which ones were out of bounds.
+
+NaN is never within bounds, however it is checked. Iterators, like
+generators, are turned into a list once. If they fail, the numbers out of
+bounds are found right away, and only those are remembered to describe the
+mismatch with, so the list can be let go of.
+"""
+
+from __future__ import annotations
+
+from math import isnan
+from typing import TYPE_CHECKING, Any, Collection, Iterable, Iterator, List, Tuple
+
+from hamcrest.core.base_matcher import BaseMatcher
+
+from .is_in_bounds import is_in_bounds
+from .stream_matcher import _reference_to
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+    from hamcrest.core.description import Description
+
+    from .is_in_bounds import IsInBounds
+
+# how many of the out-of-bounds indices to report
+REPORTED_INDICES = 5
+
+# how many numbers there were, how many were out of bounds, and the first few.
+OutOfBounds = Tuple[int, int, List[int]]
+
+
+def _is_array(item: object) -> bool:
+    """Check if the item is a NumPy-style array."""
+    return hasattr(item, "ndim") and hasattr(item, "__array__")
+
+
+def _as_numbers(item: Iterable[float]) -> Collection[float]:
+    """Get at the numbers without copying them, if possible."""
+    try:
+        view = memoryview(item)  # type: ignore[arg-type]
+    except TypeError:
+        # min and max both need to look at the numbers, so keep them around.
+        return item if isinstance(item, Collection) else list(item)
+    if view.ndim > 1:
+        view = view.cast("B").cast(view.format)  # type: ignore[call-overload]
+    return view
+
+
+class IsEveryNumberInBounds(BaseMatcher[Iterable[float]]):
+    """Matches a collection whose numbers are all within the bounds."""
+
+    _remembered: tuple[Callable[[], Any], OutOfBounds | None] | None = None
+
+    def __init__(self, bounds: IsInBounds, expectation: str) -> None:
+        self.bounds = bounds
+        self.expectation = expectation
+
+    def _within(self, array: Any) -> Any:  # noqa: ANN401
+        """Compare the whole array against the bounds at once."""
+        bounds = self.bounds
+        return bounds.lower_comparator(
+            bounds.minorant, array
+        ) & bounds.upper_comparator(array, bounds.majorant)
+
+    def _matches(self, item: Iterable[float]) -> bool:
+        if _is_array(item):
+            return bool(self._within(item).all())
+
+        remembered = self._remembered
+        if remembered is not None and remembered[0]() is item:
+            if remembered[1] is None:
+                # a match is never described, so it won't be asked for again.
+                self._remembered = None
+            return remembered[1] is None
+        self._remembered = None
+
+        try:
+            numbers = _as_numbers(item)
+            matches = self._all_within(numbers)
+        except TypeError:  # not a collection of numbers
+            return False
+        if isinstance(item, Iterator):
+            # the iterator is used up, so find what to describe it with now.
+            out_of_bounds = None if matches else self._tally(numbers)
+            self._remembered = (_reference_to(item), out_of_bounds)
+        return matches
+
+    def _all_within(self, numbers: Collection[float]) -> bool:
+        """Check the smallest and largest numbers, and that none are NaN."""
+        if not numbers:
+            return True
+        bounds = self.bounds
+        if not (
+            bounds.lower_comparator(bounds.minorant, min(numbers))
+            and bounds.upper_comparator(max(numbers), bounds.majorant)
+        ):
+            return False
+        # NaN is not ordered, so min and max may have passed over it. Any NaN
+        # makes the sum NaN (as do both infinities, so look closer then).
+        return not isnan(sum(numbers)) or not any(isnan(n) for n in numbers)
+
+    def _out_of_bounds(self, item: Iterable[float]) -> OutOfBounds:
+        """Count the numbers out of bounds, and find the first few."""
+        remembered = self._remembered
+        if (
+            remembered is not None
+            and remembered[0]() is item
+            and remembered[1] is not None
+        ):
+            return remembered[1]
+        if _is_array(item):
+            array: Any = item
+            outside = (~self._within(array)).ravel().nonzero()[0]
+            return array.size, len(outside), outside[:REPORTED_INDICES].tolist()
+        return self._tally(_as_numbers(item))
+
+    def _tally(self, numbers: Iterable[float]) -> OutOfBounds:
+        """Look at the numbers one by one, noting the ones out of bounds."""
+        total = 0
+        indices = []
+        for index, number in enumerate(numbers):
+            total += 1
+            if not self.bounds.matches(number):
+                indices.append(index)
+        return total, len(indices), indices[:REPORTED_INDICES]
+
+    def describe_to(self, description: Description) -> None:
+        """Describe the passing case."""
+        description.append_text(f"every number {self.expectation}")
+
+    def describe_match(
+        self, _: Iterable[float], match_description: Description
+    ) -> None:
+        """Describe the match, for use with IsNot."""
+        match_description.append_text(f"every number was {self.expectation}")
+
+    def describe_mismatch(
+        self, item: Iterable[float], mismatch_description: Description
+    ) -> None:
+        """Describe the failing case, without printing the whole collection."""
+        try:
+            total, count, first = self._out_of_bounds(item)
+        except TypeError:
+            mismatch_description.append_text("was not a collection of numbers")
+            return
+        finally:
+            self._remembered = None
+        indices = ", ".join(str(index) for index in first)
+        more = ", ..." if count > len(first) else ""
+        mismatch_description.append_text(
+            f"{count} of {total} numbers were not {self.expectation},"
+            f" at indices [{indices}{more}]"
+        )
+
+
+def every_number_in_bounds(
+    *bounds: int | (float | str), expectation: str | None = None
+) -> IsEveryNumberInBounds:
+    """Matches a collection of numbers that all fall within the bounds."""
+    in_bounds = is_in_bounds(*bounds)
+    if expectation is None:
+        expectation = (
+            f"within the range of {in_bounds.minorant} and {in_bounds.majorant}"
+        )
+    return IsEveryNumberInBounds(in_bounds, expectation)
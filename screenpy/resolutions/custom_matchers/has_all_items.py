@@ -0,0 +1,134 @@
+"""Matchers that find many items in a large collection with a single pass.
+
+For example:
+
+    assert_that(range(100_000), has_all_items(1, 99_999))
+    assert_that({"a": 1, "b": 2}, has_all_values(2))
+
+Expected items which can be hashed are looked up in a set, so each element
+of the collection is only looked at once, no matter how many items are
+expected. Sets and the keys of mappings are asked directly, without looking
+through them at all. Expected items which cannot be hashed, or which are
+Matchers themselves, are compared against each element in turn, like
+hamcrest's ``has_item`` does.
+
+The collection may be an iterator, like a generator. It is looked through
+only until every item has been found.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, AbstractSet, Any, Iterable, Mapping, Sequence
+
+from hamcrest.core.helpers.wrap_matcher import wrap_matcher
+from hamcrest.core.matcher import Matcher
+from hamcrest.core.string_description import StringDescription
+
+from .stream_matcher import IsStreamMatching
+
+if TYPE_CHECKING:
+    from hamcrest.core.description import Description
+
+
+def _is_hashable(item: object) -> bool:
+    """Check if the item can be looked up in a set."""
+    try:
+        hash(item)
+    except TypeError:
+        return False
+    return True
+
+
+class IsCollectionContainingItems(IsStreamMatching):
+    """Matches a collection (or a mapping's values) containing every item."""
+
+    def __init__(self, items: Sequence[Any], *, values: bool = False) -> None:
+        self.items = items
+        self.values = values
+        # the items which have to be compared to each element, by their index.
+        self.matchers = {
+            index: wrap_matcher(item)
+            for index, item in enumerate(items)
+            if isinstance(item, Matcher) or not _is_hashable(item)
+        }
+        self.hashable = {
+            item for index, item in enumerate(items) if index not in self.matchers
+        }
+
+    def _missing(self, collection: Iterable[Any]) -> list[Any]:
+        """Find the expected items which are not in the collection."""
+        if self.values:
+            if not isinstance(collection, Mapping):
+                msg = "not a mapping"
+                raise TypeError(msg)
+            elements: Iterable[Any] = collection.values()
+        else:
+            elements = collection
+        if not self.matchers and isinstance(elements, (AbstractSet, Mapping)):
+            return [item for item in self.items if item not in elements]
+
+        remaining = set(self.hashable)
+        unmatched = dict(self.matchers)
+        for element in elements:
+            try:
+                remaining.discard(element)
+            except TypeError:  # unhashable, but it could still be equal
+                remaining.difference_update(
+                    [item for item in remaining if item == element]
+                )
+            if unmatched:
+                for index in [i for i, m in unmatched.items() if m.matches(element)]:
+                    del unmatched[index]
+            if not remaining and not unmatched:
+                break
+
+        return [
+            item
+            for index, item in enumerate(self.items)
+            if index in unmatched or (index not in self.matchers and item in remaining)
+        ]
+
+    def _mismatch_for(self, item: Iterable[Any]) -> str | None:
+        try:
+            missing = self._missing(item)
+        except TypeError:
+            return f"was not a {'mapping' if self.values else 'collection'}"
+        if not missing:
+            return None
+        description = StringDescription()
+        if len(self.items) == 1:
+            description.append_text("was missing ")
+        else:
+            description.append_text(
+                f"was missing {len(missing)} of the {len(self.items)} {self._noun}: "
+            )
+        description.append_list("", ", ", "", missing)
+        return str(description)
+
+    @property
+    def _noun(self) -> str:
+        """Say what sort of things are expected."""
+        return "values" if self.values else "items"
+
+    def describe_to(self, description: Description) -> None:
+        """Describe the passing case."""
+        if self.values:
+            description.append_text("a dictionary containing ")
+            description.append_text("value " if len(self.items) == 1 else "values ")
+        else:
+            description.append_text("a sequence containing ")
+        description.append_list("", ", ", "", self.items)
+
+    def describe_match(self, _: Iterable[Any], match_description: Description) -> None:
+        """Describe the match, for use with IsNot."""
+        match_description.append_text(f"it contained every one of the {self._noun}")
+
+
+def has_all_items(*items: Any) -> Matcher[Any]:  # noqa: ANN401
+    """Matches a collection containing every one of the items."""
+    return IsCollectionContainingItems(items)
+
+
+def has_all_values(*values: Any) -> Matcher[Any]:  # noqa: ANN401
+    """Matches a mapping containing every one of the values."""
+    return IsCollectionContainingItems(values, values=True)
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import operator
 import re
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from hamcrest.core.base_matcher import BaseMatcher
@@ -62,26 +63,40 @@ class IsInBounds(BaseMatcher[float]):
         )
 
 
+# a number, which may have a decimal point or be infinite.
+NUMBER = r"(?:inf(?:inity)?|\d+(?:\.\d+)?)"
+BOUNDING_PATTERN = re.compile(
+    rf"^(?P<lower>[\[\(]?)\s*(?P<minorant>[-+]?{NUMBER})"
+    # only a majorant after a comma can have a sign, so "1-5" still works.
+    rf"(?:\s*,\s*(?P<sign>[-+]?)|.*?)(?P<majorant>{NUMBER})\s*(?P<upper>[\]\)]?)$",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=128)
+def _parse_bounding_string(
+    bounding_string: str,
+) -> tuple[InequalityFunc, float, float, InequalityFunc]:
+    """Read the comparators and numbers from a range string, like "[1, 5)"."""
+    matched = BOUNDING_PATTERN.match(bounding_string)
+    if matched is None:
+        msg = "bounding string did not match correct pattern."
+        raise ValueError(msg)
+    lower_comparator = operator.lt if matched.group("lower") == "(" else operator.le
+    upper_comparator = operator.lt if matched.group("upper") == ")" else operator.le
+    minorant = float(matched.group("minorant"))
+    majorant = float((matched.group("sign") or "") + matched.group("majorant"))
+    return lower_comparator, minorant, majorant, upper_comparator
+
+
 def is_in_bounds(*bounds: int | (float | str)) -> IsInBounds:
     """Matches a number that falls within the bounds."""
-    lower_comparator = operator.le
-    upper_comparator = operator.le
+    lower_comparator: InequalityFunc = operator.le
+    upper_comparator: InequalityFunc = operator.le
     if len(bounds) == 1:
-        bounding_string = str(bounds[0])
-        pattern = (
-            r"^(?P<lower>[\[\(]?)"
-            r"(?P<minorant>\d+).*?(?P<majorant>\d+)"
-            r"(?P<upper>[\]\)]?)$"
+        lower_comparator, minorant, majorant, upper_comparator = _parse_bounding_string(
+            str(bounds[0])
         )
-        matched = re.match(pattern, bounding_string)
-        if matched is None:
-            msg = "bounding string did not match correct pattern."
-            raise ValueError(msg)
-        if matched.group("lower") == "(":
-            lower_comparator = operator.lt
-        if matched.group("upper") == ")":
-            upper_comparator = operator.lt
-        minorant, majorant = map(float, matched.group("minorant", "majorant"))
     elif len(bounds) == 2:  # noqa: PLR2004
         minorant, majorant = map(float, bounds)
     else:
@@ -1,27 +1,44 @@
-"""Matcher to use a regular expression pattern to match an item in a sequence."""
+"""Matchers to use regular expression patterns to match items in a sequence."""
+
+from __future__ import annotations
 
 import re
-from typing import Sequence
+from typing import TYPE_CHECKING, Iterable, Iterator, Pattern, Sequence
+
+from .stream_matcher import IsStreamMatching
+
+if TYPE_CHECKING:
+    from hamcrest.core.description import Description
+    from hamcrest.core.matcher import Matcher
+
+# backreferences would point at the wrong group in a combined pattern, and
+# global flags would apply to all of the other patterns too.
+UNCOMBINABLE = re.compile(r"\\[1-9]|\(\?P=|\(\?[aiLmsux]+\)")
+DEFAULT_FLAGS = re.compile("").flags
 
-from hamcrest.core.base_matcher import BaseMatcher
-from hamcrest.core.description import Description
-from hamcrest.core.matcher import Matcher
 
+def _source_of(pattern: str | Pattern[str]) -> str:
+    """Get the pattern as it was written."""
+    return pattern.pattern if isinstance(pattern, Pattern) else pattern
 
-class IsSequenceContainingPattern(BaseMatcher[Sequence[str]]):
+
+class IsSequenceContainingPattern(IsStreamMatching):
     """Matcher to test each string in a sequence against a regex."""
 
-    def __init__(self, pattern: str) -> None:
-        self.pattern = pattern
+    def __init__(self, pattern: str | Pattern[str]) -> None:
+        self.pattern = _source_of(pattern)
+        self.compiled = re.compile(pattern)
 
-    def _matches(self, item: Sequence[str]) -> bool:
+    def _mismatch_for(self, item: Iterable[str]) -> str | None:
+        if item is None or not hasattr(item, "__iter__"):
+            return "was not a sequence"
         try:
             for element in item:
-                if re.match(self.pattern, element):
-                    return True
-        except TypeError:  # not a sequence
+                if self.compiled.match(element):
+                    return None
+        except TypeError:  # not a sequence of strings
             pass
-        return False
+        return f'did not contain an item matching r"{self.pattern}"'
 
     def describe_to(self, description: Description) -> None:
         """Describe the passing case."""
@@ -29,22 +46,110 @@ class IsSequenceContainingPattern(BaseMatcher[Sequence[str]]):
             f'a sequence containing an element which matches r"{self.pattern}"'
         )
 
-    def describe_match(self, _: Sequence[str], match_description: Description) -> None:
+    def describe_match(self, _: Iterable[str], match_description: Description) -> None:
         """Describe the match, for use with IsNot."""
         match_description.append_text(f'it contains an item matching "{self.pattern}"')
 
-    def describe_mismatch(
-        self, item: Sequence[str], mismatch_description: Description
-    ) -> None:
-        """Describe the failing case."""
+
+class IsSequenceContainingEveryPattern(IsStreamMatching):
+    """Matcher to test a sequence for an item matching each of many regexes.
+
+    The sequence is only looked through once. The patterns are also joined
+    into one alternation, so an item which matches none of them is passed
+    over with a single search, instead of one search for each pattern.
+    """
+
+    def __init__(self, patterns: Sequence[str | Pattern[str]]) -> None:
+        self.patterns = [_source_of(pattern) for pattern in patterns]
+        self.compiled = [re.compile(pattern) for pattern in patterns]
+        self.combined = self._combine()
+
+    def _combine(self) -> Pattern[str] | None:
+        """Join the patterns into one, if they can be joined safely."""
+        if any(
+            compiled.flags != DEFAULT_FLAGS or UNCOMBINABLE.search(compiled.pattern)
+            for compiled in self.compiled
+        ):
+            return None
+        try:
+            return re.compile("|".join(f"(?:{p})" for p in self.patterns))
+        except re.error:  # e.g. two patterns used the same group name
+            return None
+
+    def where_matched(self, item: Iterable[str]) -> dict[str, int]:
+        """Find the index of the first item matching each pattern.
+
+        Patterns which no item matched are left out.
+        """
+        found: dict[str, int] = {}
+        unfound = list(zip(self.patterns, self.compiled))
+        for index, element in enumerate(item):
+            if self.combined is not None and not self.combined.match(element):
+                continue
+            for pattern, compiled in list(unfound):
+                if compiled.match(element):
+                    found[pattern] = index
+                    unfound.remove((pattern, compiled))
+            if not unfound:
+                break
+        return found
+
+    def _mismatch_for(self, item: Iterable[str]) -> str | None:
         if item is None or not hasattr(item, "__iter__"):
-            mismatch_description.append_text("was not a sequence")
+            return "was not a sequence"
+        try:
+            found = self.where_matched(item)
+        except TypeError:  # not a sequence of strings
+            found = {}
+        missing = ", ".join(f'r"{p}"' for p in self.patterns if p not in found)
+        if not missing:
+            return None
+        if found:
+            return (
+                f"did not contain items matching {missing}"
+                f" (but matched {self._where(found)})"
+            )
+        return f"did not contain items matching {missing}"
+
+    @property
+    def patterns_to_log(self) -> str:
+        """Represent the patterns in a log-friendly way."""
+        return ", ".join(f'r"{pattern}"' for pattern in self.patterns)
+
+    def describe_to(self, description: Description) -> None:
+        """Describe the passing case."""
+        description.append_text(
+            "a sequence containing elements which match each of"
+            f" {self.patterns_to_log}"
+        )
+
+    def describe_match(
+        self, item: Iterable[str], match_description: Description
+    ) -> None:
+        """Describe the match, for use with IsNot."""
+        if isinstance(item, Iterator):  # already looked through
+            match_description.append_text(
+                f"it contains items matching each of {self.patterns_to_log}"
+            )
             return
-        mismatch_description.append_text(
-            f'did not contain an item matching r"{self.pattern}"'
+        match_description.append_text(
+            "it contains items matching " + self._where(self.where_matched(item))
         )
 
+    def _where(self, found: dict[str, int]) -> str:
+        """Say which patterns matched which indices, in the order given."""
+        return ", ".join(
+            f'r"{pattern}" at index {found[pattern]}'
+            for pattern in self.patterns
+            if pattern in found
+        )
 
-def has_item_matching(pattern: str) -> Matcher[Sequence[str]]:
+
+def has_item_matching(pattern: str | Pattern[str]) -> Matcher[Iterable[str]]:
     """Matches if any element of sequence matches the regex pattern."""
     return IsSequenceContainingPattern(pattern)
+
+
+def has_items_matching(*patterns: str | Pattern[str]) -> Matcher[Iterable[str]]:
+    """Matches if each regex pattern is matched by some element of sequence."""
+    return IsSequenceContainingEveryPattern(patterns)
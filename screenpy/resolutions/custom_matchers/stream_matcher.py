@@ -0,0 +1,106 @@
+"""A base for Matchers which look through an iterable at most once.
+
+Iterators, like generators or the pages of a paginated API, can only be
+looked through once. A Matcher usually looks through its item twice when it
+fails: once to match it, and again to describe the mismatch. Subclasses of
+:class:`IsStreamMatching` work out the mismatch while they match, and
+remember it for the iterator they were given, so::
+
+    assert_that((row.id for row in report.rows()), has_all_items(1, 2, 3))
+
+can say which ids were missing without building a list of every row. The
+remembered outcome is also used if the same iterator is matched again, like
+when :class:`~screenpy.actions.SeeAnyOf` checks an answer it already tried.
+Only the last iterator's outcome is remembered, and it is forgotten once the
+mismatch is described (or the match is given again), so the Matcher does
+not keep a used-up iterator, or whatever it refers to, alive.
+"""
+
+from __future__ import annotations
+
+import weakref
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+from hamcrest.core.base_matcher import BaseMatcher
+
+if TYPE_CHECKING:
+    from hamcrest.core.description import Description
+
+# how many elements to keep to show in the mismatch
+SHOWN_ELEMENTS = 10
+
+
+def _reference_to(item: Iterator[Any]) -> Callable[[], Iterator[Any] | None]:
+    """Refer to the iterator weakly, if it can be referred to that way."""
+    try:
+        return weakref.ref(item)
+    except TypeError:
+        # keeping the iterator makes sure its id is not reused.
+        return lambda: item
+
+
+class IsStreamMatching(BaseMatcher[Iterable[Any]], ABC):
+    """Matches an iterable, looking through it at most once."""
+
+    _remembered: tuple[Callable[[], Iterator[Any] | None], str | None] | None = None
+
+    @abstractmethod
+    def _mismatch_for(self, item: Iterable[Any]) -> str | None:
+        """Find what is wrong with the item, or None if it matches."""
+
+    def _outcome(self, item: Iterable[Any]) -> str | None:
+        """Find the mismatch, or give the one remembered for this iterator."""
+        remembered = self._remembered
+        if remembered is not None and remembered[0]() is item:
+            if remembered[1] is None:
+                # a match is never described, so it won't be asked for again.
+                self._remembered = None
+            return remembered[1]
+        self._remembered = None
+        mismatch = self._mismatch_for(item)
+        if isinstance(item, Iterator):
+            self._remembered = (_reference_to(item), mismatch)
+        return mismatch
+
+    def _matches(self, item: Iterable[Any]) -> bool:
+        return self._outcome(item) is None
+
+    def describe_mismatch(
+        self, item: Iterable[Any], mismatch_description: Description
+    ) -> None:
+        """Describe the failing case, without looking through it again."""
+        try:
+            mismatch = self._outcome(item)
+        finally:
+            self._remembered = None
+        if mismatch is None:
+            super().describe_mismatch(item, mismatch_description)
+            return
+        mismatch_description.append_text(mismatch)
+
+
+class Seen(Iterator[Any]):
+    """Pass along the elements of an iterable, keeping the first few."""
+
+    def __init__(self, elements: Iterable[Any]) -> None:
+        self.elements = iter(elements)
+        self.count = 0
+        self.first: list[Any] = []
+
+    def __iter__(self) -> Seen:
+        """Be the iterator."""
+        return self
+
+    def __next__(self) -> Any:  # noqa: ANN401
+        """Give the next element, keeping it if it is one of the first few."""
+        element = next(self.elements)
+        self.count += 1
+        if len(self.first) < SHOWN_ELEMENTS:
+            self.first.append(element)
+        return element
+
+    def shown(self) -> str:
+        """Show the first few elements seen, like a list."""
+        more = ", ..." if self.count > len(self.first) else ""
+        return f"[{', '.join(repr(element) for element in self.first)}{more}]"
@@ -6,6 +6,8 @@ from hamcrest.core.matcher import Matcher
 from screenpy.pacing import beat
 from screenpy.speech_tools import represent_prop
 
+from .matcher_cache import cache_matcher
+
 
 class EndsWith:
     """Match a string which ends with the given substring.
@@ -27,6 +29,7 @@ class EndsWith:
         return f"Ending with {self.postfix_to_log}."
 
     @beat("... hoping it ends with {postfix_to_log}.")
+    @cache_matcher
     def resolve(self) -> Matcher[str]:
         """Produce the Matcher to make the assertion."""
         return ends_with(self.postfix)
@@ -0,0 +1,121 @@
+"""Matches every number in a large collection, like a NumPy array."""
+
+from __future__ import annotations
+
+import operator
+from numbers import Real
+from typing import TYPE_CHECKING, Any
+
+from screenpy.exceptions import UnableToFormResolution
+from screenpy.pacing import beat
+from screenpy.speech_tools import get_additive_description
+
+from .custom_matchers.every_number_in_bounds import IsEveryNumberInBounds
+from .custom_matchers.is_in_bounds import IsInBounds, is_in_bounds
+from .is_close_to import IsCloseTo
+from .is_equal_to import IsEqualTo
+from .is_greater_than import IsGreaterThan
+from .is_greater_than_or_equal_to import IsGreaterThanOrEqualTo
+from .is_in_range import IsInRange
+from .is_less_than import IsLessThan
+from .is_less_than_or_equal_to import IsLessThanOrEqualTo
+from .matcher_cache import cache_matcher
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+    from hamcrest.core.matcher import Matcher
+
+    from screenpy.protocols import Resolvable
+
+INFINITY = float("inf")
+
+
+def _number(value: object) -> float:
+    """Insist on a number, since the bounds would turn a string into one."""
+    if isinstance(value, bool) or not isinstance(value, Real):
+        msg = f"{value!r} is not a number"
+        raise TypeError(msg)
+    return float(value)
+
+
+# how to find the bounds of each Resolution EveryNumber can check.
+BOUNDS_OF: dict[type, Callable[[Any], IsInBounds]] = {
+    IsCloseTo: lambda res: is_in_bounds(
+        _number(res.num) - _number(res.delta), _number(res.num) + _number(res.delta)
+    ),
+    IsEqualTo: lambda res: is_in_bounds(_number(res.expected), _number(res.expected)),
+    IsGreaterThan: lambda res: IsInBounds(
+        _number(res.number), operator.lt, operator.lt, INFINITY
+    ),
+    IsGreaterThanOrEqualTo: lambda res: IsInBounds(
+        _number(res.number), operator.le, operator.lt, INFINITY
+    ),
+    IsInRange: lambda res: is_in_bounds(*res.bounds),
+    IsLessThan: lambda res: IsInBounds(
+        -INFINITY, operator.lt, operator.lt, _number(res.number)
+    ),
+    IsLessThanOrEqualTo: lambda res: IsInBounds(
+        -INFINITY, operator.lt, operator.le, _number(res.number)
+    ),
+}
+
+
+class EveryNumber:
+    """Match on a collection of numbers which all match a numeric Resolution.
+
+    Works with :class:`~screenpy.resolutions.IsCloseTo`,
+    :class:`~screenpy.resolutions.IsEqualTo`,
+    :class:`~screenpy.resolutions.IsGreaterThan`,
+    :class:`~screenpy.resolutions.IsGreaterThanOrEqualTo`,
+    :class:`~screenpy.resolutions.IsInRange`,
+    :class:`~screenpy.resolutions.IsLessThan`, and
+    :class:`~screenpy.resolutions.IsLessThanOrEqualTo`.
+
+    Made for large collections of numbers. NumPy arrays are checked in one
+    vectorized pass; buffers like :class:`array.array` (and other sequences)
+    are checked with the built-in ``min`` and ``max``. A failure reports how
+    many numbers did not match and where, instead of the whole collection.
+    NaN never matches, and bounds can be infinite, like ``"[0, inf)"``.
+
+    Examples::
+
+        the_actor.should(
+            See.the(Readings.of(CPU_TEMPERATURE), EveryNumber(IsInRange(20, 80)))
+        )
+
+        the_actor.should(See.the(Latencies.of(CHECKOUT), EveryNumber(IsLessThan(1))))
+    """
+
+    @property
+    def resolution_to_log(self) -> str:
+        """Represent the Resolution in a log-friendly way."""
+        return get_additive_description(self.resolution)
+
+    def describe(self) -> str:
+        """Describe the Resolution's expectation."""
+        return f"Every number {self.resolution_to_log}."
+
+    @beat("... hoping every number is {resolution_to_log}.")
+    @cache_matcher
+    def resolve(self) -> Matcher[Any]:
+        """Produce the Matcher to make the assertion."""
+        return IsEveryNumberInBounds(self.bounds, self.resolution_to_log)
+
+    def __init__(self, resolution: Resolvable) -> None:
+        if type(resolution) not in BOUNDS_OF:
+            known = ", ".join(resolution.__name__ for resolution in BOUNDS_OF)
+            msg = (
+                f"{self.__class__.__name__} can not check every number with"
+                f" {resolution.__class__.__name__}, only {known}."
+            )
+            raise UnableToFormResolution(msg)
+        try:
+            self.bounds = BOUNDS_OF[type(resolution)](resolution)
+        except (TypeError, ValueError) as exc:
+            msg = (
+                f"{self.__class__.__name__} could not find numeric bounds in"
+                f" {resolution.__class__.__name__}: {exc}"
+            )
+            raise UnableToFormResolution(msg) from exc
+        self.resolution = resolution
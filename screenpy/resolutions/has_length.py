@@ -1,16 +1,21 @@
 """Matches the length of a collection."""
 
-from typing import Sized
+from typing import Iterable
 
-from hamcrest import has_length
 from hamcrest.core.matcher import Matcher
 
 from screenpy.pacing import beat
 
+from .custom_matchers.collection_of_length import has_length_of
+from .matcher_cache import cache_matcher
+
 
 class HasLength:
     """Match against a collection with a specific length.
 
+    Also matches iterators, like generators, counting their items only until
+    there are too many.
+
     Examples::
 
         the_actor.should(
@@ -28,9 +33,10 @@ class HasLength:
         return f"{self.length} {self.item_plural} long."
 
     @beat("... hoping it's a collection with {length} {item_plural} in it.")
-    def resolve(self) -> Matcher[Sized]:
+    @cache_matcher
+    def resolve(self) -> Matcher[Iterable]:
         """Produce the Matcher to make the assertion."""
-        return has_length(self.length)
+        return has_length_of(self.length)
 
     def __init__(self, length: int) -> None:
         self.length = length
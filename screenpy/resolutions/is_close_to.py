@@ -5,6 +5,8 @@ from hamcrest.core.matcher import Matcher
 
 from screenpy.pacing import beat
 
+from .matcher_cache import cache_matcher
+
 
 class IsCloseTo:
     """Matches a value that falls within the range specified by the given delta.
@@ -21,6 +23,7 @@ class IsCloseTo:
         return f"At most {self.delta} away from {self.num}."
 
     @beat("... hoping it's at most {delta} away from {num}.")
+    @cache_matcher
     def resolve(self) -> Matcher[float]:
         """Produce the Matcher to make the assertion."""
         return close_to(self.num, self.delta)
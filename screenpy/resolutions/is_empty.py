@@ -1,16 +1,20 @@
 """Matches an empty collection."""
 
-from typing import Sized
+from typing import Iterable
 
-from hamcrest import empty
 from hamcrest.core.matcher import Matcher
 
 from screenpy.pacing import beat
 
+from .custom_matchers.empty_collection import is_empty_collection
+from .matcher_cache import cache_matcher
+
 
 class IsEmpty:
     """Match on an empty collection.
 
+    Also matches iterators, like generators, asking only for their first item.
+
     Examples::
 
         the_actor.should(See.the(List.of_all(VIDEO_FRAMES), IsEmpty()))
@@ -21,6 +25,7 @@ class IsEmpty:
         return "An empty collection."
 
     @beat("... hoping it's an empty collection.")
-    def resolve(self) -> Matcher[Sized]:
+    @cache_matcher
+    def resolve(self) -> Matcher[Iterable]:
         """Produce the Matcher to make the assertion."""
-        return empty()
+        return is_empty_collection()
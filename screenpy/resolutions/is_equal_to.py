@@ -9,6 +9,8 @@ from hamcrest import equal_to
 from screenpy.pacing import beat
 from screenpy.speech_tools import represent_prop
 
+from .matcher_cache import cache_matcher
+
 if TYPE_CHECKING:
     from hamcrest.core.matcher import Matcher
 
@@ -33,6 +35,7 @@ class IsEqualTo:
         return f"Equal to {self.expected_to_log}."
 
     @beat("... hoping it's equal to {expected_to_log}.")
+    @cache_matcher
     def resolve(self) -> Matcher[Any]:
         """Produce the Matcher to make the assertion."""
         return equal_to(self.expected)
@@ -9,6 +9,8 @@ from hamcrest import greater_than
 from screenpy.pacing import beat
 from screenpy.speech_tools import represent_prop
 
+from .matcher_cache import cache_matcher
+
 if TYPE_CHECKING:
     from hamcrest.core.matcher import Matcher
 
@@ -31,6 +33,7 @@ class IsGreaterThan:
         return f"Greater than {self.number_to_log}."
 
     @beat("... hoping it's greater than {number_to_log}.")
+    @cache_matcher
     def resolve(self) -> Matcher[Any]:
         """Produce the Matcher to make the assertion."""
         return greater_than(self.number)
@@ -9,6 +9,7 @@ from screenpy.pacing import beat
 from screenpy.speech_tools import represent_prop
 
 from .custom_matchers.is_in_bounds import is_in_bounds
+from .matcher_cache import cache_matcher
 
 if TYPE_CHECKING:
     from hamcrest.core.matcher import Matcher
@@ -49,6 +50,7 @@ class IsInRange:
         return f"In the range {self.bounds_to_log}."
 
     @beat("... hoping it's in the range {bounds_to_log}.")
+    @cache_matcher
     def resolve(self) -> Matcher[float]:
         """Produce the Matcher to make the assertion."""
         return is_in_bounds(*self.bounds)
@@ -9,6 +9,8 @@ from hamcrest import less_than_or_equal_to
 from screenpy.pacing import beat
 from screenpy.speech_tools import represent_prop
 
+from .matcher_cache import cache_matcher
+
 if TYPE_CHECKING:
     from hamcrest.core.matcher import Matcher
 
@@ -33,6 +35,7 @@ class IsLessThanOrEqualTo:
         return f"Less than or equal to {self.number_to_log}."
 
     @beat("... hoping it's less than or equal to {number_to_log}.")
+    @cache_matcher
     def resolve(self) -> Matcher[float]:
         """Produce the Matcher to make the assertion."""
         return less_than_or_equal_to(self.number)
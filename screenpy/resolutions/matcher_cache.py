@@ -0,0 +1,48 @@
+"""Build a Resolution's Matcher once, then reuse it.
+
+Resolutions are often resolved many times, like in every attempt of an
+:class:`~screenpy.actions.Eventually`. Decorating ``resolve`` with
+:func:`cache_matcher` (underneath its ``beat``, so the narration is
+unchanged) keeps the Matcher it built the first time::
+
+    @beat("... hoping it's equal to {expected_to_log}.")
+    @cache_matcher
+    def resolve(self) -> Matcher[Any]:
+        return equal_to(self.expected)
+
+The Matcher is kept on the Resolution, so build a new Resolution rather than
+changing the expected value of an existing one. A Resolution which does let
+its expected value be changed must call :func:`forget_matcher` when it is.
+"""
+
+from __future__ import annotations
+
+from functools import wraps
+from typing import TYPE_CHECKING, Callable, TypeVar
+
+if TYPE_CHECKING:
+    from hamcrest.core.matcher import Matcher
+
+    SelfT = TypeVar("SelfT")
+    MatcherT = TypeVar("MatcherT", bound=Matcher)
+
+CACHED_MATCHER = "_cached_matcher"
+
+
+def cache_matcher(resolve: Callable[[SelfT], MatcherT]) -> Callable[[SelfT], MatcherT]:
+    """Build the Matcher the first time the Resolution is resolved, only."""
+
+    @wraps(resolve)
+    def wrapper(self: SelfT) -> MatcherT:
+        matcher: MatcherT | None = getattr(self, CACHED_MATCHER, None)
+        if matcher is None:
+            matcher = resolve(self)
+            setattr(self, CACHED_MATCHER, matcher)
+        return matcher
+
+    return wrapper
+
+
+def forget_matcher(resolution: object) -> None:
+    """Forget the Matcher kept on the Resolution, so it is built again."""
+    vars(resolution).pop(CACHED_MATCHER, None)
@@ -5,6 +5,8 @@ from hamcrest.core.matcher import Matcher
 
 from screenpy.pacing import beat
 
+from .matcher_cache import cache_matcher
+
 
 class Matches:
     """Match a string using a regular expression.
@@ -22,6 +24,7 @@ class Matches:
         return f'Text matching the pattern r"{self.pattern}".'
 
     @beat('... hoping it\'s text matching the pattern r"{pattern}".')
+    @cache_matcher
     def resolve(self) -> Matcher[str]:
         """Produce the Matcher to make the assertion."""
         return matches_regexp(self.pattern)
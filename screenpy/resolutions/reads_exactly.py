@@ -6,6 +6,8 @@ from hamcrest.core.matcher import Matcher
 from screenpy.pacing import beat
 from screenpy.speech_tools import represent_prop
 
+from .matcher_cache import cache_matcher
+
 
 class ReadsExactly:
     """Match a specific string exactly.
@@ -27,6 +29,7 @@ class ReadsExactly:
         return f"{self.text_to_log}, verbatim."
 
     @beat("... hoping it's {text_to_log}, verbatim.")
+    @cache_matcher
     def resolve(self) -> Matcher[object]:
         """Produce the Matcher to make the assertion."""
         return has_string(self.text)
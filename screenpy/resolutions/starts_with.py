@@ -6,6 +6,8 @@ from hamcrest.core.matcher import Matcher
 from screenpy.pacing import beat
 from screenpy.speech_tools import represent_prop
 
+from .matcher_cache import cache_matcher
+
 
 class StartsWith:
     """Match a string which starts with the given substring.
@@ -27,6 +29,7 @@ class StartsWith:
         return f"Starting with {self.prefix_to_log}."
 
     @beat("... hoping it starts with {prefix_to_log}.")
+    @cache_matcher
     def resolve(self) -> Matcher[str]:
         """Produce the Matcher to make the assertion."""
         return starts_with(self.prefix)
@@ -2,16 +2,49 @@
 
 from __future__ import annotations
 
+import hashlib
+import pickle
 import re
-from typing import TypeVar, overload
+import reprlib
+from collections import deque
+from typing import TYPE_CHECKING, TypeVar
+from weakref import WeakKeyDictionary
 
 from hamcrest.core.helpers.hasmethod import hasmethod
 from hamcrest.core.helpers.ismock import ismock
 
-from screenpy.protocols import Answerable, Describable, Performable, Resolvable
+from screenpy.configuration import settings
+from screenpy.protocols import (
+    Answerable,
+    Describable,
+    Performable,
+    Resolvable,
+    conforms_to,
+)
+
+if TYPE_CHECKING:
+    from typing import Any, Iterator
 
 T = TypeVar("T")
 
+TRAILING_PUNCTUATION = re.compile(r"[.,?!;:]*$")
+CAPITAL_LETTER = re.compile(r"(?<!^)([A-Z])")
+# the descriptions made from the names of -ables' classes.
+_class_descriptions: WeakKeyDictionary[type, str] = WeakKeyDictionary()
+
+# values which the Abridger knows how to look inside of.
+TEXTS = (str, bytes, bytearray)
+COLLECTIONS = (list, tuple, dict, set, frozenset, deque)
+# a run of items (or dictionary entries) left out, to be shown as one.
+LEFT_OUT = re.compile(r"\.\.\.(?:: \.\.\.)?(?:, \.\.\.(?:: \.\.\.)?)+")
+# how many characters of a long string to hash at a time.
+DIGEST_CHUNK = 65536
+# the types digest_of pickles, since pickling them runs none of their code.
+PICKLED_TYPES = frozenset(
+    {type(None), bool, int, float, str, bytes, bytearray}
+    | {list, tuple, dict, set, frozenset}
+)
+
 
 def get_additive_description(describable: Describable | T) -> str:
     """Extract a description that can be placed within a sentence.
@@ -27,47 +60,225 @@ def get_additive_description(describable: Describable | T) -> str:
     If the object does not appear to be any -able, stick a "the" in front of
     the class name. This should make it read like "the list" or "the str".
 
+    The description made from the class name is only worked out once for
+    each class.
+
     Args:
         describable: the object to attempt to describe.
 
     Returns:
         str: the string to place within another string.
     """
-    if isinstance(describable, Describable):
-        description = describable.describe()
-        if description:
-            description = description[0].lower() + description[1:]
-            description = re.sub(r"[.,?!;:]*$", r"", description)
-        else:
-            description = "something indescribable"
-    elif isinstance(describable, (Answerable, Performable, Resolvable)):
+    if conforms_to(describable, Describable):  # type: ignore[type-abstract]
+        return _additive(describable.describe())
+    if (
+        conforms_to(describable, Answerable)  # type: ignore[type-abstract]
+        or conforms_to(describable, Performable)  # type: ignore[type-abstract]
+        or conforms_to(describable, Resolvable)  # type: ignore[type-abstract]
+    ):
         # No describe method, so fabricate a description from the class name.
-        description = describable.__class__.__name__
-        description = re.sub(r"(?<!^)([A-Z])", r" \1", description).lower()
-    else:
-        # Neither Describable nor any other -able, must be a value.
-        description = f"the {describable.__class__.__name__}"
+        return _spaced_out(describable.__class__)
+    # Neither Describable nor any other -able, must be a value.
+    return f"the {describable.__class__.__name__}"
 
+
+def _additive(description: str) -> str:
+    """Lower the case and remove the punctuation of a description."""
+    if not description:
+        return "something indescribable"
+    description = description[0].lower() + description[1:]
+    return TRAILING_PUNCTUATION.sub("", description)
+
+
+def _spaced_out(cls: type) -> str:
+    """Turn a class name like "BuildItAndTheyWillCome" into words, once."""
+    try:
+        return _class_descriptions[cls]
+    except KeyError:
+        pass
+    description = _class_descriptions[cls] = CAPITAL_LETTER.sub(
+        r" \1", cls.__name__
+    ).lower()
     return description
 
 
-@overload
-def represent_prop(item: str) -> str: ...
+class Abridger(reprlib.Repr):
+    """Represent a value, leaving out enough of it to keep it short.
+
+    Only the parts of strings and collections which will be shown are ever
+    turned into strings, so a huge value is never turned into a huge string.
+    Once about ``REPRESENTATION_LENGTH_LIMIT`` characters have been shown,
+    the rest of the items are left out. Notes whether it left anything out,
+    in ``abridged``.
+    """
+
+    def repr1(self, x: Any, level: int) -> str:  # noqa: ANN401
+        """Represent part of the value, noting if any of it is left out."""
+        if self.shown >= self.maxstring:
+            # enough has been shown already, leave out the rest.
+            self.abridged = True
+            return "..."
+
+        base: type | None = None
+        if isinstance(x, TEXTS):
+            self.abridged |= len(x) > self.maxstring
+            base = next(kind for kind in TEXTS if isinstance(x, kind))
+        elif isinstance(x, COLLECTIONS):
+            self.abridged |= level <= 0 or len(x) > self.maxlist
+            base = next(kind for kind in COLLECTIONS if isinstance(x, kind))
+
+        if base is not None and type(x) is not base and self.abridged:
+            # a large subclass, like an OrderedDict, would be repr'd in full.
+            representation = getattr(self, f"repr_{base.__name__}")(x, level)
+        else:
+            representation = super().repr1(x, level)
+        if isinstance(x, TEXTS) and not self.abridged:
+            # the quotes can push a string just under the limit over it.
+            self.abridged = representation != repr(x)
+        if not isinstance(x, COLLECTIONS):
+            self.shown += len(representation)
+        return representation
+
+    def repr(self, x: Any) -> str:  # noqa: ANN401
+        """Represent the value, leaving out what there isn't room for."""
+        return LEFT_OUT.sub("...", super().repr(x))
+
+    def cut(self, text: str) -> str:
+        """Leave out the middle of a long text, the way reprlib would."""
+        if len(text) <= self.maxother:
+            return text
+        self.abridged = True
+        start = max(0, (self.maxother - 3) // 2)
+        end = max(0, self.maxother - 3 - start)
+        return f"{text[:start]}...{text[len(text) - end:]}"
+
+    # reprlib only knows how to shorten str, but bytes can be shortened the same way.
+    repr_bytes = repr_bytearray = reprlib.Repr.repr_str
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.maxlevel = settings.REPRESENTATION_DEPTH_LIMIT
+        self.maxdict = self.maxlist = self.maxtuple = settings.REPRESENTATION_ITEM_LIMIT
+        self.maxset = self.maxfrozenset = self.maxdeque = self.maxlist
+        self.maxstring = self.maxlong = settings.REPRESENTATION_LENGTH_LIMIT
+        self.maxother = self.maxstring
+        self.shown = 0
+        self.abridged = False
+
+
+def _pieces_of(item: object, walking: set[int]) -> Iterator[bytes | memoryview]:
+    """Break the value into pieces to digest, without joining them together."""
+    if isinstance(item, str):
+        for start in range(0, len(item), DIGEST_CHUNK):
+            yield item[start : start + DIGEST_CHUNK].encode(errors="surrogatepass")
+    elif isinstance(item, (bytes, bytearray)):
+        yield memoryview(item)
+    elif isinstance(item, COLLECTIONS):
+        if id(item) in walking:  # it contains itself
+            yield b"..."
+            return
+        walking.add(id(item))
+        yield type(item).__name__.encode()
+        elements = item.items() if isinstance(item, dict) else item
+        for element in elements:
+            yield b","
+            yield from _pieces_of(element, walking)
+        walking.discard(id(item))
+    else:
+        yield repr(item).encode(errors="surrogatepass")
+
+
+class _Digester:
+    """A file to pickle into, which digests whatever is written to it."""
+
+    def write(self, data: bytes | memoryview) -> int:
+        """Digest the next part of the pickle."""
+        self.digest.update(data)
+        return len(data)
+
+    def __init__(self) -> None:
+        self.digest = hashlib.blake2b(digest_size=8)
+
+
+class _PrimitivePickler(pickle.Pickler):
+    """Pickle built-in containers of primitives, and nothing else."""
 
+    def reducer_override(self, obj: object) -> Any:  # noqa: ANN401
+        """Refuse anything whose pickling could run its own code."""
+        if type(obj) not in PICKLED_TYPES:
+            msg = f"{type(obj).__name__} is not a built-in type"
+            raise pickle.PicklingError(msg)
+        return NotImplemented
 
-@overload
-def represent_prop(item: T) -> T: ...
 
+def digest_of(item: object) -> str:
+    """Digest the whole value, to tell it apart from others like it.
 
-def represent_prop(item: str | T) -> str | T:
-    """Represent items in a manner suitable for the audience (logging)."""
+    Strings and bytes are digested a chunk at a time. Built-in containers of
+    primitives, like a list of numbers, are pickled straight into the
+    digest, a frame at a time, which is much faster than walking through
+    them in Python. Anything else is walked through instead, since pickling
+    it could run its code.
+
+    The digest follows the order the items are kept in, so equal dicts which
+    had their keys added in a different order, or equal sets, may not have
+    the same digest.
+
+    Args:
+        item: the value to digest.
+
+    Returns:
+        str: a short hexadecimal digest of the value.
+    """
+    digester = _Digester()
+    if not isinstance(item, TEXTS):
+        pickler = _PrimitivePickler(digester, protocol=pickle.HIGHEST_PROTOCOL)
+        # without the memo, a value in two places pickles like two copies of it.
+        pickler.fast = True
+        try:
+            pickler.dump(item)
+        except Exception:  # noqa: BLE001
+            digester = _Digester()
+        else:
+            return digester.digest.hexdigest()
+
+    for piece in _pieces_of(item, set()):
+        digester.write(piece)
+    return digester.digest.hexdigest()
+
+
+def _summarized(item: object, description: str) -> str:
+    """Follow an abridged description with the value's size and digest."""
+    if isinstance(item, str):
+        size = f"{len(item)} characters"
+    elif isinstance(item, (bytes, bytearray)):
+        size = f"{len(item)} bytes"
+    else:
+        size = f"{len(item)} item{'s' if len(item) != 1 else ''}"  # type: ignore[arg-type]
+    return f"{description} [{size}, digest {digest_of(item)}]"
+
+
+def represent_prop(item: object) -> str:
+    """Represent items in a manner suitable for the audience (logging).
+
+    Large values are abridged, following the ``REPRESENTATION_*`` settings.
+    Abridged values are followed by their full size and a digest, so two
+    large values can still be told apart.
+    """
     if not ismock(item) and hasmethod(item, "describe_to"):
         return f"{item}"
-    if isinstance(item, str):
-        return repr(item)
+    abridger = Abridger()
+    if isinstance(item, (*TEXTS, *COLLECTIONS)):
+        description = abridger.repr(item)
+        if abridger.abridged:
+            description = _summarized(item, description)
+        return description if isinstance(item, str) else f"<{description}>"
 
     description = str(item)
+    shown = abridger.cut(description)
+    if abridger.abridged:
+        return f"<{_summarized(description, shown)}>"
     if description[:1] == "<" and description[-1:] == ">":
-        return item
+        return description
 
-    return f"<{item}>"
+    return f"<{description}>"
@@ -0,0 +1,147 @@
+"""Find out how long things that retry, like Eventually, are really taking.
+
+Every time an :class:`~screenpy.actions.Eventually` finishes, whether it
+succeeded or not, it sends a :class:`RetryRecord` to each collector listening
+to ``the_telemetry``. A collector is anything with a ``collect`` method (see
+:class:`~screenpy.protocols.RetryCollector`).
+
+:class:`RetryReport` is a collector which ranks the waits that cost the most
+time. For example, to see it at the end of a pytest session::
+
+    # in your conftest.py
+    from screenpy.telemetry import RetryReport, the_telemetry
+
+    retry_report = RetryReport()
+    the_telemetry.collectors.append(retry_report)
+
+
+    def pytest_terminal_summary(terminalreporter):
+        terminalreporter.write_line(retry_report.report())
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from screenpy.protocols import RetryCollector
+
+
+class RetryRecord(NamedTuple):
+    """How one performance of something that retries went."""
+
+    description: str
+    succeeded: bool
+    attempts: int
+    elapsed: float
+    latencies: tuple[float, ...]
+    error_kinds: tuple[str, ...]
+
+
+class RetryCost(NamedTuple):
+    """The combined cost of every performance with the same description."""
+
+    description: str
+    total_time: float
+    performances: int
+    attempts: int
+    failures: int
+
+
+class RetryReport:
+    """Collect retry records, then rank the waits that cost the most time.
+
+    Examples::
+
+        retry_report = RetryReport()
+        the_telemetry.collectors.append(retry_report)
+
+        ...
+
+        print(retry_report.report())
+    """
+
+    records: list[RetryRecord]
+
+    def collect(self, record: RetryRecord) -> None:
+        """Hold on to the record for the report."""
+        self.records.append(record)
+
+    def clear(self) -> None:
+        """Forget all the collected records."""
+        self.records.clear()
+
+    def costliest(self, limit: int | None = 10) -> list[RetryCost]:
+        """Combine the records by description and rank them by total time.
+
+        Args:
+            limit: how many of the costliest waits to return. None for all.
+
+        Returns:
+            The combined costs, from most to least total time.
+        """
+        costs: dict[str, RetryCost] = {}
+        for record in self.records:
+            cost = costs.get(record.description)
+            if cost is None:
+                cost = RetryCost(record.description, 0.0, 0, 0, 0)
+            costs[record.description] = RetryCost(
+                record.description,
+                cost.total_time + record.elapsed,
+                cost.performances + 1,
+                cost.attempts + record.attempts,
+                cost.failures + (not record.succeeded),
+            )
+        ranked = sorted(costs.values(), key=lambda cost: cost.total_time, reverse=True)
+        return ranked[:limit]
+
+    def report(self, limit: int | None = 10) -> str:
+        """Describe the costliest waits, one per line.
+
+        Args:
+            limit: how many of the costliest waits to describe. None for all.
+
+        Returns:
+            The report, ready to print.
+        """
+        costs = self.costliest(limit)
+        if not costs:
+            return "No retries were recorded."
+
+        lines = ["Retries that cost the most time:"]
+        for rank, cost in enumerate(costs, start=1):
+            performances = f"{cost.performances} performance" + (
+                "s" if cost.performances != 1 else ""
+            )
+            attempts = f"{cost.attempts} attempt" + ("s" if cost.attempts != 1 else "")
+            failed = f", {cost.failures} failed" if cost.failures else ""
+            lines.append(
+                f"  {rank}. {cost.total_time:.2f}s over {performances}"
+                f" ({attempts}{failed}): {cost.description}"
+            )
+        return "\n".join(lines)
+
+    def __init__(self) -> None:
+        self.records = []
+
+
+class Telemetry:
+    """Pass retry records along to every collector.
+
+    Examples::
+
+        the_telemetry.collectors.append(RetryReport())
+    """
+
+    collectors: list[RetryCollector]
+
+    def collect(self, record: RetryRecord) -> None:
+        """Give the record to every collector."""
+        for collector in self.collectors:
+            collector.collect(record)
+
+    def __init__(self, collectors: list[RetryCollector] | None = None) -> None:
+        self.collectors = collectors or []
+
+
+the_telemetry = Telemetry()
@@ -1,21 +1,29 @@
+from __future__ import annotations
+
+import asyncio
 import logging
 import os
+import threading
 import time
+from typing import TYPE_CHECKING, NoReturn
 from unittest import mock
 
 import pytest
-from pytest_mock import MockerFixture
 
 from screenpy import (
-    Actor,
     Answerable,
     AttachTheFile,
+    BatchAnswerable,
+    Capped,
+    ContainsTheItem,
     Debug,
     DeliveryError,
     Describable,
     Director,
     Either,
     Eventually,
+    Exponential,
+    Fibonacci,
     IsEqualTo,
     Log,
     MakeNote,
@@ -26,6 +34,8 @@ from screenpy import (
     SeeAllOf,
     SeeAnyOf,
     Silently,
+    SoftAssertionError,
+    Softly,
     UnableToAct,
     UnableToDirect,
     beat,
@@ -33,15 +43,24 @@ from screenpy import (
     settings,
     the_narrator,
 )
+from screenpy.actions.eventually import FailedAttempt, fingerprint, same_exception
 from screenpy.configuration import ScreenPySettings
+from screenpy.deadline import called_off, called_off_by, within
+from screenpy.telemetry import RetryReport, the_telemetry
 
 from .unittest_protocols import ErrorQuestion
 from .useful_mocks import (
+    FieldOf,
     get_mock_action_class,
     get_mock_question_class,
     get_mock_resolution_class,
 )
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+    from screenpy import Actor
+
 FakeAction = get_mock_action_class()
 FakeQuestion = get_mock_question_class()
 FakeResolution = get_mock_resolution_class()
@@ -131,6 +150,80 @@ class TestDebug:
         assert Debug().describe() == "Assume direct control."
 
 
+class AsyncDoThingThatFails:
+    def __init__(
+        self,
+        failures: int,
+        signal: threading.Event | asyncio.Event | None = None,
+    ) -> None:
+        self.failures = failures
+        self.signal = signal
+        self.attempts = 0
+
+    async def perform_as_async(self, _: Actor) -> None:
+        self.attempts += 1
+        await asyncio.sleep(0)
+        if self.attempts <= self.failures:
+            if self.signal is not None:
+                self.signal.set()
+            msg = f"Failure #{self.attempts}"
+            raise AssertionError(msg)
+
+    def describe(self) -> str:
+        return "Do thing that fails, asynchronously."
+
+
+class AsyncQuestion:
+    def __init__(self, answer: object, delay: float = 0) -> None:
+        self.answer = answer
+        self.delay = delay
+
+    async def answered_by_async(self, _: Actor) -> object:
+        await asyncio.sleep(self.delay)
+        return self.answer
+
+    def describe(self) -> str:
+        return "The async answer."
+
+
+class SlowQuestion:
+    def __init__(
+        self,
+        answer: object,
+        delay: float = 0,
+        barrier: threading.Barrier | None = None,
+    ) -> None:
+        self.answer = answer
+        self.delay = delay
+        self.barrier = barrier
+
+    @beat("{} slowly works out the answer.")
+    def answered_by(self, _: Actor) -> object:
+        if self.barrier is not None:
+            self.barrier.wait()
+        time.sleep(self.delay)
+        return self.answer
+
+    def describe(self) -> str:
+        return "The slow answer."
+
+
+class PatientQuestion:
+    def __init__(self) -> None:
+        self.gave_up = threading.Event()
+
+    def answered_by(self, _: Actor) -> bool:
+        deadline = time.monotonic() + 5
+        while not called_off() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        if called_off():
+            self.gave_up.set()
+        return False
+
+    def describe(self) -> str:
+        return "The patient answer."
+
+
 class TestEventually:
     settings_path = "screenpy.actions.eventually.settings"
 
@@ -227,8 +320,8 @@ class TestEventually:
         self, mocked_time: mock.Mock, Tester: Actor
     ) -> None:
         num_calls = 5
-        mocked_time.time = mock.create_autospec(
-            time.time, side_effect=[1] * num_calls + [100]
+        mocked_time.monotonic = mock.create_autospec(
+            time.monotonic, side_effect=[1] * (2 * num_calls) + [100]
         )
         mock_action = FakeAction()
         mock_action.perform_as.side_effect = ValueError("'Tis but a flesh wound!")
@@ -236,15 +329,15 @@ class TestEventually:
         with pytest.raises(DeliveryError):
             Eventually(mock_action).perform_as(Tester)
 
-        assert mocked_time.time.call_count == num_calls + 1
+        assert mocked_time.monotonic.call_count == 2 * num_calls + 1
 
     @mock.patch("screenpy.actions.eventually.time", autospec=True)
     def test_timeout_mentions_num_executions(
         self, mocked_time: mock.Mock, Tester: Actor
     ) -> None:
         num_calls = 5
-        mocked_time.time = mock.create_autospec(
-            time.time, side_effect=[1] * num_calls + [100]
+        mocked_time.monotonic = mock.create_autospec(
+            time.monotonic, side_effect=[1] * (2 * num_calls) + [100]
         )
         mock_action = FakeAction()
         mock_action.perform_as.side_effect = ValueError("He's pining for the fjords!")
@@ -256,7 +349,9 @@ class TestEventually:
 
     @mock.patch("screenpy.actions.eventually.time", autospec=True)
     def test_catches_exceptions(self, mocked_time: mock.Mock, Tester: Actor) -> None:
-        mocked_time.time = mock.create_autospec(time.time, side_effect=[1, 1, 100])
+        mocked_time.monotonic = mock.create_autospec(
+            time.monotonic, side_effect=[1] * 4 + [100]
+        )
         msg = "I got better."
         mock_action = FakeAction()
         mock_action.perform_as.side_effect = ValueError(msg)
@@ -268,7 +363,9 @@ class TestEventually:
 
     @mock.patch("screenpy.actions.eventually.time", autospec=True)
     def test_mentions_all_errors(self, mocked_time: mock.Mock, Tester: Actor) -> None:
-        mocked_time.time = mock.create_autospec(time.time, side_effect=[1, 1, 100])
+        mocked_time.monotonic = mock.create_autospec(
+            time.monotonic, side_effect=[1] * 4 + [100]
+        )
         exc1 = ValueError("These tracts of land aren't that huge!")
         exc2 = TypeError("This witch does not weigh as much as a duck!")
         mock_action = FakeAction()
@@ -286,9 +383,8 @@ class TestEventually:
     def test_mention_all_errors_in_order(
         self, mocked_time: mock.Mock, Tester: Actor
     ) -> None:
-        num_calls = 5
-        mocked_time.time = mock.create_autospec(
-            time.time, side_effect=[1] * num_calls + [100]
+        mocked_time.monotonic = mock.create_autospec(
+            time.monotonic, side_effect=[1, 1, 1.5, 1.5, 2, 2, 2.5, 2.5, 3, 3, 100]
         )
 
         with pytest.raises(DeliveryError) as actual_exception:
@@ -301,14 +397,22 @@ class TestEventually:
             "    AssertionError: Failure #2\n"
             "    AssertionError: Failure #3\n"
             "    AssertionError: Failure #4\n"
-            "    AssertionError: Failure #5"
+            "    AssertionError: Failure #5\n"
+            "Attempt timeline:\n"
+            "    #1 at 0.00s: AssertionError, then waited 0.50s\n"
+            "    #2 at 0.50s: AssertionError, then waited 0.50s\n"
+            "    #3 at 1.00s: AssertionError, then waited 0.50s\n"
+            "    #4 at 1.50s: AssertionError, then waited 0.50s\n"
+            "    #5 at 2.00s: AssertionError, then waited 0.50s"
         )
 
     @mock.patch("screenpy.actions.eventually.time", autospec=True)
     def test_mention_multiple_errors_once(
         self, mocked_time: mock.Mock, Tester: Actor
     ) -> None:
-        mocked_time.time = mock.create_autospec(time.time, side_effect=[1, 1, 1, 100])
+        mocked_time.monotonic = mock.create_autospec(
+            time.monotonic, side_effect=[1] * 6 + [100]
+        )
         mock_question = FakeQuestion()
         mock_question.answered_by.return_value = True
         mock_question.describe.return_value = "returns bool"
@@ -322,8 +426,300 @@ class TestEventually:
             "\n    AssertionError: "
             "\nExpected: <False>"
             "\n     but: was <True>\n"
+            "\nAttempt timeline:"
+            "\n    #1 at 0.00s: AssertionError, then waited 0.50s"
+            "\n    #2 at 0.00s: AssertionError, then waited 0.50s"
+            "\n    #3 at 0.00s: AssertionError, then waited 0.50s"
+        )
+
+    @mock.patch("screenpy.actions.eventually.TIMELINE_LIMIT", 2)
+    @mock.patch("screenpy.actions.eventually.time", autospec=True)
+    def test_timeline_is_capped(self, mocked_time: mock.Mock, Tester: Actor) -> None:
+        mocked_time.monotonic = mock.create_autospec(
+            time.monotonic, side_effect=[1] * 10 + [100]
+        )
+        mock_action = FakeAction()
+        mock_action.perform_as.side_effect = [
+            ValueError("Ni!"),
+            ValueError("Ni!"),
+            ValueError("Ni!"),
+            TypeError("Ni!"),
+            ValueError("Ni!"),
+        ]
+        ev = Eventually(mock_action)
+
+        with pytest.raises(DeliveryError) as actual_exception:
+            ev.perform_as(Tester)
+
+        assert len(ev.timeline) == 2
+        assert list(ev.error_kinds) == ["ValueError", "TypeError"]
+        assert str(actual_exception.value).endswith(
+            "Attempt timeline:"
+            "\n    #1 at 0.00s: ValueError, then waited 0.50s"
+            "\n    #2 at 0.00s: ValueError, then waited 0.50s"
+            "\n    ... and 3 more attempts"
         )
 
+    def test_failed_attempts_do_not_keep_the_error(self) -> None:
+        exc = AssertionError("Spam! " * 100 + "\nand eggs")
+
+        attempt = FailedAttempt.of(1.0, exc, 0.5)
+
+        assert attempt.error == "AssertionError"
+        assert len(attempt.message) == 100
+        assert attempt.message.startswith("Spam! Spam!")
+        assert attempt.message.endswith("...")
+
+    def test_perform_as_async_retries(self, Tester: Actor) -> None:
+        action = AsyncDoThingThatFails(failures=2)
+        ev = Eventually(action).polling(0).seconds()  # type: ignore[arg-type]
+
+        asyncio.run(ev.perform_as_async(Tester))
+
+        assert action.attempts == 3
+
+    def test_perform_as_async_times_out(self, Tester: Actor) -> None:
+        action = AsyncDoThingThatFails(failures=1000)
+        ev = Eventually(action).for_(50).milliseconds()  # type: ignore[arg-type]
+        ev.polling(10).milliseconds()
+
+        with pytest.raises(DeliveryError) as actual_exception:
+            asyncio.run(ev.perform_as_async(Tester))
+
+        assert "AssertionError: Failure #1" in str(actual_exception.value)
+
+    def test_can_poll_with_schedule(self) -> None:
+        schedule = Exponential()
+        ev1 = Eventually(FakeAction()).polling_with(schedule)
+        ev2 = Eventually(FakeAction()).backing_off_with(schedule)
+
+        assert ev1.schedule is schedule
+        assert ev2.schedule is schedule
+
+    def test_schedule_from_settings(self) -> None:
+        test_settings = ScreenPySettings(POLLING_SCHEDULE="fibonacci", POLLING_CAP=3)
+
+        with mock.patch(self.settings_path, test_settings):
+            ev = Eventually(FakeAction())
+
+        assert isinstance(ev.schedule, Capped)
+        assert isinstance(ev.schedule.schedule, Fibonacci)
+        assert ev.schedule.cap == 3
+
+    @mock.patch("screenpy.actions.eventually.time", autospec=True)
+    def test_waits_according_to_schedule(
+        self, mocked_time: mock.Mock, Tester: Actor
+    ) -> None:
+        mocked_time.monotonic = mock.create_autospec(
+            time.monotonic, side_effect=[1, 1, 1.5, 1.5, 2.5, 2.5, 4.5, 4.5, 100]
+        )
+
+        with pytest.raises(DeliveryError) as actual_exception:
+            Eventually(DoThingThatFails()).polling_with(Exponential()).perform_as(
+                Tester
+            )
+
+        assert mocked_time.sleep.call_args_list == [
+            mock.call(0.5),
+            mock.call(1),
+            mock.call(2),
+            mock.call(4),
+        ]
+        assert "#4 at 3.50s: AssertionError, then waited 4.00s" in str(
+            actual_exception.value
+        )
+
+    @mock.patch("screenpy.actions.eventually.time", autospec=True)
+    def test_wait_is_capped_by_timeout(
+        self, mocked_time: mock.Mock, Tester: Actor
+    ) -> None:
+        mocked_time.monotonic = mock.create_autospec(
+            time.monotonic, side_effect=[0, 0, 5, 5, 100]
+        )
+        ev = Eventually(DoThingThatFails()).for_(6).seconds().polling(5).seconds()
+
+        with pytest.raises(DeliveryError):
+            ev.perform_as(Tester)
+
+        assert mocked_time.sleep.call_args_list == [mock.call(5), mock.call(1)]
+
+    @mock.patch("screenpy.actions.eventually.time", autospec=True)
+    def test_wait_is_capped_by_time_left_after_the_attempt(
+        self, mocked_time: mock.Mock, Tester: Actor
+    ) -> None:
+        # the first attempt takes 4 of the 6 seconds.
+        mocked_time.monotonic = mock.create_autospec(
+            time.monotonic, side_effect=[0, 4, 6]
+        )
+        ev = Eventually(DoThingThatFails()).for_(6).seconds().polling(5).seconds()
+
+        with pytest.raises(DeliveryError) as actual_exception:
+            ev.perform_as(Tester)
+
+        assert mocked_time.sleep.call_args_list == [mock.call(2)]
+        assert "#1 at 0.00s: AssertionError, then waited 2.00s" in str(
+            actual_exception.value
+        )
+
+    def test_nested_eventually_is_capped_by_outer_timeout(self, Tester: Actor) -> None:
+        inner = Eventually(DoThingThatFails()).for_(20).seconds()
+        inner.polling(10).milliseconds()
+        outer = Eventually(inner).for_(200).milliseconds()
+        outer.polling(10).milliseconds()
+
+        start = time.perf_counter()
+        with pytest.raises(DeliveryError):
+            outer.perform_as(Tester)
+
+        assert time.perf_counter() - start < 5
+
+    def test_stops_when_called_off(self, Tester: Actor) -> None:
+        stop = threading.Event()
+        mock_action = FakeAction()
+        mock_action.perform_as.side_effect = self._fail_then_signal(stop, 5)
+        ev = Eventually(mock_action).for_(20).seconds().polling(10).milliseconds()
+
+        start = time.perf_counter()
+        with called_off_by(stop), pytest.raises(DeliveryError):
+            ev.perform_as(Tester)
+
+        assert time.perf_counter() - start < 5
+        assert mock_action.perform_as.call_count == 1
+
+    def test_inner_timeout_is_reported(self, Tester: Actor) -> None:
+        inner = Eventually(DoThingThatFails()).for_(20).seconds()
+        inner.polling(10).milliseconds()
+
+        with within(0.1), pytest.raises(DeliveryError) as actual_exception:
+            inner.perform_as(Tester)
+
+        assert "over 0.1 seconds" in str(actual_exception.value)
+
+    def test_reports_success_to_telemetry(self, Tester: Actor) -> None:
+        report = RetryReport()
+        action = AsyncDoThingThatFails(failures=2)
+        ev = Eventually(action).polling(0).seconds()  # type: ignore[arg-type]
+
+        with mock.patch.object(the_telemetry, "collectors", [report]):
+            asyncio.run(ev.perform_as_async(Tester))
+
+        [record] = report.records
+        assert record.description == "do thing that fails, asynchronously"
+        assert record.succeeded
+        assert record.attempts == 3
+        assert len(record.latencies) == 3
+        assert record.error_kinds == ("AssertionError",)
+        assert record.elapsed >= sum(record.latencies)
+
+    @mock.patch("screenpy.actions.eventually.time", autospec=True)
+    def test_reports_failure_to_telemetry(
+        self, mocked_time: mock.Mock, Tester: Actor, mocker: MockerFixture
+    ) -> None:
+        mocked_time.monotonic = mock.create_autospec(
+            time.monotonic, side_effect=[1] * 4 + [100]
+        )
+        report = RetryReport()
+        mock_action = FakeAction()
+        mock_action.describe.return_value = "Cross the Bridge of Death."
+        mock_action.perform_as.side_effect = [ValueError("Blue!"), TypeError("No!")]
+
+        mocker.patch.object(the_telemetry, "collectors", [report])
+
+        with pytest.raises(DeliveryError):
+            Eventually(mock_action).perform_as(Tester)
+
+        [record] = report.records
+        assert record.description == "cross the Bridge of Death"
+        assert not record.succeeded
+        assert record.attempts == 2
+        assert record.error_kinds == ("ValueError", "TypeError")
+
+    def test_can_be_woken_up(self) -> None:
+        signal = threading.Event()
+        ev1 = Eventually(FakeAction()).waking_on(signal)
+        ev2 = Eventually(FakeAction()).woken_by(signal)
+
+        assert ev1.wake_up_signal is signal
+        assert ev2.wake_up_signal is signal
+
+    @mock.patch("screenpy.actions.eventually.time", autospec=True)
+    def test_signal_wakes_up_immediately(
+        self, mocked_time: mock.Mock, Tester: Actor
+    ) -> None:
+        mocked_time.monotonic = mock.create_autospec(time.monotonic, return_value=1)
+        signal = threading.Event()
+        mock_action = FakeAction()
+        mock_action.perform_as.side_effect = self._fail_then_signal(signal, 2)
+        ev = Eventually(mock_action).polling(20).seconds().waking_on(signal)
+
+        start = time.perf_counter()
+        ev.perform_as(Tester)
+
+        assert time.perf_counter() - start < 5
+        assert mock_action.perform_as.call_count == 3
+        mocked_time.sleep.assert_not_called()
+        assert not signal.is_set()
+
+    def test_asyncio_signal_wakes_up_immediately(self, Tester: Actor) -> None:
+        async def run() -> None:
+            signal = asyncio.Event()
+            action = AsyncDoThingThatFails(failures=2, signal=signal)
+            ev = Eventually(action).polling(20).seconds()  # type: ignore[arg-type]
+            await ev.waking_on(signal).perform_as_async(Tester)
+
+            assert action.attempts == 3
+
+        start = time.perf_counter()
+        asyncio.run(run())
+
+        assert time.perf_counter() - start < 5
+
+    def test_threading_signal_wakes_up_async(self, Tester: Actor) -> None:
+        signal = threading.Event()
+        action = AsyncDoThingThatFails(failures=2, signal=signal)
+        ev = Eventually(action).polling(20).seconds()  # type: ignore[arg-type]
+
+        start = time.perf_counter()
+        asyncio.run(ev.waking_on(signal).perform_as_async(Tester))
+
+        assert time.perf_counter() - start < 5
+        assert action.attempts == 3
+
+    def test_threading_signal_holds_no_thread(self, Tester: Actor) -> None:
+        signal = threading.Event()
+        action = AsyncDoThingThatFails(failures=1)
+        ev = Eventually(action).polling(20).seconds()  # type: ignore[arg-type]
+        threading.Timer(0.1, signal.set).start()
+
+        start = time.perf_counter()
+        with mock.patch.object(
+            asyncio.BaseEventLoop, "run_in_executor"
+        ) as run_in_executor:
+            asyncio.run(ev.waking_on(signal).perform_as_async(Tester))
+
+        assert time.perf_counter() - start < 5
+        assert action.attempts == 2
+        run_in_executor.assert_not_called()
+        assert not signal.is_set()
+
+    def test_asyncio_signal_needs_async_path(self, Tester: Actor) -> None:
+        ev = Eventually(FakeAction()).waking_on(asyncio.Event())
+
+        with pytest.raises(UnableToAct):
+            ev.perform_as(Tester)
+
+    @staticmethod
+    def _fail_then_signal(signal: threading.Event, failures: int) -> mock.Mock:
+        attempts = iter(range(failures + 1))
+
+        def attempt(_: Actor) -> None:
+            if next(attempts) < failures:
+                signal.set()
+                msg = "Not yet!"
+                raise ValueError(msg)
+
+        return mock.Mock(side_effect=attempt)
+
     def test_describe(self) -> None:
         mock_action = FakeAction()
         mock_action.describe.return_value = "An African or a European swallow?"
@@ -334,6 +730,78 @@ class TestEventually:
         )
 
 
+def raise_(exc: Exception) -> NoReturn:
+    raise exc
+
+
+class TestFingerprint:
+    @staticmethod
+    def catch(exc: Exception) -> Exception:
+        try:
+            raise_(exc)
+        except Exception as caught:  # noqa: BLE001
+            return caught
+
+    @staticmethod
+    def catch_elsewhere(exc: Exception) -> Exception:
+        try:
+            raise_(exc)
+        except Exception as caught:  # noqa: BLE001
+            return caught
+
+    def test_same_exception_same_fingerprint(self) -> None:
+        exc1 = self.catch(ValueError("Ni!"))
+        exc2 = self.catch(ValueError("Ni!"))
+
+        assert fingerprint(exc1) == fingerprint(exc2)
+        assert same_exception(exc1, exc2)
+
+    def test_different_message_different_fingerprint(self) -> None:
+        exc1 = self.catch(ValueError("Ni!"))
+        exc2 = self.catch(ValueError("Ekke ekke ekke ptang!"))
+
+        assert fingerprint(exc1) != fingerprint(exc2)
+        assert not same_exception(exc1, exc2)
+
+    def test_different_type_different_fingerprint(self) -> None:
+        exc1 = self.catch(ValueError("Ni!"))
+        exc2 = self.catch(TypeError("Ni!"))
+
+        assert fingerprint(exc1) != fingerprint(exc2)
+
+    def test_different_location_different_fingerprint(self) -> None:
+        exc1 = self.catch(ValueError("Ni!"))
+        exc2 = self.catch_elsewhere(ValueError("Ni!"))
+
+        assert fingerprint(exc1) != fingerprint(exc2)
+
+    def test_is_hashable(self) -> None:
+        exc = self.catch(ValueError("Ni!"))
+
+        assert len({fingerprint(exc), fingerprint(exc)}) == 1
+
+    @mock.patch("screenpy.actions.eventually.time", autospec=True)
+    def test_eventually_remembers_each_kind_once(
+        self, mocked_time: mock.Mock, Tester: Actor
+    ) -> None:
+        mocked_time.monotonic = mock.create_autospec(
+            time.monotonic, side_effect=[1] * 8 + [100]
+        )
+        mock_action = FakeAction()
+        mock_action.perform_as.side_effect = [
+            ValueError("Ni!"),
+            ValueError("Ni!"),
+            TypeError("Ni!"),
+            ValueError("Ni!"),
+        ]
+        ev = Eventually(mock_action)
+
+        with pytest.raises(DeliveryError):
+            ev.perform_as(Tester)
+
+        assert [type(e) for e in ev.unique_errors.values()] == [ValueError, TypeError]
+
+
 class TestLog:
     def test_can_be_instantiated(self) -> None:
         l1 = Log(FakeQuestion())
@@ -428,6 +896,23 @@ class TestMakeNote:
     def test_describe(self) -> None:
         assert MakeNote(None).as_("blah").describe() == "Make a note under 'blah'."
 
+    def test_perform_as_async(self, Tester: Actor) -> None:
+        key = "key"
+        value = "async note"
+
+        asyncio.run(
+            MakeNote.of_the(AsyncQuestion(value)).as_(key).perform_as_async(Tester)
+        )
+
+        assert Director().looks_up(key) == value
+
+    def test_perform_as_async_with_sync_question(self, Tester: Actor) -> None:
+        mock_question = FakeQuestion()
+
+        asyncio.run(MakeNote.of_the(mock_question).as_("key").perform_as_async(Tester))
+
+        mock_question.answered_by.assert_called_once_with(Tester)
+
     @mock.patch("screenpy.actions.make_note.aside", autospec=True)
     def test_caught_exception_noted(self, mock_aside: mock.Mock, Tester: Actor) -> None:
         key = "key"
@@ -504,6 +989,16 @@ class TestPause:
 
         mocked_sleep.assert_called_once_with(duration)
 
+    @mock.patch("screenpy.actions.pause.sleep", autospec=True)
+    def test_sleep_is_capped_by_deadline(
+        self, mocked_sleep: mock.Mock, Tester: Actor
+    ) -> None:
+        with within(5):
+            Pause.for_(20).seconds_because("").perform_as(Tester)
+
+        (slept,), _ = mocked_sleep.call_args
+        assert slept <= 5
+
     def test_complains_for_missing_reason(self, Tester: Actor) -> None:
         with pytest.raises(UnableToAct):
             Pause.for_(20).perform_as(Tester)
@@ -601,6 +1096,39 @@ class TestSee:
             "     but: was <True>\n",
         ]
 
+    def test_perform_as_async(
+        self, Tester: Actor, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        with caplog.at_level(logging.INFO):
+            asyncio.run(
+                See(AsyncQuestion(True), IsEqualTo(True)).perform_as_async(Tester)
+            )
+
+        assert [r.msg for r in caplog.records] == [
+            "Tester sees if the async answer is equal to <True>.",
+            "    ... hoping it's equal to <True>.",
+            "        => <True>",
+        ]
+
+    def test_perform_as_async_fails(self, Tester: Actor) -> None:
+        see = See(AsyncQuestion(True), IsEqualTo(False))
+
+        with pytest.raises(AssertionError):
+            asyncio.run(see.perform_as_async(Tester))
+
+    @mock.patch("screenpy.actions.see.assert_that", autospec=True)
+    def test_perform_as_async_with_value(
+        self, mocked_assert_that: mock.Mock, Tester: Actor
+    ) -> None:
+        test_value = "Polly"
+        mock_resolution = FakeResolution()
+
+        asyncio.run(See.the(test_value, mock_resolution).perform_as_async(Tester))
+
+        mocked_assert_that.assert_called_once_with(
+            test_value, mock_resolution.resolve.return_value, ""
+        )
+
 
 class TestSeeAllOf:
     def test_can_be_instantiated(self) -> None:
@@ -711,6 +1239,105 @@ class TestSeeAllOf:
             "            => <True>",
         ]
 
+    def test_can_be_concurrent(self) -> None:
+        test = (FakeQuestion(), IsEqualTo(True))
+        sao1 = SeeAllOf(test).concurrently()
+        sao2 = SeeAllOf(test).in_parallel(max_workers=3)
+
+        assert sao1.concurrent
+        assert sao1.max_workers is None
+        assert sao2.concurrent
+        assert sao2.max_workers == 3
+
+    def test_concurrently_answers_at_the_same_time(self, Tester: Actor) -> None:
+        # each Question waits for the others; serially, this would time out.
+        barrier = threading.Barrier(3, timeout=5)
+
+        SeeAllOf(
+            (SlowQuestion(True, barrier=barrier), IsEqualTo(True)),
+            (SlowQuestion(True, barrier=barrier), IsEqualTo(True)),
+            (SlowQuestion(True, barrier=barrier), IsEqualTo(True)),
+        ).concurrently().perform_as(Tester)
+
+    def test_concurrently_narrates_in_order(
+        self, Tester: Actor, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        tests = (
+            (SlowQuestion(1, delay=0.1), IsEqualTo(1)),
+            (SlowQuestion(2, delay=0.05), IsEqualTo(2)),
+            (SlowQuestion(3), IsEqualTo(3)),
+        )
+        caplog.set_level(logging.INFO)
+
+        SeeAllOf(*tests).perform_as(Tester)
+        serial_log = [r.msg for r in caplog.records]
+        caplog.clear()
+        SeeAllOf(*tests).concurrently().perform_as(Tester)
+
+        assert [r.msg for r in caplog.records] == serial_log
+        assert serial_log[:5] == [
+            "Tester sees if all of 3 tests pass:",
+            "    Tester sees if the slow answer is equal to <1>.",
+            "        Tester slowly works out the answer.",
+            "            => <1>",
+            "        ... hoping it's equal to <1>.",
+        ]
+
+    def test_concurrently_raises_first_failure(
+        self, Tester: Actor, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        caplog.set_level(logging.INFO)
+
+        with pytest.raises(AssertionError) as actual_exception:
+            SeeAllOf(
+                (SlowQuestion(True), IsEqualTo(True)),
+                (SlowQuestion(False), IsEqualTo(True)),  # <--
+                (SlowQuestion(True, delay=0.05), IsEqualTo(False)),
+            ).concurrently().perform_as(Tester)
+
+        assert "was <False>" in str(actual_exception.value)
+        assert "sees if the slow answer is equal to <False>." not in caplog.text
+
+    def test_concurrently_raises_question_errors(self, Tester: Actor) -> None:
+        mock_question = FakeQuestion()
+        mock_question.answered_by.side_effect = ValueError("I'm not dead yet!")
+
+        with pytest.raises(ValueError, match="I'm not dead yet!"):
+            SeeAllOf(
+                (SlowQuestion(True), IsEqualTo(True)),
+                (mock_question, IsEqualTo(True)),
+            ).concurrently().perform_as(Tester)
+
+    def test_perform_as_async(self, Tester: Actor) -> None:
+        asyncio.run(
+            SeeAllOf(
+                (AsyncQuestion(True), IsEqualTo(True)),
+                (SlowQuestion(True), IsEqualTo(True)),
+            ).perform_as_async(Tester)
+        )
+
+    def test_perform_as_async_concurrently(self, Tester: Actor) -> None:
+        sao = SeeAllOf(
+            (AsyncQuestion(True, delay=0.2), IsEqualTo(True)),
+            (AsyncQuestion(True, delay=0.2), IsEqualTo(True)),
+            (AsyncQuestion(True, delay=0.2), IsEqualTo(True)),
+            (SlowQuestion(True, delay=0.2), IsEqualTo(True)),
+        ).concurrently()
+
+        start = time.perf_counter()
+        asyncio.run(sao.perform_as_async(Tester))
+
+        assert time.perf_counter() - start < 0.6
+
+    def test_perform_as_async_concurrently_fails(self, Tester: Actor) -> None:
+        sao = SeeAllOf(
+            (AsyncQuestion(True), IsEqualTo(True)),
+            (AsyncQuestion(True), IsEqualTo(False)),
+        ).concurrently()
+
+        with pytest.raises(AssertionError):
+            asyncio.run(sao.perform_as_async(Tester))
+
     def test_describe(self) -> None:
         test = (FakeQuestion(), IsEqualTo(True))
         tests = (
@@ -724,6 +1351,94 @@ class TestSeeAllOf:
         assert SeeAllOf(test).describe() == "See if 1 test passes."
         assert SeeAllOf(*tests).describe() == f"See if all of {len(tests)} tests pass."
 
+    def test_answers_batches_together(self, Tester: Actor) -> None:
+        resource: dict[str, object] = {"id": 1, "name": "order", "total": 3}
+        first = FieldOf("id", resource)
+
+        Tester.should(
+            SeeAllOf(
+                (first, IsEqualTo(1)),
+                (FieldOf("name", resource), IsEqualTo("order")),
+                (1, IsEqualTo(1)),
+                (FieldOf("total", resource), IsEqualTo(3)),
+            )
+        )
+
+        assert isinstance(first, BatchAnswerable)
+        assert first.requests == [["id", "name", "total"]]
+
+    def test_only_batches_questions_of_one_class(self, Tester: Actor) -> None:
+        class OtherFieldOf(FieldOf):
+            pass
+
+        resource: dict[str, object] = {"id": 1, "name": "order"}
+        first = FieldOf("id", resource)
+        other = OtherFieldOf("name", resource)
+
+        Tester.should(SeeAllOf((first, IsEqualTo(1)), (other, IsEqualTo("order"))))
+
+        assert first.requests == [["id"]]
+        assert other.requests == [["name"]]
+
+    def test_lone_batch_question_is_answered_alone(self, Tester: Actor) -> None:
+        question = FieldOf("id", {"id": 1})
+
+        Tester.should(
+            SeeAllOf((question, IsEqualTo(1)), (FieldOf("id", {"id": 2}), IsEqualTo(2)))
+        )
+
+        assert question.requests == [["id"]]
+
+    def test_batch_failure_is_raised(self, Tester: Actor) -> None:
+        resource: dict[str, object] = {"id": 1}
+
+        with pytest.raises(KeyError):
+            Tester.should(
+                SeeAllOf(
+                    (FieldOf("id", resource), IsEqualTo(1)),
+                    (FieldOf("missing", resource), IsEqualTo(2)),
+                )
+            )
+
+    def test_batches_concurrently(self, Tester: Actor) -> None:
+        resource: dict[str, object] = {"id": 1, "name": "order"}
+        first = FieldOf("id", resource)
+
+        Tester.should(
+            SeeAllOf(
+                (first, IsEqualTo(1)),
+                (FieldOf("name", resource), IsEqualTo("order")),
+                (SlowQuestion(5), IsEqualTo(5)),
+            ).concurrently()
+        )
+
+        assert first.requests == [["id", "name"]]
+
+    def test_batch_narration(
+        self, Tester: Actor, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        resource: dict[str, object] = {"id": 1, "name": "order"}
+        caplog.set_level(logging.INFO)
+
+        Tester.should(
+            SeeAllOf(
+                (FieldOf("id", resource), IsEqualTo(1)),
+                (FieldOf("name", resource), IsEqualTo("order")),
+            )
+        )
+
+        assert [r.msg for r in caplog.records] == [
+            "Tester sees if all of 2 tests pass:",
+            "    Tester sees if the id is equal to <1>.",
+            "        Tester fetches the whole resource.",
+            "            => <[1, 'order']>",
+            "        ... hoping it's equal to <1>.",
+            "            => <1>",
+            "    Tester sees if the name is equal to 'order'.",
+            "        ... hoping it's equal to 'order'.",
+            "            => 'order'",
+        ]
+
 
 class TestSeeAnyOf:
     def test_can_be_instantiated(self) -> None:
@@ -816,6 +1531,120 @@ class TestSeeAnyOf:
             (FakeQuestion(), IsEqualTo(False)),
         ).perform_as(Tester)
 
+    def test_can_race(self) -> None:
+        test = (FakeQuestion(), IsEqualTo(True))
+        sao1 = SeeAnyOf(test).racing()
+        sao2 = SeeAnyOf(test).first_to_pass(max_workers=3)
+
+        assert sao1.race
+        assert sao1.max_workers is None
+        assert sao2.race
+        assert sao2.max_workers == 3
+
+    def test_racing_returns_on_first_pass(self, Tester: Actor) -> None:
+        sao = SeeAnyOf(
+            (SlowQuestion(False, delay=2), IsEqualTo(True)),
+            (SlowQuestion(True), IsEqualTo(True)),
+        ).racing()
+
+        start = time.perf_counter()
+        sao.perform_as(Tester)
+
+        assert time.perf_counter() - start < 1
+
+    def test_racing_calls_off_the_losers(self, Tester: Actor) -> None:
+        patient_question = PatientQuestion()
+
+        SeeAnyOf(
+            (patient_question, IsEqualTo(True)),
+            (SlowQuestion(True, delay=0.1), IsEqualTo(True)),
+        ).racing().perform_as(Tester)
+
+        assert patient_question.gave_up.wait(1)
+
+    def test_racing_narrates_the_winner(
+        self, Tester: Actor, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        caplog.set_level(logging.INFO)
+
+        SeeAnyOf(
+            (SlowQuestion(1, delay=0.5), IsEqualTo(2)),
+            (SlowQuestion(2), IsEqualTo(2)),
+        ).racing().perform_as(Tester)
+
+        assert [r.msg for r in caplog.records] == [
+            "Tester sees if any of 2 tests pass:",
+            "    Tester sees if the slow answer is equal to <2>.",
+            "        Tester slowly works out the answer.",
+            "            => <2>",
+            "        ... hoping it's equal to <2>.",
+            "            => <2>",
+        ]
+
+    def test_racing_with_generator_answers(self, Tester: Actor) -> None:
+        """Generators can only be looked through once, but are checked twice"""
+        SeeAnyOf(
+            (SlowQuestion(iter([1, 2])), ContainsTheItem(3)),
+            (SlowQuestion(n for n in [1, 2, 3]), ContainsTheItem(3)),
+        ).racing().perform_as(Tester)
+
+    def test_racing_narrates_everything_if_none_pass(
+        self, Tester: Actor, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        tests = (
+            (SlowQuestion(1, delay=0.05), IsEqualTo(2)),
+            (SlowQuestion(2), IsEqualTo(3)),
+        )
+        caplog.set_level(logging.INFO)
+
+        with pytest.raises(AssertionError):
+            SeeAnyOf(*tests).perform_as(Tester)
+        serial_log = [r.msg for r in caplog.records]
+        caplog.clear()
+        with pytest.raises(AssertionError) as actual_exception:
+            SeeAnyOf(*tests).racing().perform_as(Tester)
+
+        assert [r.msg for r in caplog.records] == serial_log
+        assert "did not find any expected answers" in str(actual_exception.value)
+
+    def test_racing_raises_question_errors_if_none_pass(self, Tester: Actor) -> None:
+        mock_question = FakeQuestion()
+        mock_question.answered_by.side_effect = ValueError("It's just a model.")
+
+        with pytest.raises(ValueError, match="just a model"):
+            SeeAnyOf(
+                (SlowQuestion(False), IsEqualTo(True)),
+                (mock_question, IsEqualTo(True)),
+            ).racing().perform_as(Tester)
+
+    def test_perform_as_async(self, Tester: Actor) -> None:
+        asyncio.run(
+            SeeAnyOf(
+                (AsyncQuestion(False), IsEqualTo(True)),
+                (SlowQuestion(True), IsEqualTo(True)),
+            ).perform_as_async(Tester)
+        )
+
+    def test_perform_as_async_racing(self, Tester: Actor) -> None:
+        sao = SeeAnyOf(
+            (AsyncQuestion(False, delay=2), IsEqualTo(True)),
+            (AsyncQuestion(True), IsEqualTo(True)),
+        ).racing()
+
+        start = time.perf_counter()
+        asyncio.run(sao.perform_as_async(Tester))
+
+        assert time.perf_counter() - start < 1
+
+    def test_perform_as_async_racing_fails(self, Tester: Actor) -> None:
+        sao = SeeAnyOf(
+            (AsyncQuestion(False), IsEqualTo(True)),
+            (AsyncQuestion(False), IsEqualTo(True)),
+        ).racing()
+
+        with pytest.raises(AssertionError):
+            asyncio.run(sao.perform_as_async(Tester))
+
     def test_describe(self) -> None:
         test = (FakeQuestion(), IsEqualTo(True))
         tests = (
@@ -829,6 +1658,46 @@ class TestSeeAnyOf:
         assert SeeAnyOf(test).describe() == "See if 1 test passes."
         assert SeeAnyOf(*tests).describe() == f"See if any of {len(tests)} tests pass."
 
+    def test_answers_batches_together(self, Tester: Actor) -> None:
+        resource: dict[str, object] = {"id": 1, "name": "order"}
+        first = FieldOf("id", resource)
+
+        Tester.should(
+            SeeAnyOf(
+                (first, IsEqualTo(2)),
+                (FieldOf("name", resource), IsEqualTo("order")),
+            )
+        )
+
+        assert first.requests == [["id", "name"]]
+
+    def test_batch_wins_race(self, Tester: Actor) -> None:
+        resource: dict[str, object] = {"id": 1, "name": "order"}
+        slow_question = SlowQuestion(1, delay=1)
+
+        started = time.perf_counter()
+        Tester.should(
+            SeeAnyOf(
+                (slow_question, IsEqualTo(1)),
+                (FieldOf("id", resource), IsEqualTo(2)),
+                (FieldOf("name", resource), IsEqualTo("order")),
+            ).racing()
+        )
+
+        assert time.perf_counter() - started < 0.5
+
+    def test_raises_when_no_batched_answer_passes(self, Tester: Actor) -> None:
+        resource: dict[str, object] = {"id": 1, "name": "order"}
+
+        with pytest.raises(AssertionError, match="did not find any"):
+            Tester.should(
+                SeeAnyOf(
+                    (FieldOf("id", resource), IsEqualTo(2)),
+                    (FieldOf("name", resource), IsEqualTo("cart")),
+                    (3, IsEqualTo(4)),
+                ).racing()
+            )
+
 
 class SimpleQuestion(Answerable):
     @beat("{} examines SimpleQuestion")
@@ -1062,6 +1931,136 @@ class TestSilentlyUnabridged:
         assert [r.msg for r in caplog.records] == []
 
 
+class TestSoftly:
+    def test_can_be_instantiated(self) -> None:
+        s1 = Softly()
+        s2 = Softly(FakeAction(), FakeAction())
+
+        assert isinstance(s1, Softly)
+        assert isinstance(s2, Softly)
+
+    def test_implements_protocol(self) -> None:
+        assert isinstance(Softly(), Performable)
+        assert isinstance(Softly(), Describable)
+
+    def test_describe(self) -> None:
+        s1 = Softly(See(1, IsEqualTo(1)), See(2, IsEqualTo(2)))
+
+        assert s1.describe() == (
+            "Softly see if the int is equal to <1>, see if the int is equal to <2>."
+        )
+
+    def test_passes_when_nothing_fails(self, Tester: Actor) -> None:
+        Tester.should(
+            Softly(See(1, IsEqualTo(1)), SeeAllOf((2, IsEqualTo(2)))),
+        )
+
+    def test_collects_every_failure(self, Tester: Actor) -> None:
+        with pytest.raises(SoftAssertionError) as actual_exception:
+            Tester.should(
+                Softly(
+                    See(1, IsEqualTo(2)),
+                    See(1, IsEqualTo(1)),
+                    SeeAllOf((3, IsEqualTo(4)), (5, IsEqualTo(6))),
+                    SeeAnyOf((7, IsEqualTo(8))),
+                )
+            )
+
+        failures = actual_exception.value.failures
+        assert len(failures) == 4
+        assert str(failures[-1]) == "Tester did not find any expected answers!"
+        assert str(actual_exception.value).startswith("4 soft assertions failed:")
+        assert isinstance(actual_exception.value, AssertionError)
+
+    def test_as_context_manager(self, Tester: Actor) -> None:
+        def check_twice() -> None:
+            with Softly():
+                Tester.should(See(1, IsEqualTo(2)))
+                Tester.should(See(3, IsEqualTo(4)))
+
+        with pytest.raises(SoftAssertionError) as actual_exception:
+            check_twice()
+
+        assert len(actual_exception.value.failures) == 2
+
+    def test_other_errors_are_not_hidden(self, Tester: Actor) -> None:
+        def check_then_break() -> None:
+            with Softly():
+                Tester.should(See(1, IsEqualTo(2)))
+                raise_(ValueError("boom"))
+
+        with pytest.raises(ValueError, match="boom"):
+            check_then_break()
+
+    def test_nested_failures_go_to_the_outer_check(self, Tester: Actor) -> None:
+        def check_inside_a_check() -> None:
+            with Softly():
+                Tester.should(Softly(See(1, IsEqualTo(2))))
+                Tester.should(See(3, IsEqualTo(4)))
+
+        with pytest.raises(SoftAssertionError) as actual_exception:
+            check_inside_a_check()
+
+        assert len(actual_exception.value.failures) == 2
+
+    def test_firm_outside(self, Tester: Actor) -> None:
+        with Softly():
+            pass
+
+        with pytest.raises(AssertionError) as actual_exception:
+            Tester.should(See(1, IsEqualTo(2)))
+
+        assert not isinstance(actual_exception.value, SoftAssertionError)
+
+    def test_eventually_still_retries(self, Tester: Actor) -> None:
+        question = FakeQuestion()
+        question.answered_by.side_effect = [1, 2]
+        question.describe.return_value = "The number."
+
+        with Softly():
+            Tester.should(Eventually(See(question, IsEqualTo(2))).polling_every(0))
+
+        assert question.answered_by.call_count == 2
+
+    def test_either_still_falls_back(self, Tester: Actor) -> None:
+        fallback = FakeAction()
+
+        with Softly():
+            Tester.will(Either(See(1, IsEqualTo(2))).or_(fallback))
+
+        fallback.perform_as.assert_called_once_with(Tester)
+
+    def test_async(self, Tester: Actor) -> None:
+        with pytest.raises(SoftAssertionError) as actual_exception:
+            asyncio.run(
+                Tester.attempts_to_async(
+                    Softly(See(AsyncQuestion(1), IsEqualTo(2)), See(3, IsEqualTo(4)))
+                )
+            )
+
+        assert len(actual_exception.value.failures) == 2
+
+    def test_narration(self, Tester: Actor, caplog: pytest.LogCaptureFixture) -> None:
+        caplog.set_level(logging.INFO)
+
+        with pytest.raises(SoftAssertionError):
+            Tester.should(Softly(See(1, IsEqualTo(2)), See(3, IsEqualTo(3))))
+
+        assert [r.msg.split("\n")[0] for r in caplog.records] == [
+            "Tester checks softly:",
+            "    Tester sees if the int is equal to <2>.",
+            "        the actual value is: <1>",
+            "        ... hoping it's equal to <2>.",
+            "            => <2>",
+            "        ***ERROR***",
+            "    Tester sees if the int is equal to <3>.",
+            "        the actual value is: <3>",
+            "        ... hoping it's equal to <3>.",
+            "            => <3>",
+            "    ***ERROR***",
+        ]
+
+
 class TestEither:
     settings_path = "screenpy.actions.either.settings"
 
@@ -1157,6 +2156,26 @@ class TestEither:
         assert mock_clear.call_count == 2
         assert mock_flush.call_count == 1
 
+    def test_perform_as_async_first_action_passes(self, Tester: Actor) -> None:
+        action1 = AsyncDoThingThatFails(failures=0)
+        action2 = FakeAction()
+
+        either = Either(action1).or_(action2)  # type: ignore[arg-type]
+        asyncio.run(either.perform_as_async(Tester))
+
+        assert action1.attempts == 1
+        assert action2.perform_as.call_count == 0
+
+    def test_perform_as_async_first_action_fails(self, Tester: Actor) -> None:
+        action1 = AsyncDoThingThatFails(failures=1)
+        action2 = AsyncDoThingThatFails(failures=0)
+
+        either = Either(action1).or_(action2)  # type: ignore[arg-type]
+        asyncio.run(either.perform_as_async(Tester))
+
+        assert action1.attempts == 1
+        assert action2.attempts == 1
+
     def test_output_first_fails(
         self, Tester: Actor, caplog: pytest.LogCaptureFixture
     ) -> None:
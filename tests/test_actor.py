@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import pytest
@@ -57,6 +58,23 @@ def test_calls_perform_as() -> None:
     assert action.perform_as.call_count == len(perform_aliases) + 1
 
 
+def test_attempts_to_async() -> None:
+    performed = []
+
+    class AsyncAction:
+        async def perform_as_async(self, the_actor: Actor) -> None:
+            await asyncio.sleep(0)
+            performed.append(the_actor)
+
+    action = FakeAction()
+    actor = Actor.named("Tester")
+
+    asyncio.run(actor.attempts_to_async(AsyncAction(), action))
+
+    assert performed == [actor]
+    action.perform_as.assert_called_once_with(actor)
+
+
 def test_complains_for_missing_abilities() -> None:
     actor = Actor.named("Tester")
 
@@ -78,6 +96,73 @@ def test_find_abilities() -> None:
     assert actor.ability_to(FakeAbility) is ability
 
 
+def test_find_abilities_by_parent_class() -> None:
+    class ParentAbility:
+        def forget(self) -> None:
+            pass
+
+    class ChildAbility(ParentAbility):
+        pass
+
+    ability = ChildAbility()
+    actor = Actor.named("Tester").who_can(FakeAbility(), ability)
+
+    assert actor.ability_to(ParentAbility) is ability
+    assert actor.ability_to(ChildAbility) is ability
+
+
+def test_finds_newly_learned_abilities() -> None:
+    ability = FakeAbility()
+    actor = Actor.named("Tester")
+
+    assert not actor.has_ability_to(FakeAbility)
+
+    actor.who_can(ability)
+
+    assert actor.has_ability_to(FakeAbility)
+    assert actor.ability_to(FakeAbility) is ability
+
+
+def test_finds_abilities_added_directly() -> None:
+    ability = FakeAbility()
+    actor = Actor.named("Tester")
+
+    assert not actor.has_ability_to(FakeAbility)
+
+    actor.abilities.append(ability)
+
+    assert actor.has_ability_to(FakeAbility)
+    assert actor.ability_to(FakeAbility) is ability
+
+
+def test_abilities_removed_directly_are_not_found() -> None:
+    first_ability = FakeAbility()
+    second_ability = FakeAbility()
+    actor = Actor.named("Tester").who_can(first_ability, second_ability)
+
+    assert actor.ability_to(FakeAbility) is first_ability
+
+    actor.abilities.remove(first_ability)
+
+    assert actor.ability_to(FakeAbility) is second_ability
+
+    actor.abilities.clear()
+
+    assert not actor.has_ability_to(FakeAbility)
+
+
+def test_forgotten_abilities_are_not_found() -> None:
+    actor = Actor.named("Tester").who_can(FakeAbility())
+
+    assert actor.has_ability_to(FakeAbility)
+
+    actor.exit()
+
+    assert not actor.has_ability_to(FakeAbility)
+    with pytest.raises(UnableToPerform):
+        actor.ability_to(FakeAbility)
+
+
 def test_performs_cleanup_tasks_when_exiting() -> None:
     mocked_ordered_task = FakeAction()
     mocked_independent_task = FakeAction()
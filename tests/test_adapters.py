@@ -1,4 +1,5 @@
 import logging
+import threading
 
 import pytest
 
@@ -36,6 +37,25 @@ class TestStdOutManager:
         # context persists until manager._outdent is called
         assert len(manager.depth) == 1
 
+    def test_depth_is_separate_for_each_thread(self) -> None:
+        manager = StdOutManager()
+        both_indented = threading.Barrier(2)
+        depths = []
+
+        def indent_twice() -> None:
+            with manager.log_context("one"), manager.log_context("two"):
+                both_indented.wait()
+                depths.append(len(manager.depth))
+
+        threads = [threading.Thread(target=indent_twice) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert depths == [2, 2]
+        assert len(manager.depth) == 0
+
     def test_step(self, caplog: pytest.LogCaptureFixture) -> None:
         manager = StdOutManager()
         test_message = "Wow. I'm Mr. Manager."
@@ -137,6 +157,39 @@ class TestStdOutAdapter:
         assert expected_exception.__class__.__name__ in caplog.records[0].message
         assert str(expected_exception) in caplog.records[0].message
 
+    def test_error_is_logged_once_in_each_thread(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        adapter = StdOutAdapter()
+        first_error = ValueError("We're gonna need a bigger boat.")
+        second_error = ValueError("Snakes. Why is it always snakes?")
+        first_logged = threading.Event()
+        second_logged = threading.Event()
+
+        def log_first_error_twice() -> None:
+            adapter.error(first_error)
+            first_logged.set()
+            second_logged.wait()
+            adapter.error(first_error)
+
+        def log_second_error() -> None:
+            first_logged.wait()
+            adapter.error(second_error)
+            second_logged.set()
+
+        threads = [
+            threading.Thread(target=log_first_error_twice),
+            threading.Thread(target=log_second_error),
+        ]
+        with caplog.at_level(logging.INFO):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(caplog.records) == 2
+        assert adapter.handled_exception is None
+
     def test_attach(self, caplog: pytest.LogCaptureFixture) -> None:
         test_filepath = "freakazoid/documents/freak_in.png"
         adapter = StdOutAdapter()
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import pytest
+
+from screenpy import (
+    Actor,
+    AnswerCache,
+    ContainsTheItem,
+    Eventually,
+    IsEqualTo,
+    Log,
+    MakeNote,
+    See,
+    SeeAllOf,
+    Silently,
+    UnableToAnswer,
+    the_noted,
+)
+from screenpy.answer_cache import answer_all_to, answer_to, forget_answers
+
+from .useful_mocks import FieldOf, get_mock_action_class
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+FakeAction = get_mock_action_class()
+
+
+@dataclass(frozen=True)
+class Counter:
+    """A Question which counts how many times it was asked."""
+
+    name: str = "the counter"
+    asked: list[int] = field(default_factory=list, compare=False, hash=False)
+
+    def answered_by(self, _: Actor) -> int:
+        self.asked.append(1)
+        return len(self.asked)
+
+    def describe(self) -> str:
+        return self.name
+
+
+class Unhashable:
+    """A Question which cannot be hashed."""
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def answered_by(self, _: Actor) -> str:
+        return "unhashable"
+
+    def describe(self) -> str:
+        return "The unhashable answer."
+
+
+class AsyncCounter(Counter):
+    """A Question which counts how many times it was awaited."""
+
+    async def answered_by_async(self, the_actor: Actor) -> int:
+        return self.answered_by(the_actor)
+
+
+class ProvidedAnswer:
+    """A Question which gives whatever answer it was given."""
+
+    def __init__(self, answer: object) -> None:
+        self.answer = answer
+
+    def answered_by(self, _: Actor) -> object:
+        return self.answer
+
+    def describe(self) -> str:
+        return "The provided answer."
+
+
+class TestAnswerCache:
+    def test_no_cache(self, Tester: Actor) -> None:
+        question = Counter()
+
+        assert answer_to(question, Tester) == 1
+        assert answer_to(question, Tester) == 2
+
+    def test_remembers_answers(self, Tester: Actor) -> None:
+        question = Counter()
+
+        with AnswerCache() as cache:
+            Tester.should(See(question, IsEqualTo(1)))
+            Tester.attempts_to(MakeNote.of_the(question).as_("count"), Log(question))
+
+        assert question.asked == [1]
+        assert the_noted("count") == 1
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_matches_equal_questions(self, Tester: Actor) -> None:
+        asked: list[int] = []
+
+        with AnswerCache() as cache:
+            answer_to(Counter(asked=asked), Tester)
+            answer_to(Counter(asked=asked), Tester)
+            answer_to(Counter("another counter", asked=asked), Tester)
+
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_matches_unhashable_questions_by_identity(self, Tester: Actor) -> None:
+        question = Unhashable()
+
+        with AnswerCache() as cache:
+            answer_to(question, Tester)
+            answer_to(question, Tester)
+            answer_to(Unhashable(), Tester)
+
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_actors_have_their_own_answers(self) -> None:
+        question = Counter()
+
+        with AnswerCache():
+            assert answer_to(question, Actor.named("Perry")) == 1
+            assert answer_to(question, Actor.named("Percival")) == 2
+
+    def test_forgets_after_an_action(self, Tester: Actor) -> None:
+        question = Counter()
+
+        with AnswerCache() as cache:
+            Tester.should(See(question, IsEqualTo(1)))
+            Tester.attempts_to(FakeAction())
+            Tester.should(See(question, IsEqualTo(2)))
+
+        assert (cache.hits, cache.misses, cache.forgotten) == (0, 2, 1)
+
+    def test_silently_keeps_answers(self, Tester: Actor) -> None:
+        question = Counter()
+
+        with AnswerCache() as cache:
+            Tester.should(Silently(See(question, IsEqualTo(1))))
+            Tester.should(See(question, IsEqualTo(1)))
+
+        assert cache.hits == 1
+
+    def test_eventually_gets_fresh_answers(self, Tester: Actor) -> None:
+        question = Counter()
+
+        with AnswerCache():
+            Tester.should(Eventually(See(question, IsEqualTo(3))).polling_every(0))
+
+        assert question.asked == [1, 1, 1]
+
+    def test_forgets_outer_answers_too(self, Tester: Actor) -> None:
+        question = Counter()
+
+        with AnswerCache() as outer:
+            answer_to(question, Tester)
+            with AnswerCache():
+                forget_answers()
+            answer_to(question, Tester)
+
+        assert (outer.hits, outer.misses) == (0, 2)
+
+    def test_reentered_cache(self, Tester: Actor) -> None:
+        question = Counter()
+        outer = AnswerCache()
+        cache = AnswerCache()
+
+        with outer, cache:
+            answer_to(question, Tester)
+            with cache:
+                forget_answers()
+                assert cache._outer is outer
+                with outer:
+                    forget_answers()
+            assert cache._outer is outer
+            answer_to(question, Tester)
+
+        assert cache._outer is None
+        assert cache.answers == {}
+        assert (cache.forgotten, outer.forgotten) == (2, 2)
+        assert question.asked == [1, 1]
+
+    def test_reentered_cache_keeps_answers_until_the_last_exit(
+        self, Tester: Actor
+    ) -> None:
+        question = Counter()
+        cache = AnswerCache()
+
+        with cache:
+            with cache:
+                answer_to(question, Tester)
+            answer_to(question, Tester)
+
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_answers_end_with_the_block(self, Tester: Actor) -> None:
+        question = Counter()
+
+        with AnswerCache() as cache:
+            answer_to(question, Tester)
+
+        assert cache.answers == {}
+        assert answer_to(question, Tester) == 2
+
+    def test_as_decorator(self, Tester: Actor) -> None:
+        question = Counter()
+        cache = AnswerCache()
+
+        @cache
+        def step(count: int) -> None:
+            Tester.should(
+                SeeAllOf((question, IsEqualTo(count)), (question, IsEqualTo(count)))
+            )
+
+        step(1)
+        step(2)
+
+        assert (cache.hits, cache.misses) == (2, 2)
+
+    def test_async(self, Tester: Actor) -> None:
+        question = AsyncCounter()
+
+        async def check_twice() -> None:
+            with AnswerCache():
+                await Tester.attempts_to_async(
+                    See(question, IsEqualTo(1)), See(question, IsEqualTo(1))
+                )
+
+        asyncio.run(check_twice())
+
+        assert question.asked == [1]
+
+    def test_does_not_remember_iterators(self, Tester: Actor) -> None:
+        rows = ProvidedAnswer(iter(["row"]))
+
+        with AnswerCache() as cache:
+            Tester.should(See(rows, ContainsTheItem("row")))
+            answer_to(rows, Tester)
+
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_repr(self) -> None:
+        assert repr(AnswerCache()) == "AnswerCache(hits=0, misses=0, forgotten=0)"
+
+
+class TestAnswerAllTo:
+    def test_no_cache(self, Tester: Actor) -> None:
+        resource: dict[str, object] = {"id": "ID", "name": "NAME"}
+        fields = [FieldOf("id", resource), FieldOf("name", resource)]
+
+        assert answer_all_to(fields, Tester) == ["ID", "NAME"]
+        assert fields[0].requests == [["id", "name"]]
+
+    def test_asks_only_for_unremembered_answers(self, Tester: Actor) -> None:
+        resource: dict[str, object] = {"id": "ID", "name": "NAME", "total": "TOTAL"}
+        first = FieldOf("id", resource)
+        name = FieldOf("name", resource)
+        fields = [first, name, FieldOf("total", resource)]
+
+        with AnswerCache() as cache:
+            answer_to(name, Tester)
+            answers = answer_all_to(fields, Tester)
+
+        assert answers == ["ID", "NAME", "TOTAL"]
+        assert name.requests == [["name"]]
+        assert first.requests == [["id", "total"]]
+        assert (cache.hits, cache.misses) == (1, 3)
+
+    def test_batched_answers_are_remembered(self, Tester: Actor) -> None:
+        resource: dict[str, object] = {"id": "ID", "name": "NAME"}
+        first = FieldOf("id", resource)
+        name = FieldOf("name", resource)
+
+        with AnswerCache():
+            Tester.should(
+                SeeAllOf(
+                    (first, IsEqualTo("ID")),
+                    (name, IsEqualTo("NAME")),
+                )
+            )
+            Tester.attempts_to(MakeNote.of_the(name).as_("name"))
+
+        assert first.requests == [["id", "name"]]
+        assert name.requests == []
+        assert the_noted("name") == "NAME"
+
+    def test_wrong_number_of_answers(
+        self, Tester: Actor, mocker: MockerFixture
+    ) -> None:
+        resource: dict[str, object] = {"id": "ID", "name": "NAME"}
+        fields = [FieldOf("id", resource), FieldOf("name", resource)]
+        mocker.patch.object(FieldOf, "answered_by_all", return_value=["ID"])
+
+        with pytest.raises(UnableToAnswer, match="1 answers for a batch of 2"):
+            answer_all_to(fields, Tester)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import threading
+
+from screenpy.deadline import called_off, called_off_by, cap, time_remaining, within
+
+
+def test_no_deadline() -> None:
+    assert time_remaining() is None
+    assert cap(30) == 30
+
+
+def test_within_sets_deadline() -> None:
+    with within(30) as budget:
+        remaining = time_remaining()
+
+    assert budget == 30
+    assert remaining is not None
+    assert 29 < remaining <= 30
+    assert time_remaining() is None
+
+
+def test_nested_deadline_is_capped() -> None:
+    with within(5), within(30) as budget:
+        remaining = time_remaining()
+
+    assert budget <= 5
+    assert remaining is not None
+    assert remaining <= 5
+
+
+def test_nested_deadline_can_be_sooner() -> None:
+    with within(30):
+        with within(5) as budget:
+            inner_remaining = time_remaining()
+        outer_remaining = time_remaining()
+
+    assert budget == 5
+    assert inner_remaining is not None
+    assert inner_remaining <= 5
+    assert outer_remaining is not None
+    assert outer_remaining > 5
+
+
+def test_cap_within_deadline() -> None:
+    with within(5):
+        capped = cap(30)
+
+    assert capped <= 5
+
+
+def test_expired_deadline_leaves_no_time() -> None:
+    with within(0):
+        assert time_remaining() == 0
+        assert cap(30) == 0
+
+
+def test_deadline_is_separate_per_thread() -> None:
+    remaining_in_thread = []
+
+    def check_remaining() -> None:
+        remaining_in_thread.append(time_remaining())
+
+    with within(30):
+        thread = threading.Thread(target=check_remaining)
+        thread.start()
+        thread.join()
+
+    assert remaining_in_thread == [None]
+
+
+def test_called_off() -> None:
+    stop = threading.Event()
+
+    with called_off_by(stop), within(30):
+        before = (called_off(), time_remaining())
+        stop.set()
+        after = (called_off(), time_remaining())
+
+    assert before[0] is False
+    assert before[1] is not None
+    assert before[1] > 29
+    assert after == (True, 0)
+    assert not called_off()
+
+
+def test_called_off_without_a_deadline() -> None:
+    stop = threading.Event()
+
+    with called_off_by(stop):
+        before = time_remaining()
+        stop.set()
+        after = time_remaining()
+
+    assert before is None
+    assert after == 0
+
+
+def test_outer_stop_signals_still_call_off() -> None:
+    outer, inner = threading.Event(), threading.Event()
+
+    with called_off_by(outer), called_off_by(inner):
+        outer.set()
+        assert called_off()
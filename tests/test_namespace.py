@@ -5,12 +5,15 @@ def test_screenpy() -> None:
     expected = [
         "AbilityError",
         "act",
+        "AcrossPages",
+        "AcrossThePages",
         "ActionError",
         "Actor",
         "Adapter",
         "AIRY",
         "AnActor",
         "and_",
+        "AnswerCache",
         "Answerable",
         "aside",
         "Assert",
@@ -29,35 +32,50 @@ def test_screenpy() -> None:
         "Attempts",
         "AttemptsTo",
         "AttemptTo",
+        "AsyncAnswerable",
+        "BatchAnswerable",
+        "AsyncPerformable",
         "BaseResolution",
         "beat",
+        "Capped",
         "Confirm",
         "ConfirmAllOf",
         "ConfirmAnyOf",
         "Confirms",
         "ConfirmsAllOf",
         "ConfirmsAnyOf",
+        "Constant",
         "ContainItemMatching",
+        "ContainItemsMatching",
         "ContainsItemMatching",
+        "ContainsItemsMatching",
         "ContainsTheEntries",
         "ContainsTheEntry",
         "ContainsTheItem",
+        "ContainsTheItems",
         "ContainsTheKey",
         "ContainsTheText",
         "ContainsTheValue",
+        "ContainsTheValues",
         "ContainTheEntries",
         "ContainTheEntry",
         "ContainTheItem",
+        "ContainTheItems",
         "ContainTheKey",
         "ContainTheText",
         "ContainTheValue",
+        "ContainTheValues",
         "Debug",
+        "DecorrelatedJitter",
         "DeliveryError",
         "Describable",
         "Director",
         "DoesNot",
         "DoNot",
         "Either",
+        "AllNumbers",
+        "EachNumber",
+        "EveryNumber",
         "Empty",
         "EndsWith",
         "EndWith",
@@ -66,7 +84,9 @@ def test_screenpy() -> None:
         "EqualTo",
         "ErrorKeeper",
         "Eventually",
+        "Exponential",
         "EXTREME",
+        "Fibonacci",
         "Forgettable",
         "given",
         "given_that",
@@ -112,11 +132,13 @@ def test_screenpy() -> None:
         "Pause",
         "Pauses",
         "Performable",
+        "PollingSchedule",
         "QuestionError",
         "Quietly",
         "ReadExactly",
         "ReadsExactly",
         "Resolvable",
+        "RetryCollector",
         "scene",
         "ScreenPyError",
         "See",
@@ -129,6 +151,8 @@ def test_screenpy() -> None:
         "Silently",
         "Sleep",
         "Sleeps",
+        "SoftAssertionError",
+        "Softly",
         "StartsWith",
         "StartWith",
         "StdOutAdapter",
@@ -208,6 +232,7 @@ def test_actions() -> None:
         "Silently",
         "Sleep",
         "Sleeps",
+        "Softly",
         "TakeNote",
         "TakesNote",
         "Tries",
@@ -226,23 +251,34 @@ def test_actions() -> None:
 
 def test_resolutions() -> None:
     expected = [
+        "AcrossPages",
+        "AcrossThePages",
         "BaseResolution",
         "ContainItemMatching",
+        "ContainItemsMatching",
         "ContainsItemMatching",
+        "ContainsItemsMatching",
         "ContainsTheEntries",
         "ContainsTheEntry",
         "ContainsTheItem",
+        "ContainsTheItems",
         "ContainsTheKey",
         "ContainsTheText",
         "ContainsTheValue",
+        "ContainsTheValues",
         "ContainTheEntries",
         "ContainTheEntry",
         "ContainTheItem",
+        "ContainTheItems",
         "ContainTheKey",
         "ContainTheText",
         "ContainTheValue",
+        "ContainTheValues",
         "DoesNot",
         "DoNot",
+        "AllNumbers",
+        "EachNumber",
+        "EveryNumber",
         "Empty",
         "EndsWith",
         "EndWith",
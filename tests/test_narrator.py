@@ -1,17 +1,20 @@
+import asyncio
+import threading
 from typing import Callable, Dict, List, Tuple, Union
 from unittest import mock
 
 import pytest
 
 from screenpy import NORMAL, Adapter, Narrator, UnableToNarrate
-from screenpy.narration.narrator import _chainify
+from screenpy.configuration import ScreenPySettings
+from screenpy.narration.narrator import LazyLine, NarrationBackup, _chainify
 
 
 def _() -> None:
     """Dummy function for simple chaining tests."""
 
 
-T_KW = Dict[str, Union[Callable, str]]
+T_KW = Dict[str, Union[Callable, str, LazyLine]]
 T_Flat = List[Tuple[str, T_KW, int]]
 T_Chain = List[Tuple[str, T_KW, List]]
 
@@ -39,6 +42,10 @@ class TestChainify:
                 [("ch", KW, 1), ("ch", KW, 2), ("ch", KW, 3), ("ch", KW, 1)],
                 [("ch", KW, [("ch", KW, [("ch", KW, [])])]), ("ch", KW, [])],
             ),
+            (
+                [("ch", KW, 3), ("ch", KW, 4), ("ch", KW, 2), ("ch", KW, 3)],
+                [("ch", KW, [("ch", KW, [])]), ("ch", KW, [("ch", KW, [])])],
+            ),
         ],
     )
     def test_flat_narration(self, test_narrations: T_Flat, expected: T_Chain) -> None:
@@ -47,6 +54,93 @@ class TestChainify:
         assert actual == expected
 
 
+class TestLazyLine:
+    def test_composes_once(self) -> None:
+        compose = mock.Mock(return_value="Hello, Clarice.")
+        line = LazyLine(compose)
+
+        assert str(line) == "Hello, Clarice."
+        assert str(line) == "Hello, Clarice."
+        compose.assert_called_once()
+
+    def test_not_composed_without_adapters(self) -> None:
+        compose = mock.Mock(return_value="")
+        narrator = Narrator()
+
+        with narrator.stating_a_beat(_, LazyLine(compose)):
+            pass
+
+        compose.assert_not_called()
+
+    def test_composed_when_backed_up(self) -> None:
+        compose = mock.Mock(return_value="")
+        narrator = Narrator(adapters=[get_mock_adapter()])
+
+        with narrator.mic_cable_kinked():
+            narrator.stating_a_beat(_, LazyLine(compose))
+            compose.assert_called_once()
+            narrator.clear_backup()
+
+    def test_not_composed_when_backed_up_without_adapters(self) -> None:
+        compose = mock.Mock(return_value="")
+        narrator = Narrator()
+
+        with narrator.mic_cable_kinked():
+            narrator.stating_a_beat(_, LazyLine(compose))
+
+        compose.assert_not_called()
+
+    def test_composed_for_adapters(self) -> None:
+        mock_adapter = get_mock_adapter()
+        narrator = Narrator(adapters=[mock_adapter])
+
+        with narrator.stating_a_beat(_, LazyLine(lambda: "Hello, Clarice.")):
+            pass
+
+        mock_adapter.beat.assert_called_once_with(func=_, line="Hello, Clarice.")
+
+
+class TestNarrationBackup:
+    def test_unlimited(self) -> None:
+        backup = NarrationBackup()
+
+        for level in range(100):
+            backup.append(("beat", KW, level))
+
+        assert len(backup) == 100
+        assert backup.dropped == 0
+
+    def test_keeps_most_recent(self) -> None:
+        backup = NarrationBackup(limit=3)
+
+        for level in range(10):
+            backup.append(("beat", KW, level))
+
+        assert [level for _, _, level in backup] == [7, 8, 9]
+        assert backup.dropped == 7
+
+    def test_extend_keeps_dropped_count(self) -> None:
+        backup = NarrationBackup(limit=2)
+        other_backup = NarrationBackup(limit=2)
+        for level in range(3):
+            other_backup.append(("beat", KW, level))
+
+        backup.extend(other_backup)
+
+        assert backup == [("beat", KW, 1), ("beat", KW, 2)]
+        assert backup.dropped == 1
+
+    def test_clear(self) -> None:
+        backup = NarrationBackup(limit=1)
+        backup.append(("beat", KW, 1))
+        backup.append(("beat", KW, 1))
+
+        backup.clear()
+
+        assert backup == []
+        assert backup.dropped == 0
+
+
 class TestNarrator:
     def test_add_new_adapter(self) -> None:
         narrator = Narrator()
@@ -105,6 +199,24 @@ class TestNarrator:
         mock_adapter.beat.assert_called_once()
         mock_adapter.act.assert_called_once()
 
+    def test_mic_cable_kinked_with_limit(self) -> None:
+        mock_adapter = get_mock_adapter()
+        narrator = Narrator(adapters=[mock_adapter])
+        mock_settings = ScreenPySettings(KINKED_NARRATION_LIMIT=2)
+        settings_path = "screenpy.narration.narrator.settings"
+
+        with mock.patch(settings_path, mock_settings), narrator.mic_cable_kinked():
+            for line in ("one", "two", "three", "four"):
+                narrator.stating_a_beat(_, line)
+
+            assert len(narrator.backed_up_narrations[0]) == 2
+
+        lines = [c.kwargs["line"] for c in mock_adapter.beat.call_args_list]
+        assert lines == ["three", "four"]
+        mock_adapter.aside.assert_called_once()
+        aside_line = mock_adapter.aside.call_args.kwargs["line"]
+        assert aside_line == "... 2 earlier narrations dropped ..."
+
     def test_deep_kink(self) -> None:
         mock_adapter = get_mock_adapter()
         narrator = Narrator(adapters=[mock_adapter])
@@ -240,6 +352,33 @@ class TestNarrator:
         mock_adapter.beat.assert_called_once()
         mock_adapter.act.assert_called_once()
 
+    def test__entangle_chain_leaves_chain_alone(self) -> None:
+        narrator = Narrator()
+        inner_kw = dict(KW)
+        chain: T_Chain = [("act", dict(KW), [("scene", inner_kw, [])])]
+
+        for _adapter in range(3):
+            narrator._entangle_chain(get_mock_adapter(), chain)
+
+        assert chain == [("act", KW, [("scene", KW, [])])]
+        assert inner_kw["func"] is _
+
+    def test_flush_backup_enclosed_func(self) -> None:
+        mock_adapters = [get_mock_adapter() for _ in range(2)]
+        narrator = Narrator(adapters=mock_adapters)  # type: ignore[arg-type]
+        for mock_adapter in mock_adapters:
+            mock_adapter.act.side_effect = lambda func, **_: iter([func, None])
+            mock_adapter.beat.side_effect = lambda func, **_: iter([func, None])
+
+        with narrator.mic_cable_kinked():  # noqa: SIM117
+            with narrator.announcing_the_act(_, "act"):
+                narrator.stating_a_beat(_, "beat")
+
+        for mock_adapter in mock_adapters:
+            act_func = mock_adapter.act.call_args[1]["func"]
+            beat_func = mock_adapter.beat.call_args[1]["func"]
+            assert beat_func is act_func
+
     @pytest.mark.parametrize("channel", ["act", "scene", "beat", "aside"])
     def test__entangle_func(self, channel: str) -> None:
         mock_adapter = get_mock_adapter()
@@ -312,6 +451,47 @@ class TestNarrator:
 
         assert not narrator.cable_kinked
 
+    def test_kinks_are_separate_for_each_thread(self) -> None:
+        mock_adapter = get_mock_adapter()
+        narrator = Narrator(adapters=[mock_adapter])
+        both_kinked = threading.Barrier(2)
+        backups = []
+
+        def kinked_beat(line: str) -> None:
+            with narrator.mic_cable_kinked(), narrator.stating_a_beat(_, line):
+                both_kinked.wait()
+                backups.append([len(b) for b in narrator.backed_up_narrations])
+                narrator.clear_backup()
+
+        threads = [
+            threading.Thread(target=kinked_beat, args=(line,))
+            for line in ("Clarice", "Hannibal")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert backups == [[1], [1]]
+        assert not narrator.cable_kinked
+        mock_adapter.beat.assert_not_called()
+
+    def test_exit_level_is_separate_for_each_task(self) -> None:
+        narrator = Narrator()
+
+        async def nest(levels: int) -> int:
+            await asyncio.sleep(0)
+            if levels == 0:
+                return narrator.exit_level
+            with narrator._increase_exit_level():
+                return await nest(levels - 1)
+
+        async def perform() -> List[int]:  # noqa: FA100
+            return list(await asyncio.gather(nest(1), nest(2), nest(3)))
+
+        assert asyncio.run(perform()) == [2, 3, 4]
+        assert narrator.exit_level == 1
+
     def test_flush_backup_without_kink(self) -> None:
         mock_adapter = get_mock_adapter()
         narrator = Narrator(adapters=[mock_adapter])
@@ -320,3 +500,57 @@ class TestNarrator:
             narrator.flush_backup()
 
             clear_backup.assert_not_called()
+
+    def test_recording_is_not_narrated(self) -> None:
+        mock_adapter = get_mock_adapter()
+        narrator = Narrator(adapters=[mock_adapter])
+
+        with narrator.recording() as recording:
+            narrator.stating_a_beat(_, "beat")
+
+        mock_adapter.beat.assert_not_called()
+        assert len(recording) == 1
+        assert not narrator.cable_kinked
+        assert narrator.exit_level == 1
+
+    def test_recording_starts_at_the_top(self) -> None:
+        narrator = Narrator()
+
+        with narrator.mic_cable_kinked(), narrator.stating_a_beat(_, "beat"):
+            with narrator.recording() as recording:
+                narrator.stating_a_beat(_, "recorded beat")
+            outer_backup_length = len(narrator.backed_up_narrations[-1])
+
+        assert [level for _, _, level in recording] == [1]
+        assert outer_backup_length == 1
+
+    def test_replay(self) -> None:
+        mock_adapter = get_mock_adapter()
+        mock_adapter.beat.side_effect = lambda func, **_: iter([func, None])
+        narrator = Narrator(adapters=[mock_adapter])
+        with narrator.recording() as recording:  # noqa: SIM117
+            with narrator.stating_a_beat(_, "beat"):
+                narrator.whispering_an_aside("aside")
+
+        narrator.replay(recording)
+
+        mock_adapter.beat.assert_called_once()
+        assert mock_adapter.beat.call_args[1]["line"] == "beat"
+        mock_adapter.aside.assert_called_once()
+        assert mock_adapter.aside.call_args[1]["line"] == "aside"
+
+    def test_replay_into_kink(self) -> None:
+        narrator = Narrator()
+        with narrator.recording() as recording:  # noqa: SIM117
+            with narrator.stating_a_beat(_, "recorded beat"):
+                narrator.whispering_an_aside("recorded aside")
+
+        with narrator.mic_cable_kinked(), narrator.stating_a_beat(_, "beat"):
+            narrator.replay(recording)
+            backup = narrator.backed_up_narrations[-1]
+
+            assert [(kw["line"], level) for _, kw, level in backup] == [
+                ("beat", 1),
+                ("recorded beat", 2),
+                ("recorded aside", 3),
+            ]
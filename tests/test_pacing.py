@@ -1,12 +1,13 @@
 """This file intentionally does not use __future__.annotations."""
 
+import asyncio
 import logging
-from typing import Optional
+from typing import List, Optional
 from unittest import mock
 
 import pytest
 
-from screenpy import Actor, IsEqualTo, See, act, aside, beat, scene
+from screenpy import Actor, IsEqualTo, See, act, aside, beat, pacing, scene
 
 
 def prop() -> None:
@@ -35,6 +36,31 @@ class NonesyQuestion:
         return "NonesyQuestion"
 
 
+class Gossip:
+    def __init__(self) -> None:
+        self.times_told = 0
+
+    @property
+    def secret(self) -> str:
+        self.times_told += 1
+        return "the butler did it"
+
+    @beat("{} whispers that {secret}.")
+    def perform_as(self, _: Actor) -> None:
+        pass
+
+
+class Tally:
+    def __init__(self) -> None:
+        self.count = 1
+        self.added: List[int] = []
+
+    @beat("{} adds {count}.")
+    def perform_as(self, _: Actor) -> List[int]:
+        self.added.append(self.count)
+        return self.added
+
+
 class CornerCase:
     @beat("{} examines CornerCase")
     def answered_by(self, _: Actor) -> object:
@@ -109,7 +135,53 @@ class TestBeat:
 
         mocked_narrator.stating_a_beat.assert_called_once()
         completed_line = mocked_narrator.stating_a_beat.call_args_list[0][0][1]
-        assert completed_line == f"The {test_weapon} in the {test_room}!"
+        assert str(completed_line) == f"The {test_weapon} in the {test_room}!"
+
+    def test_line_is_parsed_once(self, mocked_narrator: mock.Mock) -> None:
+        test_prop = Prop("knife", "kitchen", "")
+        pattern = pacing.MARKER_PATTERN
+        undecorated_use = Prop.use.__wrapped__  # type: ignore[attr-defined]
+
+        with mock.patch.object(pacing, "MARKER_PATTERN", wraps=pattern) as patched:
+            use = beat("The {weapon1} in the {room}!")(undecorated_use)
+            use(test_prop)
+            use(test_prop)
+
+        patched.findall.assert_called_once()
+        assert mocked_narrator.stating_a_beat.call_count == 2
+        completed_line = mocked_narrator.stating_a_beat.call_args_list[1][0][1]
+        assert str(completed_line) == "The knife in the kitchen!"
+
+    def test_line_is_not_completed_off_the_air(self, Tester: Actor) -> None:
+        gossip = Gossip()
+
+        with pacing.the_narrator.off_the_air():
+            gossip.perform_as(Tester)
+
+        assert gossip.times_told == 0
+
+    def test_line_is_completed_when_narrated(self, Tester: Actor) -> None:
+        gossip = Gossip()
+
+        gossip.perform_as(Tester)
+
+        assert gossip.times_told == 1
+
+    def test_kinked_line_tells_of_things_as_they_were(
+        self, Tester: Actor, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        tally = Tally()
+        caplog.set_level(logging.INFO)
+
+        with pacing.the_narrator.mic_cable_kinked():
+            tally.perform_as(Tester)
+            tally.count = 101
+            tally.added.append(102)
+
+        assert [r.msg for r in caplog.records] == [
+            "Tester adds 1.",
+            "    => <[1]>",
+        ]
 
     def test_beat_logging_none(
         self, Tester: Actor, caplog: pytest.LogCaptureFixture
@@ -145,6 +217,26 @@ class TestBeat:
             "        => <None>",
         ]
 
+    def test_beat_on_coroutine(
+        self, Tester: Actor, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        class AsyncQuestion:
+            @beat("{} examines AsyncQuestion")
+            async def answered_by_async(self, _: Actor) -> int:
+                await asyncio.sleep(0)
+                aside("the answer is computed")
+                return 42
+
+        caplog.set_level(logging.INFO)
+        answer = asyncio.run(AsyncQuestion().answered_by_async(Tester))
+
+        assert answer == 42
+        assert [r.msg for r in caplog.records] == [
+            "Tester examines AsyncQuestion",
+            "    the answer is computed",
+            "    => <42>",
+        ]
+
 
 class TestAside:
     def test_calls_narrators_method(self, mocked_narrator: mock.Mock) -> None:
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import random
+from itertools import islice
+
+import pytest
+
+from screenpy import (
+    Capped,
+    Constant,
+    DecorrelatedJitter,
+    Exponential,
+    Fibonacci,
+    PollingSchedule,
+    UnableToAct,
+)
+from screenpy.polling import schedule_named
+
+
+def first(count: int, schedule: PollingSchedule, base: float) -> list[float]:
+    return list(islice(schedule.delays(base), count))
+
+
+class TestConstant:
+    def test_implements_protocol(self) -> None:
+        assert isinstance(Constant(), PollingSchedule)
+
+    def test_delays(self) -> None:
+        assert first(4, Constant(), 0.5) == [0.5, 0.5, 0.5, 0.5]
+
+
+class TestExponential:
+    def test_implements_protocol(self) -> None:
+        assert isinstance(Exponential(), PollingSchedule)
+
+    def test_delays(self) -> None:
+        assert first(5, Exponential(), 0.5) == [0.5, 1, 2, 4, 8]
+
+    def test_custom_factor(self) -> None:
+        assert first(4, Exponential(factor=1.5), 1) == [1, 1.5, 2.25, 3.375]
+
+    def test_factor_must_grow(self) -> None:
+        with pytest.raises(UnableToAct):
+            Exponential(factor=0.5)
+
+    def test_long_polls_do_not_overflow(self) -> None:
+        delays = first(2000, Capped(Exponential(), at=1), 0.5)
+
+        assert delays[-1] == 1
+
+
+class TestFibonacci:
+    def test_implements_protocol(self) -> None:
+        assert isinstance(Fibonacci(), PollingSchedule)
+
+    def test_delays(self) -> None:
+        assert first(6, Fibonacci(), 0.5) == [0.5, 0.5, 1, 1.5, 2.5, 4]
+
+    def test_long_polls_do_not_overflow(self) -> None:
+        delays = first(2000, Capped(Fibonacci(), at=1), 0.5)
+
+        assert delays[-1] == 1
+
+
+class TestDecorrelatedJitter:
+    def test_implements_protocol(self) -> None:
+        assert isinstance(DecorrelatedJitter(), PollingSchedule)
+
+    def test_delays_stay_in_bounds(self) -> None:
+        delays = first(50, DecorrelatedJitter(rng=random.Random(1)), 0.5)
+
+        assert delays[0] == 0.5
+        for previous, delay in zip(delays, delays[1:]):
+            assert 0.5 <= delay <= previous * 3
+
+    def test_delays_are_spread_out(self) -> None:
+        delays = first(10, DecorrelatedJitter(rng=random.Random(1)), 0.5)
+
+        assert len(set(delays)) == len(delays)
+
+    def test_factor_must_grow(self) -> None:
+        with pytest.raises(UnableToAct):
+            DecorrelatedJitter(factor=0)
+
+    def test_long_polls_do_not_overflow(self) -> None:
+        schedule = Capped(DecorrelatedJitter(factor=1000, rng=random.Random(1)), at=1)
+
+        delays = first(2000, schedule, 0.5)
+
+        assert delays[-1] == 1
+
+
+class TestCapped:
+    def test_implements_protocol(self) -> None:
+        assert isinstance(Capped(Exponential(), at=3), PollingSchedule)
+
+    def test_delays(self) -> None:
+        schedule = Capped(Exponential(), at=3)
+
+        assert first(5, schedule, 0.5) == [0.5, 1, 2, 3, 3]
+
+    def test_repr(self) -> None:
+        schedule = Capped(Exponential(), at=3)
+
+        assert repr(schedule) == "Capped(Exponential(factor=2), at=3)"
+
+
+class TestScheduleNamed:
+    @pytest.mark.parametrize(
+        ("name", "schedule_class"),
+        [
+            ("constant", Constant),
+            ("exponential", Exponential),
+            ("Fibonacci", Fibonacci),
+            ("decorrelated jitter", DecorrelatedJitter),
+        ],
+    )
+    def test_builds_schedule(self, name: str, schedule_class: type) -> None:
+        assert isinstance(schedule_named(name), schedule_class)
+
+    def test_caps_schedule(self) -> None:
+        schedule = schedule_named("exponential", cap=2)
+
+        assert isinstance(schedule, Capped)
+        assert first(4, schedule, 1) == [1, 2, 2, 2]
+
+    def test_unknown_name(self) -> None:
+        with pytest.raises(UnableToAct) as actual_exception:
+            schedule_named("whenever")
+
+        assert '"whenever"' in str(actual_exception.value)
+        assert '"fibonacci"' in str(actual_exception.value)
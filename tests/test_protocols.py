@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import gc
+import weakref
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+import pytest
+
+from screenpy import Answerable, ErrorKeeper, Performable, protocols
+from screenpy.protocols import (
+    _unprovided,
+    _unprovided_members,
+    conforms_to,
+    forget_conformance,
+)
+
+from .unittest_protocols import ErrorQuestion
+
+if TYPE_CHECKING:
+    from screenpy import Actor
+
+
+class CountTheCandles:
+    def answered_by(self, _: Actor) -> int:
+        return 8
+
+
+class BakeTheCake:
+    def perform_as(self, _: Actor) -> None:
+        pass
+
+
+class KeepsErrors:
+    def answered_by(self, _: Actor) -> int:
+        return 0
+
+    def describe(self) -> str:
+        return "Keep errors."
+
+    def __init__(self) -> None:
+        self.caught_exception = None
+
+
+class SlottedKeeper:
+    __slots__ = ("caught_exception",)
+
+    caught_exception: Exception | None
+
+
+class Proxy:
+    def __init__(self, target: object) -> None:
+        self.target = target
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        return getattr(self.target, name)
+
+
+class TestConformsTo:
+    @pytest.mark.parametrize(
+        ("item", "protocol"),
+        [
+            (CountTheCandles(), Answerable),
+            (CountTheCandles(), Performable),
+            (BakeTheCake(), Performable),
+            (BakeTheCake(), Answerable),
+            (KeepsErrors(), ErrorKeeper),
+            (KeepsErrors(), ErrorQuestion),
+            (CountTheCandles(), ErrorKeeper),
+            (Proxy(BakeTheCake()), Performable),
+            (Proxy(BakeTheCake()), Answerable),
+            (mock.Mock(), Performable),
+            (mock.create_autospec(CountTheCandles, instance=True), Performable),
+            ("a value", Answerable),
+            (None, Performable),
+        ],
+    )
+    def test_agrees_with_isinstance(self, item: object, protocol: type) -> None:
+        expected = isinstance(item, protocol)
+
+        assert conforms_to(item, protocol) is expected
+        # the second time, the class's members are remembered.
+        assert conforms_to(item, protocol) is expected
+
+    def test_members_set_on_the_instance(self) -> None:
+        keeper = SlottedKeeper()
+
+        assert not conforms_to(keeper, ErrorKeeper)  # type: ignore[type-abstract]
+
+        keeper.caught_exception = None
+
+        assert conforms_to(keeper, ErrorKeeper)
+
+    def test_methods_added_to_the_instance(self) -> None:
+        cake = BakeTheCake()
+        assert not conforms_to(cake, Answerable)  # type: ignore[type-abstract]
+
+        cake.answered_by = lambda _: "chocolate"  # type: ignore[attr-defined]
+
+        assert conforms_to(cake, Answerable)  # type: ignore[type-abstract]
+        assert not conforms_to(BakeTheCake(), Answerable)  # type: ignore[type-abstract]
+
+    def test_class_members_are_looked_up_once(self) -> None:
+        forget_conformance()
+        candles = CountTheCandles()
+
+        with mock.patch(
+            "screenpy.protocols._unprovided_members",
+            wraps=protocols._unprovided_members,
+        ) as mocked_unprovided_members:
+            conforms_to(candles, Answerable)  # type: ignore[type-abstract]
+            conforms_to(candles, Answerable)  # type: ignore[type-abstract]
+            conforms_to(CountTheCandles(), Answerable)  # type: ignore[type-abstract]
+
+        mocked_unprovided_members.assert_called_once_with(CountTheCandles, Answerable)
+
+    def test_sealed_classes_never_conform(self) -> None:
+        assert _unprovided_members(str, Performable) is None
+        assert _unprovided_members(SlottedKeeper, Performable) == ("perform_as",)
+
+    def test_forget_conformance(self) -> None:
+        class Temporary:
+            def perform_as(self, _: Actor) -> None:
+                pass
+
+        assert conforms_to(Temporary(), Performable)  # type: ignore[type-abstract]
+
+        del Temporary.perform_as
+        forget_conformance()
+
+        assert not conforms_to(Temporary(), Performable)  # type: ignore[type-abstract]
+
+    def test_classes_are_not_kept_alive(self) -> None:
+        class Temporary:
+            pass
+
+        conforms_to(Temporary(), Performable)  # type: ignore[type-abstract]
+        temporary = weakref.ref(Temporary)
+        del Temporary
+        gc.collect()
+
+        assert temporary() is None
+        assert all(cls.__name__ != "Temporary" for cls in _unprovided)
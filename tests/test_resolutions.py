@@ -1,22 +1,34 @@
 from __future__ import annotations
 
+import gc
+import logging
+import re
+import weakref
+from array import array
 from itertools import chain
+from typing import TYPE_CHECKING
 from unittest import mock
 
 import pytest
+from hamcrest import assert_that, greater_than
+from hamcrest.core.string_description import StringDescription
 
 from screenpy import (
+    AcrossPages,
     BaseResolution,
     ContainsItemMatching,
+    ContainsItemsMatching,
     ContainsTheEntry,
     ContainsTheItem,
     ContainsTheKey,
     ContainsTheText,
     ContainsTheValue,
+    ContainsTheValues,
     DoesNot,
     EndsWith,
     Equal,
     EqualTo,
+    EveryNumber,
     HasLength,
     IsCloseTo,
     IsEmpty,
@@ -31,9 +43,87 @@ from screenpy import (
     ReadsExactly,
     StartsWith,
 )
+from screenpy.exceptions import UnableToFormResolution
 from screenpy.resolutions.base_resolution import BaseMatcher
+from screenpy.resolutions.custom_matchers.is_in_bounds import _parse_bounding_string
 from screenpy.speech_tools import get_additive_description
 
+if TYPE_CHECKING:
+    from typing import Generator, Iterable, Iterator, TypeVar
+
+    from pytest_mock import MockerFixture
+
+    T = TypeVar("T")
+
+INF = float("inf")
+NAN = float("nan")
+
+
+def stream(elements: Iterable[T], looked_at: list[T]) -> Iterator[T]:
+    """Give the elements one at a time, noting each one as it is looked at."""
+    for element in elements:
+        looked_at.append(element)
+        yield element
+
+
+class TestAcrossPages:
+    def test_can_be_instantiated(self) -> None:
+        ap = AcrossPages(HasLength(3))
+
+        assert isinstance(ap, AcrossPages)
+
+    def test_the_test(self) -> None:
+        ap = AcrossPages(HasLength(3)).resolve()
+
+        assert ap.matches([[1, 2], [3]])
+        assert ap.matches(iter([[1], [], [2, 3]]))
+        assert not ap.matches([[1, 2], [3, 4]])
+        assert not ap.matches(None)  # type: ignore[arg-type]
+
+    def test_fetches_pages_only_as_needed(self) -> None:
+        fetched: list[list[int]] = []
+        pages = stream([[1, 2], [3, 4], [5, 6]], fetched)
+
+        assert AcrossPages(ContainsTheItem(3)).resolve().matches(pages)
+        assert fetched == [[1, 2], [3, 4]]
+
+    def test_mismatch(self) -> None:
+        pages = stream([["Spam"], ["Eggs"]], [])
+
+        with pytest.raises(AssertionError) as actual_exception:
+            assert_that(pages, AcrossPages(ContainsTheItem("Lobster")).resolve())
+
+        assert "was missing 'Lobster'" in str(actual_exception.value)
+
+    @pytest.mark.parametrize("expected", [3, 7])
+    def test_pages_are_not_kept(self, expected: int) -> None:
+        ap_matcher = AcrossPages(ContainsTheItem(expected)).resolve()
+        pages = stream([[1, 2], [3, 4]], [])
+        kept = weakref.ref(pages)
+
+        ap_matcher.matches(pages)
+        del pages
+        gc.collect()
+
+        assert kept() is None
+
+    def test_repeated_match_of_used_up_pages(self) -> None:
+        ap_matcher = AcrossPages(ContainsTheItem(3)).resolve()
+        pages = stream([[1, 2], [3, 4]], [])
+        described = StringDescription()
+
+        assert ap_matcher.matches(pages)
+        assert ap_matcher.matches(pages)
+        assert not ap_matcher.matches(pages)
+        ap_matcher.describe_mismatch(pages, described)
+
+        assert str(described) == "was missing <3>"
+
+    def test_description(self) -> None:
+        ap = AcrossPages(HasLength(3))
+
+        assert ap.describe() == "Across the pages, 3 items long."
+
 
 class TestBaseResolution:
     def test_subclasses_deprecated(self) -> None:
@@ -140,6 +230,86 @@ class TestContainsItemMatching:
         expected_description = 'A sequence with an item matching the pattern r".*".'
         assert cim.describe() == expected_description
 
+    def test_generator_mismatch(self) -> None:
+        cim = ContainsItemsMatching(r"^Spam", r"^Lobster").resolve()
+        menu = stream(["Eggs", "Spam", "Bacon"], [])
+        described = StringDescription()
+
+        assert not cim.matches(menu)
+        cim.describe_mismatch(menu, described)
+
+        assert str(described) == (
+            'did not contain items matching r"^Lobster"'
+            ' (but matched r"^Spam" at index 1)'
+        )
+
+    def test_compiles_the_pattern_once(self, mocker: MockerFixture) -> None:
+        cim = ContainsItemMatching(r"^Spam").resolve()
+        mocked_match = mocker.patch("re.match")
+
+        assert cim.matches(["Eggs", "Spam"])
+        mocked_match.assert_not_called()
+
+    def test_accepts_compiled_patterns(self) -> None:
+        cim = ContainsItemMatching(re.compile(r"^spam", re.IGNORECASE))
+
+        assert cim.resolve().matches(["SPAM"])
+        assert (
+            cim.describe() == 'A sequence with an item matching the pattern r"^spam".'
+        )
+
+    def test_many_patterns(self) -> None:
+        cim = ContainsItemsMatching(r"^Spam", r".*[Ee]ggs", r"\w*(\w)\1").resolve()
+
+        assert cim.matches(["Spam and eggs", "Lobster", "Boo"])
+        assert cim.matches(["Eggs", "Spam"])
+        assert not cim.matches(["Spam", "Bacon"])
+        assert not cim.matches(None)  # type: ignore[arg-type]
+
+    def test_many_patterns_with_flags(self) -> None:
+        cim = ContainsItemsMatching(re.compile("^spam", re.IGNORECASE), "^Eggs")
+
+        assert cim.resolve().matches(["Eggs", "SPAM"])
+
+    def test_patterns_which_cannot_be_combined(self) -> None:
+        cim = ContainsItemsMatching(r"(?P<food>Spam)", r"(?P<food>Eggs)")
+
+        assert cim.resolve().matches(["Eggs", "Spam"])
+
+    def test_looks_through_the_sequence_once(self) -> None:
+        looked_at = []
+
+        def menu() -> Generator[str, None, None]:
+            for item in ["Spam", "Eggs", "Bacon", "Sausage"]:
+                looked_at.append(item)
+                yield item
+
+        assert ContainsItemsMatching("^Spam", "^Eggs").resolve().matches(menu())
+        assert looked_at == ["Spam", "Eggs"]
+
+    def test_mismatch_says_where_patterns_matched(self) -> None:
+        cim = ContainsItemsMatching(r"^Spam", r"[Ee]ggs", r"^Lobster").resolve()
+        described = StringDescription()
+
+        cim.describe_mismatch(["Bacon", "Eggs", "Spam"], described)
+
+        assert str(described) == (
+            'did not contain items matching r"^Lobster"'
+            ' (but matched r"^Spam" at index 2, r"[Ee]ggs" at index 1)'
+        )
+
+    def test_description_of_many_patterns(self) -> None:
+        cim = ContainsItemsMatching(r"^Spam", r"[Ee]ggs")
+
+        assert cim.describe() == (
+            "A sequence with an item matching each of the patterns"
+            ' r"^Spam", r"[Ee]ggs".'
+        )
+
+    def test_needs_a_pattern(self) -> None:
+        with pytest.raises(UnableToFormResolution):
+            ContainsItemMatching()
+
 
 class TestContainsTheEntry:
     def test_can_be_instantiated(self) -> None:
@@ -196,6 +366,27 @@ class TestContainsTheItem:
 
         assert isinstance(cti, ContainsTheItem)
 
+    def test_item_is_still_available(self) -> None:
+        cti = ContainsTheItem(1)
+        ctis = ContainsTheItem(1, 2)
+
+        assert cti.item == 1
+        assert ctis.item == (1, 2)
+
+        cti.item = 3
+
+        assert cti.items == (3,)
+
+    def test_setting_the_item_after_resolving(self) -> None:
+        cti = ContainsTheItem(1)
+        cti.resolve()
+
+        cti.item = 2
+
+        assert cti.items == (2,)
+        assert cti.resolve().matches([2])
+        assert not cti.resolve().matches([1])
+
     def test_the_test(self) -> None:
         """Matches lists containing the item"""
         cti_matcher = ContainsTheItem(1).resolve()
@@ -211,6 +402,96 @@ class TestContainsTheItem:
         cti = ContainsTheItem(arg)
         assert cti.describe() == expected
 
+    def test_many_items(self) -> None:
+        cti_matcher = ContainsTheItem(1, 5, 9).resolve()
+
+        assert cti_matcher.matches(range(10))
+        assert cti_matcher.matches({9, 5, 1})
+        assert cti_matcher.matches({1: "a", 5: "b", 9: "c"})
+        assert not cti_matcher.matches([1, 5])
+        assert not cti_matcher.matches(None)  # type: ignore[arg-type]
+
+    def test_unhashable_items_and_matchers(self) -> None:
+        cti_matcher = ContainsTheItem([1], greater_than(8), "a").resolve()
+
+        assert cti_matcher.matches([[1], "a", 9])
+        assert cti_matcher.matches(["a", {"unhashable"}, 9, [1]])
+        assert not cti_matcher.matches([[1], "a", 3])
+
+    def test_looks_at_each_element_once(self) -> None:
+        looked_at = []
+
+        def elements() -> Generator[int, None, None]:
+            for element in range(100):
+                looked_at.append(element)
+                yield element
+
+        assert ContainsTheItem(*range(10)).resolve().matches(elements())
+        assert looked_at == list(range(10))
+
+    def test_mismatch_lists_only_the_missing_items(self) -> None:
+        cti_matcher = ContainsTheItem(1, 5, 9).resolve()
+        one_item_matcher = ContainsTheItem(5).resolve()
+        described, one_item_described = StringDescription(), StringDescription()
+
+        cti_matcher.describe_mismatch(range(6), described)
+        one_item_matcher.describe_mismatch(range(4), one_item_described)
+
+        assert str(described) == "was missing 1 of the 3 items: <9>"
+        assert str(one_item_described) == "was missing <5>"
+
+    def test_description_of_many_items(self) -> None:
+        cti = ContainsTheItem(1, "1")
+
+        assert cti.describe() == "A sequence containing <1>, '1'."
+        assert str(StringDescription().append_description_of(cti.resolve())) == (
+            "a sequence containing <1>, '1'"
+        )
+
+    def test_needs_an_item(self) -> None:
+        with pytest.raises(UnableToFormResolution):
+            ContainsTheItem()
+
+    def test_generator_mismatch(self) -> None:
+        cti_matcher = ContainsTheItem(1, 5, 9).resolve()
+        looked_at: list[int] = []
+        items = stream(range(6), looked_at)
+        described = StringDescription()
+
+        assert not cti_matcher.matches(items)
+        assert not cti_matcher.matches(items)
+        cti_matcher.describe_mismatch(items, described)
+
+        assert str(described) == "was missing 1 of the 3 items: <9>"
+        assert looked_at == list(range(6))
+
+    def test_iterators_are_not_kept(self) -> None:
+        cti_matcher = ContainsTheItem(1, 5, 9).resolve()
+        missing = stream(range(6), [])
+        found = stream(range(10), [])
+        kept = weakref.ref(missing)
+
+        assert not cti_matcher.matches(missing)
+        cti_matcher.describe_mismatch(missing, StringDescription())
+        assert cti_matcher.matches(found)
+        assert cti_matcher.matches(found)
+        del missing
+        gc.collect()
+
+        assert kept() is None
+        assert cti_matcher._remembered is None  # type: ignore[attr-defined]
+
+    def test_iterators_without_weak_references(self) -> None:
+        cti_matcher = ContainsTheItem(1, 5, 9).resolve()
+        items = iter(range(6))
+        described = StringDescription()
+
+        assert not cti_matcher.matches(items)
+        cti_matcher.describe_mismatch(items, described)
+
+        assert str(described) == "was missing 1 of the 3 items: <9>"
+        assert cti_matcher._remembered is None  # type: ignore[attr-defined]
+
 
 class TestContainsTheKey:
     def test_can_be_instantiated(self) -> None:
@@ -265,6 +546,27 @@ class TestContainsTheValue:
 
         assert isinstance(ctv, ContainsTheValue)
 
+    def test_value_is_still_available(self) -> None:
+        ctv = ContainsTheValue("value")
+        ctvs = ContainsTheValue("value", "Hamlet")
+
+        assert ctv.value == "value"
+        assert ctvs.value == ("value", "Hamlet")
+
+        ctv.value = "Ophelia"
+
+        assert ctv.values == ("Ophelia",)
+
+    def test_setting_the_value_after_resolving(self) -> None:
+        ctv = ContainsTheValue("Hamlet")
+        ctv.resolve()
+
+        ctv.value = "Ophelia"
+
+        assert ctv.values == ("Ophelia",)
+        assert ctv.resolve().matches({"cast": "Ophelia"})
+        assert not ctv.resolve().matches({"play": "Hamlet"})
+
     def test_the_test(self) -> None:
         """Matches dictionaries which contain the value"""
         ctv = ContainsTheValue("value").resolve()
@@ -281,6 +583,28 @@ class TestContainsTheValue:
         ctv = ContainsTheValue(arg)
         assert ctv.describe() == expected
 
+    def test_many_values(self) -> None:
+        ctv = ContainsTheValues("Hamlet", ["Ophelia"]).resolve()
+
+        assert ctv.matches({"play": "Hamlet", "cast": ["Ophelia"]})
+        assert not ctv.matches({"play": "Hamlet", "cast": ["Yorick"]})
+        assert not ctv.matches(["Hamlet", ["Ophelia"]])  # type: ignore[arg-type]
+
+    def test_mismatch_lists_only_the_missing_values(self) -> None:
+        ctv = ContainsTheValues("Hamlet", "Macbeth", "Lear").resolve()
+        described, not_a_mapping = StringDescription(), StringDescription()
+
+        ctv.describe_mismatch({"play": "Hamlet"}, described)
+        ctv.describe_mismatch(["Hamlet"], not_a_mapping)  # type: ignore[arg-type]
+
+        assert str(described) == "was missing 2 of the 3 values: 'Macbeth', 'Lear'"
+        assert str(not_a_mapping) == "was not a mapping"
+
+    def test_description_of_many_values(self) -> None:
+        ctv = ContainsTheValues(1, 2)
+
+        assert ctv.describe() == "Containing the values <1>, <2>."
+
 
 class TestEmpty:
     def test_can_be_instantiated(self) -> None:
@@ -300,6 +624,25 @@ class TestEmpty:
 
         assert e.describe() == "An empty collection."
 
+    def test_iterators(self) -> None:
+        e = IsEmpty().resolve()
+        looked_at: list[int] = []
+
+        assert e.matches(iter([]))
+        assert e.matches(element for element in range(0))
+        assert not e.matches(stream(range(5), looked_at))
+        assert looked_at == [0]
+
+    def test_iterator_mismatch(self) -> None:
+        e = IsEmpty().resolve()
+        rows = iter(["first row", "second row"])
+        described = StringDescription()
+
+        assert not e.matches(rows)
+        e.describe_mismatch(rows, described)
+
+        assert str(described) == "was not empty, starting with 'first row'"
+
 
 class TestEndsWith:
     def test_can_be_instantiated(self) -> None:
@@ -335,6 +678,45 @@ class TestHasLength:
         assert hl.matches([1, 2, 3, 4, 5])
         assert not hl.matches([1])
 
+    def test_iterators(self) -> None:
+        hl = HasLength(3).resolve()
+        looked_at: list[int] = []
+
+        assert hl.matches(iter([1, 2, 3]))
+        assert not hl.matches(element for element in [1])
+        assert not hl.matches(stream(range(100), looked_at))
+        assert looked_at == [0, 1, 2, 3]
+
+    @pytest.mark.parametrize(
+        ("elements", "expected"),
+        [
+            ([1], "had only 1 item: [1]"),
+            (range(2), "had only 2 items: [0, 1]"),
+            (range(5), "had more than 3 items: [0, 1, 2, 3]"),
+        ],
+    )
+    def test_iterator_mismatch(self, elements: Iterable[int], expected: str) -> None:
+        hl = HasLength(3).resolve()
+        items = iter(elements)
+        described = StringDescription()
+
+        assert not hl.matches(items)
+        hl.describe_mismatch(items, described)
+
+        assert str(described) == expected
+
+    def test_iterator_mismatch_is_capped(self) -> None:
+        hl = HasLength(20).resolve()
+        items = iter(range(50))
+        described = StringDescription()
+
+        assert not hl.matches(items)
+        hl.describe_mismatch(items, described)
+
+        assert str(described) == (
+            "had more than 20 items: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, ...]"
+        )
+
     def test_description(self) -> None:
         test_length = 5
 
@@ -622,3 +1004,229 @@ class TestStartsWith:
 
         expected_description = "Starting with 'It was the best of times,'."
         assert sw.describe() == expected_description
+
+
+class TestCacheMatcher:
+    @pytest.mark.parametrize(
+        "resolution",
+        [
+            ContainsItemMatching(r"^$"),
+            ContainsTheEntry(key="value"),
+            ContainsTheItem(1),
+            ContainsTheKey("key"),
+            ContainsTheText("text"),
+            ContainsTheValue("value"),
+            EndsWith("postfix"),
+            HasLength(1),
+            IsCloseTo(1),
+            IsEmpty(),
+            IsEqualTo(1),
+            IsGreaterThan(1),
+            IsGreaterThanOrEqualTo(1),
+            IsInRange("[1, 5)"),
+            IsLessThan(1),
+            IsLessThanOrEqualTo(1),
+            Matches(r"^$"),
+            ReadsExactly("text"),
+            StartsWith("prefix"),
+        ],
+    )
+    def test_builds_matcher_once(self, resolution: object) -> None:
+        assert resolution.resolve() is resolution.resolve()  # type: ignore[attr-defined]
+
+    def test_resolutions_keep_their_own_matchers(self) -> None:
+        assert IsEqualTo(1).resolve() is not IsEqualTo(1).resolve()
+
+    def test_narrates_every_resolve(self, caplog: pytest.LogCaptureFixture) -> None:
+        resolution = IsNot(IsEqualTo(1))
+        caplog.set_level(logging.INFO)
+
+        resolution.resolve()
+        resolution.resolve()
+
+        assert [r.msg for r in caplog.records] == [
+            "... hoping it's not equal to <1>.",
+            "    ... hoping it's equal to <1>.",
+            "        => <1>",
+            "    => not <1>",
+        ] * 2
+
+    def test_bounding_string_is_parsed_once(self) -> None:
+        _parse_bounding_string.cache_clear()
+
+        IsInRange("(1, 5]").resolve()
+        IsInRange("(1, 5]").resolve()
+
+        assert _parse_bounding_string.cache_info().hits == 1
+
+    @pytest.mark.parametrize(
+        ("bounding_string", "minorant", "majorant"),
+        [
+            ("1-5", 1, 5),
+            ("[1.5, 2.5]", 1.5, 2.5),
+            ("(-5, -1)", -5, -1),
+            ("[0, inf)", 0, INF),
+            ("[-Infinity, +inf]", -INF, INF),
+        ],
+    )
+    def test_bounding_strings(
+        self, bounding_string: str, minorant: float, majorant: float
+    ) -> None:
+        _, actual_minorant, actual_majorant, _ = _parse_bounding_string(bounding_string)
+
+        assert (actual_minorant, actual_majorant) == (minorant, majorant)
+
+
+class TestEveryNumber:
+    def test_can_be_instantiated(self) -> None:
+        en = EveryNumber(IsInRange(1, 5))
+
+        assert isinstance(en, EveryNumber)
+
+    def test_only_numeric_resolutions(self) -> None:
+        with pytest.raises(UnableToFormResolution) as actual_exception:
+            EveryNumber(ContainsTheText("1"))
+
+        assert "ContainsTheText" in str(actual_exception.value)
+
+    @pytest.mark.parametrize(
+        ("resolution", "passing", "failing"),
+        [
+            (IsInRange("[1, 5)"), [1, 4.5], [1, 5]),
+            (IsCloseTo(3, delta=1), [2, 4], [2, 4.5]),
+            (IsEqualTo(7), [7, 7.0], [7, 8]),
+            (IsGreaterThan(0), [0.1, 9], [0, 9]),
+            (IsGreaterThanOrEqualTo(0), [0, 9], [-1, 9]),
+            (IsLessThan(10), [-1, 9.9], [9, 10]),
+            (IsLessThanOrEqualTo(10), [-1, 10], [9, 11]),
+        ],
+    )
+    def test_the_test(
+        self, resolution: object, passing: list[float], failing: list[float]
+    ) -> None:
+        en = EveryNumber(resolution).resolve()  # type: ignore[arg-type]
+
+        assert en.matches(passing)
+        assert en.matches(array("d", passing))
+        assert en.matches(number for number in passing)
+        assert not en.matches(failing)
+        assert not en.matches(array("d", failing))
+
+    def test_empty_collection_passes(self) -> None:
+        assert EveryNumber(IsLessThan(0)).resolve().matches(array("i"))
+
+    def test_not_numbers(self) -> None:
+        en = EveryNumber(IsLessThan(0)).resolve()
+
+        assert not en.matches(["a", "b"])
+        assert not en.matches(None)
+
+    def test_only_numeric_bounds(self) -> None:
+        with pytest.raises(UnableToFormResolution) as actual_exception:
+            EveryNumber(IsEqualTo("Ni!"))
+
+        assert "IsEqualTo" in str(actual_exception.value)
+
+    @pytest.mark.parametrize(
+        "resolution",
+        [
+            IsEqualTo("5"),
+            IsEqualTo(True),
+            IsGreaterThan("5"),  # type: ignore[arg-type]
+            IsCloseTo(5, "1"),  # type: ignore[arg-type]
+        ],
+    )
+    def test_numbers_as_text_are_not_numbers(self, resolution: BaseResolution) -> None:
+        with pytest.raises(UnableToFormResolution):
+            EveryNumber(resolution)
+
+    @pytest.mark.parametrize(
+        "numbers",
+        [[NAN, 1, 2], [1, NAN, 2], [1, 2, NAN], [-INF, NAN, INF]],
+    )
+    def test_nan_never_matches(self, numbers: list[float]) -> None:
+        en = EveryNumber(IsInRange("[-inf, inf]")).resolve()
+        description = StringDescription()
+
+        en.describe_mismatch(numbers, description)
+
+        assert not en.matches(numbers)
+        assert not en.matches(array("d", numbers))
+        assert str(description).startswith("1 of 3 numbers were not")
+
+    def test_infinite_bounds(self) -> None:
+        en = EveryNumber(IsInRange("[0, inf)")).resolve()
+
+        assert en.matches([0, 1e308])
+        assert not en.matches([0, INF])
+        assert EveryNumber(IsInRange("[-inf, inf]")).resolve().matches([-INF, INF])
+
+    def test_mismatch_of_generator(self) -> None:
+        en = EveryNumber(IsLessThan(10)).resolve()
+        numbers = (number for number in [1, 20, 3, 30])
+        description = StringDescription()
+
+        assert not en.matches(numbers)
+        en.describe_mismatch(numbers, description)
+
+        assert str(description) == (
+            "2 of 4 numbers were not less than <10>, at indices [1, 3]"
+        )
+
+    def test_undescribed_mismatch_keeps_no_numbers(self) -> None:
+        en = EveryNumber(IsLessThan(10)).resolve()
+        numbers = (number for number in [1, 20, 3, 30])
+        kept = weakref.ref(numbers)
+
+        assert not en.matches(numbers)
+        del numbers
+        gc.collect()
+
+        assert kept() is None
+        assert en.matches([1, 2, 3])
+        assert en._remembered is None  # type: ignore[attr-defined]
+
+    def test_repeated_mismatch_of_used_up_generator(self) -> None:
+        en = EveryNumber(IsLessThan(10)).resolve()
+        numbers = (number for number in [1, 20, 3, 30])
+        description = StringDescription()
+
+        assert not en.matches(numbers)
+        assert not en.matches(numbers)
+        en.describe_mismatch(numbers, description)
+
+        assert str(description) == (
+            "2 of 4 numbers were not less than <10>, at indices [1, 3]"
+        )
+        assert en._remembered is None  # type: ignore[attr-defined]
+
+    def test_mismatch_reports_where(self) -> None:
+        numbers = array("i", range(100_000))
+        en = EveryNumber(IsLessThan(99_990)).resolve()
+        description = StringDescription()
+
+        en.describe_mismatch(numbers, description)
+
+        assert str(description) == (
+            "10 of 100000 numbers were not less than <99990>,"
+            " at indices [99990, 99991, 99992, 99993, 99994, ...]"
+        )
+
+    def test_numpy_arrays(self) -> None:
+        numpy = pytest.importorskip("numpy")
+        numbers = numpy.arange(12).reshape(3, 4)
+        en = EveryNumber(IsInRange("[0, 10]")).resolve()
+        description = StringDescription()
+
+        en.describe_mismatch(numbers, description)
+
+        assert EveryNumber(IsInRange(0, 11)).resolve().matches(numbers)
+        assert not en.matches(numbers)
+        assert str(description) == (
+            "1 of 12 numbers were not in the range '[0, 10]', at indices [11]"
+        )
+
+    def test_description(self) -> None:
+        en = EveryNumber(IsInRange(1, 5))
+
+        assert en.describe() == "Every number in the range '[1, 5]'."
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import gc
+import weakref
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import pytest
 
-from screenpy.speech_tools import get_additive_description, represent_prop
+from screenpy import speech_tools
+from screenpy.configuration import ScreenPySettings
+from screenpy.speech_tools import digest_of, get_additive_description, represent_prop
 
 if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
     from screenpy import Describable
 
 
@@ -60,6 +67,57 @@ class TestGetAdditiveDescription:
 
         assert description == "something indescribable"
 
+    def test_class_description_is_made_once(self, mocker: MockerFixture) -> None:
+        speech_tools._class_descriptions.pop(ThisIsADescribable, None)
+        capital_letter = mocker.patch.object(
+            speech_tools,
+            "CAPITAL_LETTER",
+            mock.Mock(wraps=speech_tools.CAPITAL_LETTER),
+        )
+
+        get_additive_description(ThisIsADescribable())
+        get_additive_description(ThisIsADescribable())
+
+        assert capital_letter.sub.call_count == 1
+        assert ThisIsADescribable in speech_tools._class_descriptions
+
+    def test_describe_is_still_called_every_time(self) -> None:
+        class Counting:
+            count = 0
+
+            def describe(self) -> str:
+                Counting.count += 1
+                return f"Described {Counting.count} times."
+
+        assert get_additive_description(Counting()) == "described 1 times"
+        assert get_additive_description(Counting()) == "described 2 times"
+
+    def test_instance_methods_are_honored(self) -> None:
+        value = ThisIsADescribable()
+        value.describe = lambda: "A describe of its own."  # type: ignore[attr-defined]
+
+        assert get_additive_description(value) == "a describe of its own"
+        assert get_additive_description(ThisIsADescribable()) == (
+            "this is a describable"
+        )
+
+    def test_mocks(self) -> None:
+        mock_describable = mock.Mock()
+        mock_describable.describe.return_value = "A mocked description."
+
+        assert get_additive_description(mock_describable) == "a mocked description"
+
+    def test_classes_are_not_kept_alive(self) -> None:
+        class Temporary:
+            pass
+
+        get_additive_description(Temporary())
+        temporary = weakref.ref(Temporary)
+        del Temporary
+        gc.collect()
+
+        assert temporary() is None
+
 
 class TestRepresentProp:
     def test_str(self) -> None:
@@ -71,3 +129,148 @@ class TestRepresentProp:
         val = 1234
 
         assert represent_prop(val) == "<1234>"
+
+    def test_small_collections_are_whole(self) -> None:
+        val = {"cast": ["Graham", "John"], "year": 1975}
+
+        assert represent_prop(val) == "<{'cast': ['Graham', 'John'], 'year': 1975}>"
+
+    def test_long_str(self) -> None:
+        val = "spam" * 1000
+
+        representation = represent_prop(val)
+
+        assert representation.startswith("'spamspam")
+        assert "..." in representation
+        assert representation.endswith(
+            f"mspam' [4000 characters, digest {digest_of(val)}]"
+        )
+        assert len(representation) < 1100
+
+    def test_long_bytes(self) -> None:
+        val = b"\x00" * 3000
+
+        representation = represent_prop(val)
+
+        assert representation.startswith("<b'\\x00")
+        assert representation.endswith(f" [3000 bytes, digest {digest_of(val)}]>")
+
+    def test_many_items(self) -> None:
+        val = list(range(1000))
+
+        representation = represent_prop(val)
+
+        assert representation == (
+            f"<{list(range(100))!r}"[:-1]
+            + f", ...] [1000 items, digest {digest_of(val)}]>"
+        )
+
+    def test_deep_collections(self) -> None:
+        val = [[[[[[[["deep"]]]]]]]]
+
+        representation = represent_prop(val)
+
+        assert representation.startswith("<[[[[[[[...]]]]]]] [1 item, digest ")
+
+    def test_large_subclasses(self) -> None:
+        class Rows(list):
+            pass
+
+        representation = represent_prop(Rows(range(1000)))
+
+        assert representation.startswith("<[0, 1, 2,")
+        assert "[1000 items, digest " in representation
+
+    def test_huge_values_stay_short(self) -> None:
+        val = [{"id": i, "tags": ["spam"] * 100} for i in range(100_000)]
+
+        representation = represent_prop(val)
+
+        assert len(representation) < 2000
+        assert ", ...]}, ...] [100000 items, digest " in representation
+
+    def test_long_str_of_other_objects(self) -> None:
+        class Report:
+            def __str__(self) -> str:
+                return "row\n" * 1000
+
+        representation = represent_prop(Report())
+
+        assert representation.startswith("<row\nrow\n")
+        assert "..." in representation
+        assert representation.endswith(
+            f"[4000 characters, digest {digest_of(str(Report()))}]>"
+        )
+        assert len(representation) < 1100
+
+    def test_strs_of_other_objects_are_not_wrapped_twice(self) -> None:
+        class Report:
+            def __str__(self) -> str:
+                return "<Report>"
+
+        assert represent_prop(Report()) == "<Report>"
+
+    @pytest.mark.parametrize(
+        ("length", "abridged"), [(7, False), (8, False), (9, True), (10, True)]
+    )
+    def test_strs_at_the_limit(
+        self, mocker: MockerFixture, length: int, abridged: bool
+    ) -> None:
+        mocker.patch(
+            "screenpy.speech_tools.settings",
+            ScreenPySettings(REPRESENTATION_LENGTH_LIMIT=10),
+        )
+        val = "s" * length
+
+        representation = represent_prop(val)
+
+        if abridged:
+            assert representation.startswith("'ss...")
+            assert representation.endswith(
+                f" [{length} characters, digest {digest_of(val)}]"
+            )
+        else:
+            assert representation == repr(val)
+
+    def test_limits_come_from_settings(self, mocker: MockerFixture) -> None:
+        mocker.patch(
+            "screenpy.speech_tools.settings",
+            ScreenPySettings(
+                REPRESENTATION_LENGTH_LIMIT=10,
+                REPRESENTATION_ITEM_LIMIT=2,
+                REPRESENTATION_DEPTH_LIMIT=1,
+            ),
+        )
+
+        assert represent_prop([1, 2, 3]).startswith("<[1, 2, ...] [3 items, ")
+        assert represent_prop([[1]]).startswith("<[[...]] [1 item, ")
+        assert represent_prop("spam and eggs").startswith("'sp...ggs' [13 characters")
+
+
+class TestDigestOf:
+    def test_tells_values_apart(self) -> None:
+        assert digest_of([1, 2, 3]) == digest_of([1, 2, 3])
+        assert digest_of([1, 2, 3]) != digest_of([1, 2, 4])
+        assert digest_of("spam") != digest_of(["spam"])
+        assert digest_of({"a": 1}) != digest_of({"a": 2})
+
+    def test_only_pickles_built_in_values(self) -> None:
+        pickled = []
+
+        class Spam:
+            def __reduce__(self) -> tuple[type, tuple[()]]:
+                pickled.append(self)
+                return (Spam, ())
+
+            def __repr__(self) -> str:
+                return "Spam()"
+
+        assert digest_of([Spam()]) == digest_of([Spam()])
+        assert digest_of([Spam()]) != digest_of([1])
+        assert pickled == []
+
+    def test_self_containing_collections(self) -> None:
+        val: list[object] = [1]
+        val.append(val)
+
+        assert digest_of(val) == digest_of(val)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from unittest import mock
+
+from screenpy import RetryCollector
+from screenpy.telemetry import RetryCost, RetryRecord, RetryReport, Telemetry
+
+
+def make_record(
+    description: str = "do the thing",
+    elapsed: float = 1.0,
+    attempts: int = 2,
+    succeeded: bool = True,
+) -> RetryRecord:
+    return RetryRecord(
+        description=description,
+        succeeded=succeeded,
+        attempts=attempts,
+        elapsed=elapsed,
+        latencies=(0.1,) * attempts,
+        error_kinds=("AssertionError",) if attempts > 1 else (),
+    )
+
+
+class TestTelemetry:
+    def test_passes_records_to_every_collector(self) -> None:
+        collector1 = mock.Mock()
+        collector2 = mock.Mock()
+        telemetry = Telemetry([collector1, collector2])
+        record = make_record()
+
+        telemetry.collect(record)
+
+        collector1.collect.assert_called_once_with(record)
+        collector2.collect.assert_called_once_with(record)
+
+    def test_no_collectors(self) -> None:
+        telemetry = Telemetry()
+
+        telemetry.collect(make_record())
+
+        assert telemetry.collectors == []
+
+
+class TestRetryReport:
+    def test_implements_protocol(self) -> None:
+        assert isinstance(RetryReport(), RetryCollector)
+
+    def test_collects_records(self) -> None:
+        report = RetryReport()
+        record = make_record()
+
+        report.collect(record)
+
+        assert report.records == [record]
+
+    def test_clear(self) -> None:
+        report = RetryReport()
+        report.collect(make_record())
+
+        report.clear()
+
+        assert report.records == []
+
+    def test_costliest_combines_and_ranks(self) -> None:
+        report = RetryReport()
+        report.collect(make_record("see the banner", elapsed=1.0))
+        report.collect(make_record("click the button", elapsed=3.0, attempts=1))
+        report.collect(
+            make_record("see the banner", elapsed=4.0, attempts=5, succeeded=False)
+        )
+
+        assert report.costliest() == [
+            RetryCost("see the banner", 5.0, 2, 7, 1),
+            RetryCost("click the button", 3.0, 1, 1, 0),
+        ]
+
+    def test_costliest_limit(self) -> None:
+        report = RetryReport()
+        for number in range(5):
+            report.collect(make_record(f"wait #{number}", elapsed=number))
+
+        costliest = report.costliest(2)
+
+        assert [cost.description for cost in costliest] == ["wait #4", "wait #3"]
+
+    def test_report(self) -> None:
+        report = RetryReport()
+        report.collect(make_record("see the banner", elapsed=1.0))
+        report.collect(
+            make_record("see the banner", elapsed=4.0, attempts=5, succeeded=False)
+        )
+        report.collect(make_record("click the button", elapsed=0.5, attempts=1))
+
+        assert report.report() == (
+            "Retries that cost the most time:\n"
+            "  1. 5.00s over 2 performances (7 attempts, 1 failed): see the banner\n"
+            "  2. 0.50s over 1 performance (1 attempt): click the button"
+        )
+
+    def test_empty_report(self) -> None:
+        assert RetryReport().report() == "No retries were recorded."
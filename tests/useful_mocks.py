@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
 from unittest import mock
 
+from screenpy import beat
+
 from .unittest_protocols import Ability, Action, Question, Resolution
 
+if TYPE_CHECKING:
+    from typing import Sequence
+
+    from screenpy import Actor
+
 
 def get_mock_action_class() -> type:
     class FakeAction(Action):
@@ -64,3 +72,31 @@ def get_mock_ability_class() -> type:
             return mock.create_autospec(FakeAbility)
 
     return FakeAbility
+
+
+class FieldOf:
+    """A Question about one field of a resource, which can be batched.
+
+    Every request it makes for the resource is noted in ``requests``, as the
+    list of fields it asked for.
+    """
+
+    def __init__(self, field: str, resource: dict[str, object]) -> None:
+        self.field = field
+        self.resource = resource
+        self.requests: list[list[str]] = []
+
+    def answered_by(self, _: Actor) -> object:
+        self.requests.append([self.field])
+        return self.resource[self.field]
+
+    def batch_key(self) -> int:
+        return id(self.resource)
+
+    @beat("{} fetches the whole resource.")
+    def answered_by_all(self, _: Actor, questions: Sequence[FieldOf]) -> list[object]:
+        self.requests.append([question.field for question in questions])
+        return [self.resource[question.field] for question in questions]
+
+    def describe(self) -> str:
+        return f"The {self.field}."